@@ -0,0 +1,40 @@
+"""
+Beaver Behavior Optimizer (BBO) ile güneş paneli (tek diyot modeli) parametre kestirimi.
+
+Komut satırı: python -m bbo_pv {run,stats,compare,plot} ...
+Ağır modüller (numba çekirdekleri, pandas, matplotlib) sadece kullanıldıklarında yüklenir;
+aşağıdaki isimler de ilk erişimde içe aktarılır.
+"""
+
+import importlib
+
+__version__ = "0.1.0"
+
+# İsim -> tanımlandığı modül (tembel içe aktarma)
+_EXPORTS = {
+    "BBO": "bbo",
+    "PSO": "pso",
+    "GWO": "gwo",
+    "BaseOptimizer": "optimizer_base",
+    "SteadyStateBBO": "steady_state_bbo",
+    "IslandBBO": "island_bbo",
+    "StoppingCriteria": "termination",
+    "solar_pv_cost": "benchmark_functions",
+    "solar_pv_cost_batch": "benchmark_functions",
+    "SingleDiodeCost": "benchmark_functions",
+    "diode_current": "benchmark_functions",
+    "refine_population": "local_search",
+    "run_campaign": "run_scheduler",
+    "ResultsStore": "results_store",
+    "make_config": "config",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,261 @@
+import numpy as np
+from .optimizer_base import BaseOptimizer
+from . import kernels
+
+class BBO(BaseOptimizer):
+    """
+    Beaver Behavior Optimizer (BBO) - 2025
+    Based on the paper: "Beaver behavior optimizer: A novel metaheuristic algorithm..."
+    """
+    
+    # Checkpoint'e yazılan durum
+    _state_fields = ("population", "fitness", "fitness_low", "best_solution", "best_fitness")
+    
+    def __init__(self, objective_func, bounds, pop_size=30, max_iter=500, surrogate=None,
+                 architect_ratio=0.25, perturbation_scale=0.1, fidelity_margin=0.0, **kwargs):
+        """
+        Başlangıç parametrelerini ayarlar.
+        :param objective_func: Optimize edilecek maliyet fonksiyonu (Cost Function)
+        :param bounds: Değişkenlerin alt ve üst sınırları (lb, ub) -> [(min, max), (min, max)...]
+        :param pop_size: Kunduz popülasyon sayısı (Varsayılan: 30)
+        :param max_iter: Maksimum iterasyon sayısı (Varsayılan: 500)
+        :param surrogate: İsteğe bağlı vekil model (surrogate.KNNSurrogate). Verilirse ebeveyninden
+                          kesinlikle kötü olacağı tahmin edilen çocuklar değerlendirilmez.
+        :param architect_ratio: Keşif fazında Mimar olan en iyi kunduzların oranı (Makale: 0.25)
+        :param perturbation_scale: Arayıcı sıçramasının arama aralığına oranı (Varsayılan: 0.1 -> (ub - lb) / 10)
+        :param fidelity_margin: Çok sadakatli amaç fonksiyonlarında (func.low varsa) bir çocuk, düşük sadakatli
+                                tahmini ebeveyninin tahmininin (1 + fidelity_margin) katını aşmıyorsa
+                                tam sadakatle değerlendirilir; diğerleri elenir.
+        :param kwargs: Ortak seçenekler (vectorized, seed, rng, stopping, callbacks, verbose,
+                       checkpoint_path, checkpoint_every)
+                       -> bkz. optimizer_base.BaseOptimizer
+        """
+        super().__init__(objective_func, bounds, pop_size, max_iter, **kwargs)
+        
+        # Popülasyonu başlat (Eq. 1 & 2)
+        # Initialization of beaver population with random materials
+        self.population = self._initial_population()
+        self.fitness = np.full(self.pop_size, float('inf'))
+        self.fitness_low = np.full(self.pop_size, float('inf'))  # Düşük sadakatli tahminler
+        
+        # En iyi çözümü saklamak için değişkenler
+        self.best_solution = None
+        self.best_fitness = float('inf')
+        self.convergence_curve = [] # Yakınsama grafiği için kayıt
+        
+        self.surrogate = surrogate
+        self.architect_ratio = architect_ratio
+        self.perturbation_scale = perturbation_scale
+        self.fidelity_margin = fidelity_margin
+        if surrogate is not None and self.multifidelity:
+            raise ValueError("surrogate and multi-fidelity screening cannot be combined")
+
+    def initialize(self):
+        """
+        Sayaçları sıfırlar ve başlangıç popülasyonunu değerlendirir.
+        """
+        super().initialize()
+        
+        # İlk fitness hesaplaması (OBL seçiliyse karşıt noktalarla birlikte)
+        if self.initializer.opposition:
+            self.population, self.fitness = self._select_opposition(self.population)
+        else:
+            self.fitness = self._evaluate(self.population)
+        best_idx = np.argmin(self.fitness)
+        self.best_fitness = self.fitness[best_idx]
+        self.best_solution = self.population[best_idx].copy()
+        
+        if self.multifidelity:
+            self.fitness_low = self._evaluate_low(self.population)
+        
+        if self.surrogate is not None:
+            self.surrogate.reset(self.lb, self.ub)
+            self.surrogate.add(self.population, self.fitness)
+            self.surrogate.end_generation()
+
+    def _extra_state(self):
+        # Vekil model arşivi de checkpoint'e yazılır; devam eden koşu aynı atlama kararlarını verir
+        if self.surrogate is None:
+            return {}
+        return {f"surrogate_{key}": value for key, value in self.surrogate.get_state().items()}
+
+    def _restore_extra_state(self, data):
+        if self.surrogate is None:
+            return
+        keys = [name for name in data.files if name.startswith("surrogate_")]
+        if keys:
+            self.surrogate.set_state({name[len("surrogate_"):]: data[name] for name in keys})
+        else:
+            # Vekil modelsiz yazılmış checkpoint: arşiv geri yüklenen popülasyonla yeniden başlatılır
+            self.surrogate.reset(self.lb, self.ub)
+            self.surrogate.add(self.population, self.fitness)
+            self.surrogate.end_generation()
+
+    def _result(self):
+        return self.best_solution, self.best_fitness, self.convergence_curve
+
+    def step(self, t):
+        """
+        t. nesli (0 tabanlı) çalıştırır. Durulması gerekiyorsa True döner.
+        Nesiller parça parça da çalıştırılabilir (ör. ada modelinde göçler arasında).
+        """
+        # --- Dam-Phase Factor (Eq. 3) ---
+        # Zamanla 0'dan 1'e artan geçiş faktörü. 
+        # Exploration (Keşif) ve Exploitation (Sömürü) dengesini sağlar.
+        D = np.sin((np.pi * (t + 1)) / (2 * self.max_iter))
+        
+        # Random kontrol sayısı
+        r1 = self.rng.random()
+        
+        # Popülasyonu fitness değerine göre sırala (En iyi kunduzlar başa)
+        sorted_indices = np.argsort(self.fitness)
+        sorted_pop = self.population[sorted_indices]
+        
+        # --- Phase Selection ---
+        if r1 <= D:
+            phase = "exploitation"
+            new_population = self._exploitation(sorted_pop)
+        else:
+            phase = "exploration"
+            new_population = self._exploration(sorted_pop, t)
+
+        # --- Sınır Kontrolü ve Fitness Güncelleme ---
+        # 1. Sınır kontrolü (Clamping)
+        new_population = np.clip(new_population, self.lb, self.ub)
+        
+        # 2. Yeni konumların fitness değerlerini tek seferde hesapla
+        parent_fitness = self.fitness[sorted_indices]
+        if self.multifidelity:
+            new_fitness, new_fitness_low = self._evaluate_multifidelity(new_population, sorted_indices)
+        elif self.surrogate is None:
+            new_fitness = self._evaluate(new_population)
+        else:
+            new_fitness = self._evaluate_screened(new_population, parent_fitness)
+        
+        # 3. Greedy selection:
+        # new_population[i], sorted_pop[i]'nin (yani i. sıradaki en iyinin) çocuğudur.
+        # Bu yüzden kıyaslamayı orijinal indisteki "ebeveyn" (parent) ile yapıyoruz.
+        # sorted_indices bir permütasyon olduğu için güncellemeler birbirini ezmez.
+        improved = new_fitness < parent_fitness
+        parents = sorted_indices[improved]
+        self.fitness[parents] = new_fitness[improved]
+        self.population[parents] = new_population[improved]
+        if self.multifidelity:
+            self.fitness_low[parents] = new_fitness_low[improved]
+        
+        # Global en iyiyi kontrol et
+        best_idx = np.argmin(new_fitness)
+        if new_fitness[best_idx] < self.best_fitness:
+            self.best_fitness = new_fitness[best_idx]
+            self.best_solution = new_population[best_idx].copy()
+        
+        # Kayıt tut
+        self.convergence_curve.append(self.best_fitness)
+        
+        # Callback'ler (ilerleme çıktısı, telemetri) ve durma kriterleri
+        # (NFE bütçesi, hedef fitness, durağanlık, çeşitlilik)
+        return self._end_generation(t, self.best_fitness, self.population, phase, improved.mean())
+
+    def _evaluate_multifidelity(self, children, sorted_indices):
+        """
+        Çok sadakatli değerlendirme: önce tüm çocuklar ucuz tahminle puanlanır, sadece ebeveynini
+        geçebilecek olanlar tam sadakatle değerlendirilir. Elenenlerin fitness'ı inf kabul edilir;
+        böylece seçim ve raporlanan en iyi çözüm her zaman tam sadakatli değerlere dayanır.
+        :return: (tam sadakatli fitness (elenenler inf), düşük sadakatli tahminler)
+        """
+        fitness_low = self._evaluate_low(children)
+        promising = fitness_low <= self.fitness_low[sorted_indices] * (1 + self.fidelity_margin)
+        
+        new_fitness = np.full(len(children), np.inf)
+        if promising.any():
+            new_fitness[promising] = self._evaluate(children[promising])
+        return new_fitness, fitness_low
+
+    def _evaluate_screened(self, children, parent_fitness):
+        """
+        Vekil model ile ön eleme: atlanan çocukların fitness'ı inf kabul edilir
+        (greedy selection'da asla kabul edilmezler).
+        """
+        evaluate, audit = self.surrogate.screen(children, parent_fitness, self.rng)
+        
+        new_fitness = np.full(len(children), np.inf)
+        if evaluate.any():
+            new_fitness[evaluate] = self._evaluate(children[evaluate])
+            self.surrogate.add(children[evaluate], new_fitness[evaluate])
+        
+        if audit.any():
+            self.surrogate.record_audit(new_fitness[audit], parent_fitness[audit])
+        
+        self.surrogate.end_generation()
+        return new_fitness
+
+    def _exploitation(self, sorted_pop):
+        """
+        EXPLOITATION PHASE (Dam Maintenance) [cite: 187-195]
+        Bu fazda tüm popülasyon "Architect" gibi davranır ve
+        en iyi çözüme (Lider Kunduz) yakınsamaya çalışır.
+        Tüm rastgele sayılar nesil başına tek seferde üretilir.
+        """
+        n = self.pop_size
+        
+        # Rastgele başka bir kunduz seç (k != i):
+        # [0, n-1) aralığından çekip i'ye eşit/büyük olanları bir kaydırmak
+        # reddetme döngüsüyle aynı düzgün dağılımı verir.
+        idx = np.arange(n)
+        k = self.rng.integers(0, n - 1, n)
+        k += k >= idx
+        
+        r7 = self.rng.random((n, 1))
+        r8 = self.rng.random((n, 1))
+        
+        # Eq. (6) - Baraj onarımı ve iyileştirme denklemi
+        # X_new = X_current + r7*(X_neighbor - X_current) + r8*(X_best - X_current)
+        if kernels.USE_NUMBA:
+            return kernels.bbo_exploitation_kernel(sorted_pop, k, r7[:, 0], r8[:, 0], self.best_solution)
+        return sorted_pop + \
+               r7 * (sorted_pop[k] - sorted_pop) + \
+               r8 * (self.best_solution - sorted_pop)
+
+    def _exploration(self, sorted_pop, t):
+        """
+        EXPLORATION PHASE (Material Gathering) [cite: 162-186]
+        Popülasyon Mimarlar (ilk satırlar) ve Arayıcılar olarak ikiye bölünür.
+        """
+        n = self.pop_size
+        
+        # Architects (Mimarlar) ve Prospectors (Arayıcılar) ayrımı
+        # Makaleye göre en iyi %25 Mimar olur [cite: 169] (architect_ratio)
+        num_architects = min(n, max(1, int(self.architect_ratio * n)))
+        architects = sorted_pop[:num_architects]
+        prospectors = sorted_pop[num_architects:]
+        num_prospectors = n - num_architects
+        
+        # 1. Architects Update (Eq. 4)
+        # Rastgele başka bir mimar seç; r2 < 0.5 ise komşudan öğren, yoksa yerinde kal
+        k_arch = self.rng.integers(0, num_architects, num_architects)
+        r2 = self.rng.random((num_architects, 1))
+        r3 = self.rng.random((num_architects, 1))
+        
+        # 2. Prospectors Update (Eq. 5)
+        # Rastgele bir mimar seç (Öğrenmek için)
+        k_pros = self.rng.integers(0, num_architects, num_prospectors)
+        r4 = self.rng.random((num_prospectors, 1))
+        r5 = self.rng.random((num_prospectors, 1))
+        # Gaussian random number (Mean=0, Var=1)
+        r6 = self.rng.standard_normal((num_prospectors, 1))
+        
+        # Levy Flight benzeri bir sıçrama terimi (Makaledeki cos terimi)
+        # perturbation = r6 * cos(pi*t / 2T) * (ub - lb) * perturbation_scale  (Varsayılan: / 10)
+        perturbation = r6 * np.cos((np.pi * (t + 1)) / (2 * self.max_iter)) * (self.ub - self.lb) * \
+                       self.perturbation_scale
+        
+        if kernels.USE_NUMBA:
+            return kernels.bbo_exploration_kernel(sorted_pop, num_architects, k_arch, ((r2 < 0.5) * r3)[:, 0],
+                                                  k_pros, ((r4 < 0.5) * r5)[:, 0], perturbation)
+        
+        new_architects = architects + (r2 < 0.5) * r3 * (architects[k_arch] - architects)
+        
+        learning_term = (r4 < 0.5) * r5 * (architects[k_pros] - prospectors)
+        new_prospectors = prospectors + learning_term + perturbation
+        
+        return np.vstack((new_architects, new_prospectors))
@@ -0,0 +1,315 @@
+import numpy as np
+import warnings
+from .objective import batch_objective
+from . import kernels
+
+# R.T.C. France Verileri (Sabit)
+V_exp = np.array([-0.2057, -0.1291, -0.0588, 0.0057, 0.0646, 0.1185, 0.1678, 0.2132, 0.2545, 0.2924, 0.3269, 0.3585, 0.3873, 0.4137, 0.4373, 0.4590, 0.4784, 0.4960, 0.5119, 0.5265, 0.5398, 0.5521, 0.5633, 0.5736, 0.5833, 0.5900])
+I_exp = np.array([0.7640, 0.7620, 0.7605, 0.7605, 0.7600, 0.7590, 0.7570, 0.7555, 0.7540, 0.7505, 0.7465, 0.7385, 0.7280, 0.7140, 0.6975, 0.6745, 0.6475, 0.6175, 0.5790, 0.5350, 0.4850, 0.4240, 0.3600, 0.2745, 0.1770, 0.0870])
+
+# Fiziksel sabitler ve hücre sıcaklığı
+k_B = 1.3806503e-23   # Boltzmann sabiti (J/K)
+q_e = 1.60217646e-19  # Elektron yükü (C)
+T_cell = 33 + 273.15  # R.T.C. France ölçüm sıcaklığı (K)
+
+# Desteklenen akım çözücüleri
+SOLVERS = ("newton", "lambertw")
+
+def solar_pv_cost(x, solver="newton"):
+    if solver != "newton":
+        return solar_pv_cost_batch(np.asarray(x, dtype=float)[None, :], solver)[0]
+
+    # Negatif değerleri engelle (Fiziksel İmkansızlık)
+    if np.any(x < 0):
+        return 1e10
+
+    I_ph, I_sd, R_s, R_sh, n = x
+    
+    # R_sh veya n çok küçükse patlamayı önle
+    if R_sh < 1e-5 or n < 0.1:
+        return 1e10
+
+    k = 1.3806503e-23
+    q = 1.60217646e-19
+    T = 33 + 273.15
+    VT = (n * k * T) / q
+
+    I_calc = np.zeros_like(V_exp)
+    
+    # Uyarıları gizle (Overflow uyarısı almamak için)
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore')
+        
+        for i in range(len(V_exp)):
+            V = V_exp[i]
+            I_est = I_ph 
+            
+            success = False
+            for _ in range(10): # İterasyonu 10'a çıkardık
+                try:
+                    # Üstel ifadenin patlamasını önle (Overflow Protection)
+                    exp_arg = (V + I_est * R_s) / VT
+                    if exp_arg > 100: # Eğer sayı çok büyürse
+                        exp_val = np.exp(100) * 1e5 # Yapay bir sınır koy
+                    else:
+                        exp_val = np.exp(exp_arg)
+
+                    f_val = I_ph - I_sd * (exp_val - 1) - (V + I_est * R_s) / R_sh - I_est
+                    df_val = -I_sd * (R_s / VT) * exp_val - (R_s / R_sh) - 1
+                    
+                    if abs(df_val) < 1e-10: # Türev sıfırsa dur
+                        break
+                        
+                    I_next = I_est - f_val / df_val
+                    
+                    if np.isnan(I_next) or np.isinf(I_next):
+                        break
+                        
+                    if abs(I_next - I_est) < 1e-6:
+                        I_est = I_next
+                        success = True
+                        break
+                    
+                    I_est = I_next
+                except:
+                    break
+            
+            # Eğer Newton yöntemi başarısız olursa, o çözüm kötüdür
+            if not success and (np.isnan(I_est) or np.isinf(I_est)):
+                return 1e10 # Cezalandır
+                
+            I_calc[i] = I_est
+
+    diff = I_calc - I_exp
+    rmse = np.sqrt(np.mean(diff**2))
+    
+    if np.isnan(rmse):
+        return 1e10
+        
+    return rmse
+
+def lambertw_log(log_x, max_iter=20):
+    """
+    Lambert W fonksiyonunun ana dalı (W0), argümanın logaritması üzerinden hesaplanır.
+    W(x) e^W(x) = x  <=>  W + ln(W) = ln(x)
+    exp(ln x) taşsa bile (ln x >> 700) sonuç kararlı şekilde bulunur.
+    :param log_x: ln(x) dizisi (x > 0)
+    :return: W(x) dizisi
+    """
+    L = np.asarray(log_x, dtype=float)
+
+    with np.errstate(all='ignore'):
+        # Başlangıç tahmini kökün altında seçilir; w + ln(w) konkav olduğu için
+        # Newton adımları buradan monoton ve karesel yakınsar.
+        x = np.exp(np.minimum(L, 1.0))
+        w = np.where(L > 1.0, L - np.log(np.maximum(L, 1.0)), x / (1.0 + x))
+
+        for _ in range(max_iter):
+            step = (w + np.log(w) - L) * w / (1.0 + w)
+            w = w - step
+            if not np.any(np.abs(step) > 1e-15 * np.maximum(w, 1e-300)):
+                break
+
+    # Çok küçük argümanlarda W(x) ~ x; -inf (x = 0) için W = 0
+    return np.where(L < -700, np.exp(np.minimum(L, -700)), w)
+
+
+def _split_params(X):
+    """
+    (pop, 5) parametre matrisini (pop, 1) sütunlara ayırır (I_ph, I_sd, R_s, R_sh, n).
+    """
+    return tuple(X[:, j:j + 1] for j in range(5))
+
+
+def _newton_current(X, V, T=T_cell, tol=1e-6, max_steps=10):
+    """
+    Tek diyot modelinde I(V)'yi tüm (aday x nokta) ızgarası için Newton ile çözer.
+    solar_pv_cost'taki skaler döngünün birebir vektörel karşılığıdır.
+    :param tol: Yakınsama toleransı (A)
+    :param max_steps: En fazla Newton adımı
+    :return: (I, success) -> (pop, len(V)) akım matrisi ve yakınsama maskesi
+    """
+    if kernels.USE_NUMBA:
+        # Derlenmiş skaler döngü: NumPy geçici dizileri olmadan aynı algoritma
+        return kernels.newton_current_kernel(np.ascontiguousarray(X), np.ascontiguousarray(V, dtype=float),
+                                             k_B, q_e, float(T), float(tol), int(max_steps))
+
+    I_ph, I_sd, R_s, R_sh, n = _split_params(X)
+    VT = (n * k_B * T) / q_e
+
+    # (pop, len(V)) Newton ızgarası: her eleman kendi yakınsama maskesine sahip
+    I_est = np.repeat(I_ph, len(V), axis=1)
+    active = np.isfinite(I_est)
+    success = np.zeros_like(active)
+
+    with np.errstate(all='ignore'):
+        for _ in range(max_steps):
+            if not active.any():
+                break
+
+            exp_arg = (V + I_est * R_s) / VT
+            exp_val = np.where(exp_arg > 100, np.exp(100) * 1e5, np.exp(np.minimum(exp_arg, 100)))
+            # NaN argümanlar skaler versiyondaki gibi NaN üretmeli
+            exp_val = np.where(np.isnan(exp_arg), np.nan, exp_val)
+
+            f_val = I_ph - I_sd * (exp_val - 1) - (V + I_est * R_s) / R_sh - I_est
+            df_val = -I_sd * (R_s / VT) * exp_val - (R_s / R_sh) - 1
+
+            # Türev sıfırsa o eleman durur
+            active &= ~(np.abs(df_val) < 1e-10)
+
+            I_next = I_est - f_val / df_val
+
+            # NaN/Inf üreten elemanlar son geçerli tahminde kalır
+            active &= np.isfinite(I_next)
+
+            converged = active & (np.abs(I_next - I_est) < tol)
+            success |= converged
+
+            I_est = np.where(active, I_next, I_est)
+            active &= ~converged
+
+    return I_est, success
+
+
+def _lambertw_current(X, V, T=T_cell):
+    """
+    Tek diyot modelinin Lambert W ile kapalı form (açık) çözümü:
+    I = (R_sh (I_ph + I_sd) - V) / (R_s + R_sh) - (a / R_s) W(theta)
+    theta = R_s R_sh I_sd / (a (R_s + R_sh)) * exp(R_sh (R_s (I_ph + I_sd) + V) / (a (R_s + R_sh)))
+    a = n k T / q. theta log-uzayında hesaplanır, böylece büyük üsler taşmaz.
+    :return: (I, success) -> success her zaman True (iterasyon/yakınsama sorunu yok)
+    """
+    I_ph, I_sd, R_s, R_sh, n = _split_params(X)
+    a = (n * k_B * T) / q_e
+
+    with np.errstate(all='ignore'):
+        R_sum = R_s + R_sh
+        log_theta = np.log(R_s * R_sh * I_sd / (a * R_sum)) + \
+                    R_sh * (R_s * (I_ph + I_sd) + V) / (a * R_sum)
+        I_calc = (R_sh * (I_ph + I_sd) - V) / R_sum - (a / R_s) * lambertw_log(log_theta)
+
+        # R_s = 0 özel durumu: denklem zaten açık formdadır
+        I_series_free = I_ph - I_sd * (np.exp(V / a) - 1) - V / R_sh
+        I_calc = np.where(R_s > 0, I_calc, I_series_free)
+
+    return I_calc, np.ones(I_calc.shape, dtype=bool)
+
+
+def diode_current(params, V=V_exp, solver="newton", T=T_cell):
+    """
+    Verilen parametre(ler) için tek diyot modeli akımını hesaplar.
+    :param params: [I_ph, I_sd, R_s, R_sh, n] vektörü veya (pop, 5) matris
+    :param V: Gerilim noktaları
+    :param solver: "newton" (iteratif) veya "lambertw" (kapalı form)
+    :return: params tek vektörse (len(V),), matrisse (pop, len(V)) akım dizisi
+    """
+    params = np.asarray(params, dtype=float)
+    X = np.atleast_2d(params)
+    if solver == "newton":
+        I_calc, _ = _newton_current(X, np.asarray(V, dtype=float), T)
+    elif solver == "lambertw":
+        I_calc, _ = _lambertw_current(X, np.asarray(V, dtype=float), T)
+    else:
+        raise ValueError(f"Unknown solver '{solver}', expected one of {SOLVERS}")
+    return I_calc[0] if params.ndim == 1 else I_calc
+
+
+@batch_objective
+def solar_pv_cost_batch(X, solver="newton", V=None, I=None, T=None, newton_tol=1e-6, newton_steps=10):
+    """
+    solar_pv_cost'un popülasyon tabanlı (vektörel) versiyonu.
+    :param X: (pop, 5) boyutlu aday matrisi -> her satır [I_ph, I_sd, R_s, R_sh, n]
+    :param solver: "newton" (skaler versiyonla aynı sonuç) veya "lambertw" (kapalı form)
+    :param V, I, T: Ölçülen eğri ve sıcaklık (K). Verilmezse R.T.C. France verisi kullanılır.
+    :param newton_tol, newton_steps: Newton toleransı ve adım sınırı (gevşetilirse daha ucuz, daha kaba)
+    :return: (pop,) boyutlu RMSE vektörü (geçersiz adaylar için 1e10)
+    """
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    V = V_exp if V is None else V
+    I = I_exp if I is None else I
+    T = T_cell if T is None else T
+    R_sh, n = X[:, 3], X[:, 4]
+
+    # Skaler versiyondaki ceza kuralları (satır bazında)
+    invalid = np.any(X < 0, axis=1) | (R_sh < 1e-5) | (n < 0.1)
+
+    if solver == "newton":
+        I_calc, success = _newton_current(X, V, T, newton_tol, newton_steps)
+    elif solver == "lambertw":
+        I_calc, success = _lambertw_current(X, V, T)
+    else:
+        raise ValueError(f"Unknown solver '{solver}', expected one of {SOLVERS}")
+
+    with np.errstate(all='ignore'):
+        # Newton başarısız ve tahmin geçersizse o aday cezalandırılır
+        failed = np.any(~success & ~np.isfinite(I_calc), axis=1)
+
+        diff = I_calc - I
+        rmse = np.sqrt(np.mean(diff**2, axis=1))
+
+    rmse[invalid | failed | np.isnan(rmse)] = 1e10
+    return rmse
+
+
+@batch_objective
+def solar_pv_cost_lambertw(X):
+    """
+    Lambert W çözücülü batch maliyet fonksiyonu (optimizatörlere doğrudan verilebilir).
+    """
+    return solar_pv_cost_batch(X, solver="lambertw")
+
+
+# Komut satırı --solver seçeneğine karşılık gelen amaç fonksiyonları. stats, compare ve plot
+# aynı fonksiyonu kullanır; böylece sonuç deposundaki koşular komutlar arasında paylaşılır.
+OBJECTIVES = {"newton": solar_pv_cost_batch, "lambertw": solar_pv_cost_lambertw}
+
+
+class SingleDiodeCost:
+    """
+    Tek bir ölçülmüş I-V eğrisi için batch maliyet fonksiyonu.
+    Modül seviyesindeki V_exp/I_exp yerine kendi verisini taşır; pickle edilebilir
+    olduğu için worker süreçlerine gönderilebilir.
+    """
+
+    vectorized = True
+
+    def __init__(self, V, I, T=T_cell, solver="newton"):
+        """
+        :param V: Ölçülen gerilim noktaları
+        :param I: Ölçülen akım noktaları
+        :param T: Hücre sıcaklığı (K)
+        :param solver: "newton" veya "lambertw"
+        """
+        self.V = np.asarray(V, dtype=float)
+        self.I = np.asarray(I, dtype=float)
+        self.T = float(T)
+        self.solver = solver
+
+    def __call__(self, X):
+        return solar_pv_cost_batch(X, self.solver, self.V, self.I, self.T)
+
+
+class SingleDiodeMultiFidelity(SingleDiodeCost):
+    """
+    Çok sadakatli tek diyot maliyeti.
+    Çağrıldığında (tam sadakat) tüm noktalarda normal RMSE'yi verir; low(X) ise
+    noktaların bir alt kümesinde ve gevşek Newton toleransıyla ucuz bir RMSE tahmini üretir.
+    Optimizatörler (BBO) bu tahminle ebeveynini geçemeyecek çocukları tam değerlendirmeden eler.
+    """
+
+    def __init__(self, V=V_exp, I=I_exp, T=T_cell, solver="newton", stride=3, low_tol=1e-4, low_steps=5):
+        """
+        :param stride: Düşük sadakatte her stride. nokta kullanılır (son nokta her zaman dahil)
+        :param low_tol: Düşük sadakat Newton toleransı
+        :param low_steps: Düşük sadakat Newton adım sınırı
+        """
+        super().__init__(V, I, T, solver)
+        subset = np.unique(np.append(np.arange(0, len(self.V), stride), len(self.V) - 1))
+        self.V_low = self.V[subset]
+        self.I_low = self.I[subset]
+        self.low_tol = low_tol
+        self.low_steps = low_steps
+
+    def low(self, X):
+        return solar_pv_cost_batch(X, self.solver, self.V_low, self.I_low, self.T, self.low_tol, self.low_steps)
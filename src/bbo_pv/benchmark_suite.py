@@ -0,0 +1,108 @@
+import numpy as np
+from .objective import batch_objective
+
+# Standart test fonksiyonları: hepsi (pop, dim) matris alır ve (pop,) fitness döndürür.
+# Hepsinin global minimumu 0'dır (kaydırılmış/döndürülmüş sürümlerde de).
+
+
+@batch_objective
+def sphere(X):
+    return np.sum(X * X, axis=1)
+
+
+@batch_objective
+def rastrigin(X):
+    return 10.0 * X.shape[1] + np.sum(X * X - 10.0 * np.cos(2 * np.pi * X), axis=1)
+
+
+@batch_objective
+def ackley(X):
+    dim = X.shape[1]
+    term1 = -20.0 * np.exp(-0.2 * np.sqrt(np.sum(X * X, axis=1) / dim))
+    term2 = -np.exp(np.sum(np.cos(2 * np.pi * X), axis=1) / dim)
+    return term1 + term2 + 20.0 + np.e
+
+
+@batch_objective
+def rosenbrock(X):
+    # Minimum x = (1, ..., 1)
+    return np.sum(100.0 * (X[:, 1:] - X[:, :-1] ** 2) ** 2 + (X[:, :-1] - 1) ** 2, axis=1)
+
+
+@batch_objective
+def griewank(X):
+    i = np.sqrt(np.arange(1, X.shape[1] + 1))
+    return 1.0 + np.sum(X * X, axis=1) / 4000.0 - np.prod(np.cos(X / i), axis=1)
+
+
+# {isim: (fonksiyon, (alt sınır, üst sınır))} -> her boyut için aynı aralık
+FUNCTIONS = {
+    "sphere": (sphere, (-100.0, 100.0)),
+    "rastrigin": (rastrigin, (-5.12, 5.12)),
+    "ackley": (ackley, (-32.768, 32.768)),
+    "rosenbrock": (rosenbrock, (-30.0, 30.0)),
+    "griewank": (griewank, (-600.0, 600.0)),
+}
+
+
+def random_rotation(dim, rng):
+    """
+    Düzgün dağılımlı rastgele ortogonal matris (Gauss matrisinin QR ayrışımı).
+    """
+    Q, R = np.linalg.qr(rng.standard_normal((dim, dim)))
+    return Q * np.sign(np.diag(R))
+
+
+class ShiftedRotated:
+    """
+    Bir test fonksiyonunun kaydırılmış (ve isteğe bağlı döndürülmüş) sürümü:
+    f(R (x - o)). Optimum arama uzayının ortasından rastgele bir o noktasına taşınır,
+    döndürme ise değişkenler arası ayrıştırılabilirliği bozar.
+    Pickle edilebilir, bu yüzden worker süreçlerine gönderilebilir.
+    """
+
+    vectorized = True
+
+    def __init__(self, name, dim, rotate=True, seed=0, shift_fraction=0.8):
+        """
+        :param name: FUNCTIONS içindeki temel fonksiyon adı
+        :param dim: Problem boyutu
+        :param rotate: True ise rastgele ortogonal döndürme uygulanır
+        :param seed: Kaydırma/döndürme tohumu
+        :param shift_fraction: Optimum, aralığın bu oranı içinde kalacak şekilde kaydırılır
+        """
+        func, (low, high) = FUNCTIONS[name]
+        rng = np.random.default_rng(seed)
+        self.name = name
+        self.func = func
+        self.bounds = (low, high)
+        self.shift = rng.uniform(low, high, dim) * shift_fraction
+        # Rosenbrock'un optimumu 1'de olduğu için kaydırma o noktayı o'ya taşır
+        self.offset = 1.0 if name == "rosenbrock" else 0.0
+        self.rotation = random_rotation(dim, rng) if rotate else None
+        self.__name__ = f"{'shifted_rotated' if rotate else 'shifted'}_{name}"
+
+    def __call__(self, X):
+        Z = np.asarray(X, dtype=float) - self.shift
+        if self.rotation is not None:
+            Z = Z @ self.rotation.T
+        return self.func(Z + self.offset)
+
+
+def get_function(name, dim, seed=0):
+    """
+    İsimden (objective, bounds) çifti üretir.
+    "sphere" gibi temel adlar, "shifted_<ad>" ve "shifted_rotated_<ad>" desteklenir.
+    :return: (batch fonksiyon, [(alt, üst)] * dim)
+    """
+    if name.startswith("shifted_rotated_"):
+        func = ShiftedRotated(name[len("shifted_rotated_"):], dim, rotate=True, seed=seed)
+        low, high = func.bounds
+    elif name.startswith("shifted_"):
+        func = ShiftedRotated(name[len("shifted_"):], dim, rotate=False, seed=seed)
+        low, high = func.bounds
+    elif name in FUNCTIONS:
+        func, (low, high) = FUNCTIONS[name]
+    else:
+        raise ValueError(f"Unknown benchmark function '{name}'")
+    return func, [(low, high)] * dim
@@ -0,0 +1,87 @@
+import numpy as np
+
+# Faz kodları (GenerationRecorder.phase dizisi için)
+PHASE_CODES = {None: 0, "exploitation": 1, "exploration": 2}
+
+
+class ProgressPrinter:
+    """
+    Her `every` nesilde bir en iyi fitness değerini yazdırır (eski sabit print davranışı).
+    """
+
+    def __init__(self, every=50):
+        self.every = every
+
+    def __call__(self, optimizer, info):
+        if info["iteration"] % self.every == 0:
+            print(f"Iter: {info['iteration']}, Best Fitness: {info['best_fitness']:.6f}")
+
+
+class GenerationRecorder:
+    """
+    Nesil başına telemetriyi önceden ayrılmış dizilerde tutan düşük maliyetli kayıtçı.
+    Kayıt sayısı optimizatörün max_iter değeri kadardır (capacity verilmezse).
+    """
+
+    FIELDS = ("best_fitness", "nfe", "eval_time", "op_time", "acceptance_rate", "diversity")
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.size = 0
+        self._arrays = None
+
+    def _allocate(self, capacity):
+        self.capacity = capacity
+        self._arrays = {name: np.full(capacity, np.nan) for name in self.FIELDS}
+        self._arrays["nfe"] = np.zeros(capacity, dtype=np.int64)
+        self._arrays["phase"] = np.zeros(capacity, dtype=np.int8)
+
+    def __call__(self, optimizer, info):
+        if self._arrays is None:
+            self._allocate(self.capacity or optimizer.max_iter)
+        if self.size >= self.capacity:
+            return
+
+        i = self.size
+        a = self._arrays
+        a["best_fitness"][i] = info["best_fitness"]
+        a["nfe"][i] = info["nfe"]
+        a["eval_time"][i] = info["eval_time"]
+        a["op_time"][i] = info["op_time"]
+        a["phase"][i] = PHASE_CODES.get(info["phase"], 0)
+        if info["acceptance_rate"] is not None:
+            a["acceptance_rate"][i] = info["acceptance_rate"]
+        if info["diversity"] is not None:
+            a["diversity"][i] = info["diversity"]
+        self.size += 1
+
+    def __getattr__(self, name):
+        # recorder.best_fitness, recorder.eval_time ... -> kaydedilen kısım
+        arrays = self.__dict__.get("_arrays")
+        if arrays is not None and name in arrays:
+            return arrays[name][:self.size]
+        raise AttributeError(name)
+
+    def as_dict(self):
+        if self._arrays is None:
+            return {}
+        return {name: values[:self.size] for name, values in self._arrays.items()}
+
+    def summary(self):
+        """
+        Toplam süre dağılımı ve faz sayıları.
+        """
+        data = self.as_dict()
+        if not data:
+            return {}
+        phase = data["phase"]
+        return {
+            "generations": self.size,
+            "eval_time": float(np.sum(data["eval_time"])),
+            "op_time": float(np.sum(data["op_time"])),
+            "exploitation_generations": int(np.sum(phase == PHASE_CODES["exploitation"])),
+            "exploration_generations": int(np.sum(phase == PHASE_CODES["exploration"])),
+            "mean_acceptance_rate": float(np.nanmean(data["acceptance_rate"]))
+            if np.any(~np.isnan(data["acceptance_rate"])) else None,
+            "nfe": int(data["nfe"][-1]) if self.size else 0,
+        }
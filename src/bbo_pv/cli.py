@@ -0,0 +1,72 @@
+import argparse
+import sys
+
+from .config import make_config
+
+# Alt komut -> (modül, açıklama). Modüller sadece ilgili komut çalışırken içe aktarılır;
+# böylece "run" matplotlib/pandas yükleme maliyetini ödemez.
+COMMANDS = {
+    "run": ("fit", "Tek bir BBO koşusu (+ isteğe bağlı LM parlatma)"),
+    "stats": ("collect_statistics", "Çok koşulu istatistik tablosu (pandas)"),
+    "compare": ("compare_algorithms", "Yakınsama karşılaştırma grafiği (matplotlib)"),
+    "plot": ("plot_results", "I-V eğrisi grafiği (matplotlib)"),
+}
+
+
+def _bounds_arg(text):
+    low, high = text.split(",")
+    return float(low), float(high)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="bbo-pv", description="Solar PV parameter identification with BBO")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name, (_, help_text) in COMMANDS.items():
+        sub = subparsers.add_parser(name, help=help_text)
+        sub.add_argument("--config", help="JSON veya TOML ayar dosyası")
+        sub.add_argument("--bounds", type=_bounds_arg, nargs=5, metavar="MIN,MAX",
+                         help="I_ph I_sd R_s R_sh n sınırları (ör. --bounds 0.7,0.8 1e-7,1e-6 ...)")
+        sub.add_argument("--pop-size", type=int)
+        sub.add_argument("--max-iter", type=int)
+        sub.add_argument("--seed", type=int)
+        sub.add_argument("--solver", choices=("newton", "lambertw"))
+        sub.add_argument("--results-dir")
+        sub.add_argument("--output", help="Çıktı dosyası (CSV/PNG)")
+        sub.add_argument("--cache", action="store_const", const=True,
+                         help="Tekrarlanan aday vektörleri önbellekten değerlendir (LRU)")
+        if name == "run":
+            sub.add_argument("--target-fitness", type=float)
+            sub.add_argument("--multi-fidelity", action="store_const", const=True,
+                             help="Çocukları önce ucuz bir alt küme RMSE'siyle ele (tam değerlendirmeyi azaltır)")
+            sub.add_argument("--init", choices=("uniform", "halton", "sobol", "lhs", "obl"),
+                             help="Başlangıç popülasyonu stratejisi")
+            sub.add_argument("--no-refine", dest="refine", action="store_const", const=False,
+                             help="LM yerel aramasını atla")
+            sub.add_argument("--quiet", action="store_true", help="İlerleme çıktısını kapat")
+        if name == "stats":
+            sub.add_argument("--num-runs", type=int)
+            sub.add_argument("--checkpoint-dir")
+        if name in ("stats", "compare"):
+            sub.add_argument("--workers", type=int)
+            sub.add_argument("--algorithms", nargs="+", choices=("BBO", "PSO", "GWO"))
+        if name in ("compare", "plot"):
+            sub.add_argument("--show", action="store_const", const=True, help="Grafiği ekranda da göster")
+    return parser
+
+
+def main(argv=None):
+    args = vars(build_parser().parse_args(argv))
+    command = args.pop("command")
+    quiet = args.pop("quiet", False)
+    config = make_config(args.pop("config"), command, **args)
+    config["verbose"] = not quiet
+
+    # Alt komut modülü burada (tembel) yüklenir
+    module_name = COMMANDS[command][0]
+    module = __import__(f"{__package__}.{module_name}", fromlist=["main"])
+    return module.main(config)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+import sys
+
+import numpy as np
+
+from .bbo import BBO
+from .pso import PSO
+from .gwo import GWO
+from .benchmark_functions import OBJECTIVES
+from .objective import CachedObjective
+from .run_scheduler import run_campaign
+from .results_store import ResultsStore
+
+algorithms = {
+    "BBO": BBO,
+    "PSO": PSO,
+    "GWO": GWO
+}
+
+
+def print_progress(done, total, result):
+    # İlerleme çubuğu gibi çıktı verelim
+    print(f"\rRun {done}/{total} ({result.algorithm} #{result.run + 1})...", end="")
+
+
+def main(config):
+    """
+    "stats" alt komutu: her algoritmayı num_runs kez çalıştırıp istatistik tablosunu CSV'ye yazar.
+    Aynı tohum -> aynı tablo (worker sayısından bağımsız). Kesilen kampanya checkpoint_dir'den
+    devam eder; biten koşular results_dir'de saklanır (compare ve plot bunları yeniden kullanır).
+    """
+    # pandas sadece bu komutta gerekir
+    import pandas as pd
+
+    num_runs = config["num_runs"]
+    selected = {name: algorithms[name] for name in config["algorithms"]}
+    output = config["output"] or "final_results.csv"
+    print(f"📊 İstatistik Toplama Başladı ({num_runs} tur)...")
+    
+    objective = OBJECTIVES[config["solver"]]
+    if config["cache"]:
+        objective = CachedObjective(objective)
+
+    # Tüm (algoritma, koşu) işleri çekirdeklere dağıtılır
+    campaign = run_campaign(selected, objective, config["bounds"], config["pop_size"],
+                            config["max_iter"], num_runs, seed=config["seed"], max_workers=config["workers"],
+                            progress=print_progress, checkpoint_dir=config["checkpoint_dir"],
+                            store=ResultsStore(config["results_dir"]))
+    print()
+    
+    results_table = []
+    for name in selected:
+        fitness_values = [res.best_fitness for res in campaign[name]]
+        
+        # İstatistikleri Hesapla
+        best_val = np.min(fitness_values)
+        worst_val = np.max(fitness_values)
+        mean_val = np.mean(fitness_values)
+        std_val = np.std(fitness_values)
+        
+        # Tabloya Ekle
+        results_table.append({
+            "Algorithm": name,
+            "Best (En İyi)": f"{best_val:.6f}",
+            "Worst (En Kötü)": f"{worst_val:.6f}",
+            "Mean (Ortalama)": f"{mean_val:.6f}",
+            "Std Dev (Sapma)": f"{std_val:.2e}" 
+        })
+        print(f"{name} tamamlandı. Ortalama Hata: {mean_val:.6f}")
+    
+    # --- KAYDETME ---
+    df = pd.DataFrame(results_table)
+    df.to_csv(output, index=False)
+    print(f"\n✅ Tüm sonuçlar '{output}' dosyasına kaydedildi!")
+    print("Excel ile açıp Raporundaki 'Results' tablosuna yapıştırabilirsin.")
+    return 0
+
+
+if __name__ == "__main__":
+    from .cli import main as cli_main
+    sys.exit(cli_main(["stats"] + sys.argv[1:]))
@@ -0,0 +1,73 @@
+import sys
+
+from .bbo import BBO
+from .pso import PSO
+from .gwo import GWO
+from .benchmark_functions import OBJECTIVES
+from .objective import CachedObjective
+from .run_scheduler import run_campaign, StoredRunResult
+from .results_store import ResultsStore, log_downsample
+
+algorithms = {
+    "BBO": (BBO, dict(linewidth=2, color='red')),
+    "PSO": (PSO, dict(linewidth=1.5, linestyle='--', color='blue')),
+    "GWO": (GWO, dict(linewidth=1.5, linestyle='-.', color='green')),
+}
+
+
+def main(config):
+    """
+    "compare" alt komutu: algoritmaların yakınsama eğrilerini aynı grafikte karşılaştırır.
+    Her algoritmanın "stats" kampanyasıyla aynı anahtarlı 0. koşusu kullanılır: depoda varsa
+    optimizatörler yeniden çalıştırılmaz (sadece grafik yeniden çizilir).
+    """
+    # matplotlib sadece grafik komutlarında yüklenir
+    import matplotlib
+    if not config["show"]:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    output = config["output"] or "Comparison_Result.png"
+    selected = {name: algorithms[name][0] for name in config["algorithms"]}
+
+    def print_result(done, total, res):
+        source = " [depodan]" if isinstance(res, StoredRunResult) else ""
+        print(f"{done}. {res.algorithm} -> Sonuç: {res.best_fitness:.6f} "
+              f"(NFE: {res.nfe}, durma nedeni: {res.stop_reason}){source}")
+
+    objective = OBJECTIVES[config["solver"]]
+    if config["cache"]:
+        objective = CachedObjective(objective)
+
+    # Tüm algoritmalar aynı pop_size / max_iter ile çalışır (aynı nesil sayısı)
+    campaign = run_campaign(selected, objective, config["bounds"], config["pop_size"],
+                            config["max_iter"], 1, seed=config["seed"], max_workers=config["workers"],
+                            progress=print_result, store=ResultsStore(config["results_dir"]))
+
+    # --- GRAFİK ÇİZİMİ (Convergence Curve) ---
+    plt.figure(figsize=(10, 6))
+
+    for name in selected:
+        run = campaign[name][0]
+        # Uzun eğriler log-aralıklı noktalarla seyreltilir
+        iterations, values = log_downsample(run.convergence_curve)
+        plt.plot(iterations, values, label=f"{name} (Best: {run.best_fitness:.5f})", **algorithms[name][1])
+
+    plt.title('Convergence Analysis: Solar PV Parameter Estimation', fontsize=14)
+    plt.xlabel('Iteration', fontsize=12)
+    plt.ylabel('Price (RMSE)', fontsize=12)
+    plt.yscale('log') # Logaritmik ölçek farkları daha iyi gösterir
+    plt.legend()
+    plt.grid(True, which="both", ls="-", alpha=0.5)
+
+    plt.savefig(output, dpi=300)
+    if config["show"]:
+        plt.show()
+
+    print(f"\n✅ Karşılaştırma grafiği '{output}' olarak kaydedildi.")
+    return 0
+
+
+if __name__ == "__main__":
+    from .cli import main as cli_main
+    sys.exit(cli_main(["compare"] + sys.argv[1:]))
@@ -0,0 +1,85 @@
+import json
+import os
+
+# Solar PV parametre sınırları (tek kaynak): I_ph, I_sd, R_s, R_sh, n
+DEFAULT_BOUNDS = [
+    (0.7, 0.8),    # I_ph: Genelde 0.76 civarındadır
+    (1e-7, 1e-6),  # I_sd: En kritik ayar, dar aralık
+    (0.01, 0.05),  # R_s : Genelde 0.036'dır
+    (40, 60),      # R_sh: Genelde 50 civarındadır
+    (1.4, 1.6),    # n   : Genelde 1.48'dir
+]
+
+# Tüm alt komutların ortak ayarları; dosya ve komut satırı bunların üzerine yazar
+DEFAULTS = {
+    "bounds": DEFAULT_BOUNDS,
+    "algorithms": ["BBO", "PSO", "GWO"],
+    "solver": "newton",
+    "pop_size": 50,
+    "max_iter": 200,
+    "num_runs": 15,
+    "seed": 2025,
+    "workers": None,
+    "target_fitness": None,
+    "init": "uniform",
+    "multi_fidelity": False,
+    "cache": False,
+    "refine": True,
+    "results_dir": "results",
+    "checkpoint_dir": "checkpoints",
+    "output": None,
+    "show": False,
+}
+
+# Alt komutlara özel varsayılanlar (DEFAULTS'un üzerine, dosya ve komut satırının altına).
+# "run" eski main.py ayarlarını korur: geniş R_sh aralığı, büyük popülasyon ve RMSE < 1e-3 hedefi.
+COMMAND_DEFAULTS = {
+    "run": {
+        "bounds": [DEFAULT_BOUNDS[0], DEFAULT_BOUNDS[1], DEFAULT_BOUNDS[2], (10, 100), DEFAULT_BOUNDS[4]],
+        "pop_size": 100,
+        "max_iter": 1000,
+        "target_fitness": 1e-3,
+    },
+}
+
+
+def load_config_file(path):
+    """
+    JSON veya TOML ayar dosyasını okur (uzantıya göre).
+    TOML için Python 3.11+ tomllib, daha eskilerde tomli paketi kullanılır.
+    """
+    if path.endswith(".toml"):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ImportError("Reading TOML config files on Python < 3.11 requires 'tomli' "
+                                  "(pip install tomli)") from None
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path) as f:
+        return json.load(f)
+
+
+def make_config(path=None, command=None, **overrides):
+    """
+    Varsayılanlar < komut varsayılanları < ayar dosyası < komut satırı sırasıyla birleştirilmiş ayar sözlüğü.
+    None olan override'lar yok sayılır (komut satırında verilmemiş demektir).
+    :param path: İsteğe bağlı JSON/TOML ayar dosyası
+    :param command: Alt komut adı ("run", "stats"...); COMMAND_DEFAULTS'taki ayarları seçer
+    """
+    config = dict(DEFAULTS)
+    config.update(COMMAND_DEFAULTS.get(command, {}))
+    if path is not None:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Config file not found: {path}")
+        loaded = load_config_file(path)
+        unknown = set(loaded) - set(DEFAULTS)
+        if unknown:
+            raise ValueError(f"Unknown config keys: {sorted(unknown)}")
+        config.update(loaded)
+    config.update({k: v for k, v in overrides.items() if v is not None})
+    config["bounds"] = [tuple(map(float, b)) for b in config["bounds"]]
+    return config
@@ -0,0 +1,61 @@
+import sys
+from functools import partial
+
+from .bbo import BBO
+from .benchmark_functions import solar_pv_cost_batch, SingleDiodeMultiFidelity
+from .objective import CachedObjective
+from .termination import StoppingCriteria
+
+
+def main(config):
+    """
+    "run" alt komutu: tek bir BBO koşusu, ardından isteğe bağlı memetik parlatma.
+    :param config: config.make_config ile üretilmiş ayar sözlüğü
+    """
+    bounds = config["bounds"]
+    target = config["target_fitness"]
+
+    # Çok sadakatli modda çocuklar önce ucuz bir tahminle elenir
+    if config["multi_fidelity"]:
+        objective = SingleDiodeMultiFidelity(solver=config["solver"])
+    else:
+        objective = partial(solar_pv_cost_batch, solver=config["solver"])
+    # Yerinde kalan mimarlar ve sınıra kırpılan adaylar tekrar hesaplanmaz
+    if config["cache"]:
+        objective = CachedObjective(objective)
+
+    # BBO Optimizatörünü Başlat
+    optimizer = BBO(objective, bounds,
+                    pop_size=config["pop_size"], max_iter=config["max_iter"], seed=config["seed"], init=config["init"],
+                    verbose=config.get("verbose", True), stopping=StoppingCriteria(target_fitness=target))
+
+    print("🌞 Solar PV Optimizasyonu Başlatılıyor (Single Diode Model)...")
+    best_sol, best_fit, curve = optimizer.optimize()
+
+    # Memetik parlatma: en iyi kunduzlar analitik Jacobian'lı Levenberg–Marquardt ile iyileştirilir
+    if config["refine"]:
+        from .local_search import refine_population
+        spent = refine_population(optimizer, top_k=3)
+        best_sol, best_fit = optimizer.best_solution, optimizer.best_fitness
+        print(f"Yerel arama (LM): {spent} ek değerlendirme")
+
+    print("\n--- SONUÇLAR ---")
+    print(f"En İyi RMSE Değeri: {best_fit:.8f}" + (f" (Hedef < {target})" if target is not None else ""))
+    print(f"Durma Nedeni: {optimizer.stop_reason} ({optimizer.iterations} iterasyon, {optimizer.nfe} değerlendirme)")
+    if optimizer.nfe_low:
+        print(f"Düşük sadakatli ön değerlendirme: {optimizer.nfe_low}")
+    if config["cache"]:
+        info = objective.cache_info()
+        print(f"Önbellek: {info['hits']} isabet, {info['misses']} hesaplama (oran {info['hit_rate']:.1%})")
+    print("Optimize Edilen Parametreler:")
+    print(f"I_ph (A) : {best_sol[0]:.6f}")
+    print(f"I_sd (A) : {best_sol[1]:.10f}")
+    print(f"R_s (Ohm): {best_sol[2]:.6f}")
+    print(f"R_sh(Ohm): {best_sol[3]:.6f}")
+    print(f"n        : {best_sol[4]:.6f}")
+    return 0
+
+
+if __name__ == "__main__":
+    from .cli import main as cli_main
+    sys.exit(cli_main(["run"] + sys.argv[1:]))
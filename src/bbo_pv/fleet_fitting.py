@@ -0,0 +1,185 @@
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+from .bbo import BBO
+from .benchmark_functions import SingleDiodeCost, T_cell
+from .termination import StoppingCriteria
+
+# --- AYARLAR ---
+POP_SIZE = 50
+MAX_ITER = 200
+CHUNK_SIZE = 64        # Aynı anda bellekte tutulan (işlenen) en fazla eğri sayısı
+
+PARAM_NAMES = ["I_ph", "I_sd", "R_s", "R_sh", "n"]
+OUTPUT_FIELDS = ["curve_id"] + PARAM_NAMES + ["rmse", "nfe", "stop_reason"]
+
+
+def curve_bounds(I):
+    """
+    Ölçülen akıma göre ölçeklenen arama sınırları (literatürdeki tek diyot aralıkları).
+    """
+    I_max = float(np.max(np.abs(I)))
+    return [
+        (0.0, 1.5 * I_max),  # I_ph
+        (1e-12, 1e-5),       # I_sd
+        (0.0, 0.5),          # R_s
+        (1.0, 200.0),        # R_sh
+        (1.0, 2.0),          # n
+    ]
+
+
+def iter_csv_curves(path):
+    """
+    Uzun formatlı CSV'den eğrileri tek tek okur (dosyanın tamamı belleğe alınmaz).
+    Beklenen sütunlar: curve_id, V, I ve isteğe bağlı T (Kelvin).
+    Aynı eğrinin satırları art arda gelmelidir.
+    :return: (curve_id, V, I, T) üreteci
+    """
+    with open(path, newline="") as f:
+        reader = csv.DictReader(f)
+        current_id, V, I, T = None, [], [], T_cell
+        for row in reader:
+            curve_id = row["curve_id"]
+            if curve_id != current_id:
+                if current_id is not None:
+                    yield current_id, np.array(V), np.array(I), T
+                current_id, V, I = curve_id, [], []
+                T = float(row["T"]) if row.get("T") else T_cell
+            V.append(float(row["V"]))
+            I.append(float(row["I"]))
+        if current_id is not None:
+            yield current_id, np.array(V), np.array(I), T
+
+
+def iter_npz_curves(path):
+    """
+    NPZ dosyasından eğrileri tek tek okur. Her eğri ayrı dizilerde saklanır:
+    "V_<id>", "I_<id>" ve isteğe bağlı skaler "T_<id>" (Kelvin).
+    NpzFile üyeleri erişildikçe yüklendiği için bellek kullanımı tek eğri kadardır.
+    """
+    with np.load(path) as data:
+        for key in data.files:
+            if not key.startswith("V_"):
+                continue
+            curve_id = key[2:]
+            T = float(data[f"T_{curve_id}"]) if f"T_{curve_id}" in data.files else T_cell
+            yield curve_id, data[key], data[f"I_{curve_id}"], T
+
+
+def iter_curves(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return iter_csv_curves(path)
+    if ext == ".npz":
+        return iter_npz_curves(path)
+    raise ValueError(f"Unsupported curve file '{path}', expected .csv or .npz")
+
+
+def load_done_ids(output_path):
+    """
+    Devam etme (resume) için çıktı dosyasında zaten sonucu olan eğrileri döndürür.
+    """
+    if not os.path.exists(output_path):
+        return set()
+    with open(output_path, newline="") as f:
+        return {row["curve_id"] for row in csv.DictReader(f)}
+
+
+def fit_curve(job):
+    """
+    Worker sürecinde tek bir eğriye BBO ile tek diyot modeli uydurur.
+    """
+    index, curve_id, V, I, T, settings = job
+    seed_seq = np.random.SeedSequence(settings["seed"], spawn_key=(index,))
+    bounds = settings["bounds"] or curve_bounds(I)
+    stopping = StoppingCriteria(target_fitness=settings["target_rmse"])
+
+    optimizer = BBO(SingleDiodeCost(V, I, T, settings["solver"]), bounds,
+                    settings["pop_size"], settings["max_iter"],
+                    rng=np.random.default_rng(seed_seq), stopping=stopping)
+    best_sol, best_fit, _ = optimizer.optimize()
+
+    row = {"curve_id": curve_id}
+    row.update({name: f"{value:.10g}" for name, value in zip(PARAM_NAMES, best_sol)})
+    row.update({"rmse": f"{best_fit:.10g}", "nfe": optimizer.nfe, "stop_reason": optimizer.stop_reason})
+    return row
+
+
+def run_fleet(input_path, output_path, bounds=None, pop_size=POP_SIZE, max_iter=MAX_ITER,
+              seed=0, max_workers=None, chunk_size=CHUNK_SIZE, solver="newton",
+              target_rmse=None, progress=None):
+    """
+    Giriş dosyasındaki tüm eğrileri süreçler arasında paralel olarak uydurur ve
+    sonuçları bittikçe çıktı CSV'sine ekler. Yarıda kalan bir çalışma aynı
+    komutla devam ettirilebilir: sonucu olan eğriler atlanır.
+    :param bounds: Sabit sınırlar; None ise her eğri için curve_bounds(I) kullanılır
+    :param chunk_size: Aynı anda işlenen en fazla eğri sayısı (bellek sınırı)
+    :param progress: İsteğe bağlı callback(row)
+    :return: Bu çağrıda uydurulan eğri sayısı
+    """
+    settings = {
+        "bounds": bounds, "pop_size": pop_size, "max_iter": max_iter, "seed": seed,
+        "solver": solver, "target_rmse": target_rmse,
+    }
+    done_ids = load_done_ids(output_path)
+    write_header = not os.path.exists(output_path) or os.path.getsize(output_path) == 0
+    fitted = 0
+
+    with open(output_path, "a", newline="") as out, \
+            ProcessPoolExecutor(max_workers=max_workers) as executor:
+        writer = csv.DictWriter(out, fieldnames=OUTPUT_FIELDS)
+        if write_header:
+            writer.writeheader()
+            out.flush()
+
+        def drain(pending, limit):
+            # Uçuştaki iş sayısı limit'in altına inene kadar biten sonuçları yaz
+            nonlocal fitted
+            while len(pending) > limit:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    row = future.result()
+                    writer.writerow(row)
+                    fitted += 1
+                    if progress is not None:
+                        progress(row)
+                out.flush()
+            return pending
+
+        pending = set()
+        for index, (curve_id, V, I, T) in enumerate(iter_curves(input_path)):
+            if curve_id in done_ids:
+                continue
+            pending.add(executor.submit(fit_curve, (index, curve_id, V, I, T, settings)))
+            pending = drain(pending, chunk_size - 1)
+        drain(pending, 0)
+
+    return fitted
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fit single-diode parameters to many measured I-V curves")
+    parser.add_argument("input", help="Curves file (.csv long format or .npz)")
+    parser.add_argument("output", help="Results CSV (appended to; existing curve_ids are skipped)")
+    parser.add_argument("--pop-size", type=int, default=POP_SIZE)
+    parser.add_argument("--max-iter", type=int, default=MAX_ITER)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--solver", choices=["newton", "lambertw"], default="newton")
+    parser.add_argument("--target-rmse", type=float, default=None)
+    args = parser.parse_args(argv)
+
+    fitted = run_fleet(args.input, args.output, pop_size=args.pop_size, max_iter=args.max_iter,
+                       seed=args.seed, max_workers=args.workers, chunk_size=args.chunk_size,
+                       solver=args.solver, target_rmse=args.target_rmse,
+                       progress=lambda row: print(f"{row['curve_id']}: RMSE={float(row['rmse']):.6f}"))
+    print(f"\n✅ {fitted} eğri uyduruldu, sonuçlar '{args.output}' dosyasına eklendi.")
+
+
+if __name__ == "__main__":
+    main()
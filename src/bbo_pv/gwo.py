@@ -0,0 +1,112 @@
+import numpy as np
+from .optimizer_base import BaseOptimizer
+from . import kernels
+
+class GWO(BaseOptimizer):
+    # Checkpoint'e yazılan durum
+    _state_fields = ("X", "Alpha_pos", "Alpha_score", "Beta_pos", "Beta_score", "Delta_pos", "Delta_score")
+    
+    def __init__(self, objective_func, bounds, pop_size=30, max_iter=500, **kwargs):
+        super().__init__(objective_func, bounds, pop_size, max_iter, **kwargs)
+        
+        self.X = self._initial_population()
+        
+        # İlk 3 lider (Alpha, Beta, Delta)
+        self.Alpha_pos = np.zeros(self.dim)
+        self.Alpha_score = float("inf")
+        
+        self.Beta_pos = np.zeros(self.dim)
+        self.Beta_score = float("inf")
+        
+        self.Delta_pos = np.zeros(self.dim)
+        self.Delta_score = float("inf")
+        
+        self.convergence_curve = []
+        self._seeded = False  # Sürü initialize() içinde değerlendirildiyse ilk nesil tekrar değerlendirmez
+
+    def initialize(self):
+        super().initialize()
+        # OBL: sürü, kendisi ve karşıtı arasından en iyi kurtlarla başlar;
+        # seçimde hesaplanan fitness'lar liderleri doğrudan belirler
+        self._seeded = self.initializer.opposition
+        if self._seeded:
+            self.X, fitness = self._select_opposition(self.X)
+            self._update_leaders(fitness)
+
+    def step(self, t):
+        """
+        t. iterasyonu (0 tabanlı) çalıştırır. Durulması gerekiyorsa True döner.
+        """
+        if self._seeded:
+            # İlk nesil: sürü ve liderler initialize() içinde zaten değerlendirildi
+            self._seeded = False
+        else:
+            # Sınır kontrolü
+            self.X = np.clip(self.X, self.lb, self.ub)
+            
+            # Tüm sürünün fitness değerleri tek seferde
+            fitness = self._evaluate(self.X)
+            
+            # Liderleri Belirle
+            self._update_leaders(fitness)
+        
+        # a parametresi 2'den 0'a lineer azalır
+        a = 2 - t * (2 / self.max_iter)
+        
+        # Pozisyon Güncelleme (Eq 3.1 - 3.7 in GWO paper)
+        self.X = self._update_positions(a)
+        
+        self.convergence_curve.append(self.Alpha_score)
+        
+        # Callback'ler ve durma kriterleri
+        return self._end_generation(t, self.Alpha_score, self.X)
+
+    def _result(self):
+        return self.Alpha_pos, self.Alpha_score, self.convergence_curve
+
+    def _update_leaders(self, fitness):
+        """
+        Mevcut liderler ve sürü birlikte değerlendirilip en iyi 3 birey Alpha, Beta, Delta olur.
+        Böylece yeni bir Alpha bulunduğunda eski Alpha Beta'ya (Beta da Delta'ya) düşer.
+        """
+        leader_pos = np.vstack((self.Alpha_pos, self.Beta_pos, self.Delta_pos))
+        leader_scores = np.array([self.Alpha_score, self.Beta_score, self.Delta_score])
+        
+        candidates = np.vstack((self.X, leader_pos))
+        scores = np.concatenate((fitness, leader_scores))
+        
+        top = select_leaders(scores, 3)
+        (self.Alpha_pos, self.Beta_pos, self.Delta_pos) = candidates[top].copy()
+        (self.Alpha_score, self.Beta_score, self.Delta_score) = scores[top]
+
+    def _update_positions(self, a):
+        """
+        Tüm sürü için matris formunda pozisyon güncellemesi.
+        Rastgele sayılar tek çekimde üretilir: (3 lider, r1/r2, pop, dim)
+        """
+        r = self.rng.random((3, 2, self.pop_size, self.dim))
+        
+        if kernels.USE_NUMBA:
+            leaders = np.stack((self.Alpha_pos, self.Beta_pos, self.Delta_pos))
+            return kernels.gwo_update_kernel(np.ascontiguousarray(self.X), leaders, r, float(a))
+        
+        A = 2 * a * r[:, 0] - a
+        C = 2 * r[:, 1]
+        
+        # (3, 1, dim) -> Alpha, Beta, Delta sürüye yayınlanır (broadcast)
+        leaders = np.stack((self.Alpha_pos, self.Beta_pos, self.Delta_pos))[:, None, :]
+        D = np.abs(C * leaders - self.X)
+        X123 = leaders - A * D
+        
+        # Ortalama
+        return X123.mean(axis=0)
+
+
+def select_leaders(fitness, k=3):
+    """
+    Fitness vektöründen en iyi k bireyin indekslerini (iyiden kötüye sıralı) döndürür.
+    Tam sıralama yerine argpartition kullanılır: O(n).
+    """
+    k = min(k, len(fitness))
+    top = np.argpartition(fitness, k - 1)[:k]
+    return top[np.argsort(fitness[top], kind='stable')]
@@ -0,0 +1,213 @@
+"""
+Başlangıç popülasyonu stratejileri (BBO, PSO ve GWO ortak kullanır).
+
+- uniform: Düz rastgele örnekleme (eski davranış, aynı rastgele akış)
+- halton / sobol: Düşük farklılıklı (quasi-random) diziler, rastgele kaydırmalı
+- lhs: Latin hypercube (her boyutta her aralıktan tam bir nokta)
+- opposition: x ve karşıtı lb + ub - x birlikte değerlendirilip iyi olan yarı tutulur
+- log_scale: Onlarca kat aralığa yayılan parametreler (ör. I_sd) log uzayında örneklenir
+
+scipy kuruluysa Sobol için scipy.stats.qmc kullanılır; değilse gömülü Joe–Kuo
+yön sayılarıyla (en fazla 21 boyut) üretilir.
+"""
+import numpy as np
+
+try:
+    from scipy.stats import qmc
+except ImportError:
+    qmc = None
+
+METHODS = ("uniform", "halton", "sobol", "lhs")
+
+# Joe & Kuo (new-joe-kuo-6.21201) yön sayıları, boyut 2..21: (s, a, m_1..m_s)
+_JOE_KUO = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+_SOBOL_BITS = 32
+
+
+def _sobol_directions(dim):
+    """
+    (dim, 32) yön sayıları matrisi (Bratley & Fox / Joe & Kuo yapısı).
+    """
+    if dim > len(_JOE_KUO) + 1:
+        raise ValueError(f"Built-in Sobol table supports up to {len(_JOE_KUO) + 1} dimensions; "
+                         "install scipy for more")
+    V = np.zeros((dim, _SOBOL_BITS), dtype=np.uint64)
+    # 1. boyut: van der Corput dizisi
+    V[0] = [1 << (_SOBOL_BITS - 1 - i) for i in range(_SOBOL_BITS)]
+    for j in range(1, dim):
+        s, a, m = _JOE_KUO[j - 1]
+        v = [int(m[i]) << (_SOBOL_BITS - 1 - i) for i in range(s)]
+        for i in range(s, _SOBOL_BITS):
+            value = v[i - s] ^ (v[i - s] >> s)
+            for k in range(1, s):
+                if (a >> (s - 1 - k)) & 1:
+                    value ^= v[i - k]
+            v.append(value)
+        V[j] = v
+    return V
+
+
+def sobol(n, dim, rng):
+    """
+    [0, 1)^dim içinde n Sobol noktası (rastgele dijital kaydırma ile, Gray kodu sırası).
+    """
+    if qmc is not None:
+        return qmc.Sobol(dim, scramble=True, seed=rng).random(n)
+
+    V = _sobol_directions(dim)
+    points = np.empty((n, dim), dtype=np.uint64)
+    x = np.zeros(dim, dtype=np.uint64)
+    for i in range(n):
+        points[i] = x
+        # i'nin en düşük sıfır bitine karşılık gelen yön sayısı eklenir (Gray kodu)
+        c = (~i & (i + 1)).bit_length() - 1
+        x = x ^ V[:, c]
+    shift = rng.integers(0, 1 << _SOBOL_BITS, dim, dtype=np.uint64)
+    return (points ^ shift).astype(float) / float(1 << _SOBOL_BITS)
+
+
+def _primes(count):
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def halton(n, dim, rng):
+    """
+    [0, 1)^dim içinde n Halton noktası (Cranley–Patterson rastgele kaydırması ile).
+    """
+    points = np.empty((n, dim))
+    index = np.arange(1, n + 1)
+    for j, base in enumerate(_primes(dim)):
+        # Radikal ters: index'in base tabanındaki basamaklarının ters çevrilmesi
+        value = np.zeros(n)
+        f = 1.0 / base
+        i = index.copy()
+        while np.any(i > 0):
+            value += f * (i % base)
+            i //= base
+            f /= base
+        points[:, j] = value
+    return (points + rng.random(dim)) % 1.0
+
+
+def latin_hypercube(n, dim, rng):
+    """
+    [0, 1)^dim içinde n noktalı Latin hypercube örneklemi.
+    """
+    strata = np.argsort(rng.random((n, dim)), axis=0)
+    return (strata + rng.random((n, dim))) / n
+
+
+class Initializer:
+    """
+    Başlangıç popülasyonu üreteci. Optimizatörlere init="sobol" gibi bir isim ya da
+    Initializer(...) örneği olarak verilir.
+    """
+
+    def __init__(self, method="uniform", opposition=False, log_scale=None):
+        """
+        :param method: "uniform", "halton", "sobol" veya "lhs"
+        :param opposition: True ise karşıt noktalar da değerlendirilir ve en iyi pop_size birey tutulur
+                           (başlangıçta 2 * pop_size değerlendirme harcanır)
+        :param log_scale: Log uzayında örneklenecek boyutlar: bool maske, indeks listesi veya "auto"
+                          ("auto": alt sınırı pozitif ve üst/alt oranı >= 10 olan boyutlar)
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown init method '{method}', expected one of {METHODS}")
+        self.method = method
+        self.opposition = opposition
+        self.log_scale = log_scale
+
+    def _log_mask(self, lb, ub):
+        if self.log_scale is None:
+            return np.zeros(len(lb), dtype=bool)
+        if isinstance(self.log_scale, str):
+            if self.log_scale != "auto":
+                raise ValueError(f"Unknown log_scale '{self.log_scale}'")
+            with np.errstate(divide='ignore'):
+                return (lb > 0) & (ub / lb >= 10)
+        mask = np.asarray(self.log_scale)
+        if mask.dtype != bool:
+            mask = np.isin(np.arange(len(lb)), mask)
+        if np.any(lb[mask] <= 0):
+            raise ValueError("log_scale dimensions need a positive lower bound")
+        return mask
+
+    def _to_box(self, U, lb, ub, log_mask):
+        # Birim küpten arama kutusuna (log boyutlarda log uzayında doğrusal)
+        X = lb + U * (ub - lb)
+        if log_mask.any():
+            log_lb, log_ub = np.log(lb[log_mask]), np.log(ub[log_mask])
+            X[:, log_mask] = np.exp(log_lb + U[:, log_mask] * (log_ub - log_lb))
+        return np.clip(X, lb, ub)
+
+    def sample(self, n, lb, ub, rng):
+        """
+        Arama kutusunda n başlangıç noktası.
+        :return: (n, dim) dizi
+        """
+        log_mask = self._log_mask(lb, ub)
+        if self.method == "uniform" and not log_mask.any():
+            # Eski davranışla aynı rastgele akış
+            return rng.uniform(lb, ub, (n, len(lb)))
+
+        dim = len(lb)
+        if self.method == "uniform":
+            U = rng.random((n, dim))
+        elif self.method == "halton":
+            U = halton(n, dim, rng)
+        elif self.method == "sobol":
+            U = sobol(n, dim, rng)
+        else:
+            U = latin_hypercube(n, dim, rng)
+        return self._to_box(U, lb, ub, log_mask)
+
+    def opposite(self, X, lb, ub):
+        """
+        Karşıt noktalar: lb + ub - x (log boyutlarda log uzayında yansıma, yani lb * ub / x).
+        """
+        log_mask = self._log_mask(lb, ub)
+        O = lb + ub - X
+        if log_mask.any():
+            O[:, log_mask] = lb[log_mask] * ub[log_mask] / X[:, log_mask]
+        return np.clip(O, lb, ub)
+
+
+def make_initializer(init):
+    """
+    init argümanını Initializer'a çevirir.
+    :param init: None/"uniform", "halton", "sobol", "lhs", "obl" (uniform + opposition) veya Initializer
+    """
+    if isinstance(init, Initializer):
+        return init
+    if init is None:
+        return Initializer()
+    if init == "obl":
+        return Initializer("uniform", opposition=True)
+    return Initializer(init)
@@ -0,0 +1,259 @@
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .bbo import BBO
+
+TOPOLOGIES = ("ring", "full")
+
+
+def migration_sources(island, n_islands, topology):
+    """
+    Bir adanın göçmen aldığı komşu adalar.
+    ring: sadece bir önceki ada, full: diğer tüm adalar.
+    """
+    if n_islands == 1:
+        return []
+    if topology == "ring":
+        return [(island - 1) % n_islands]
+    if topology == "full":
+        return [j for j in range(n_islands) if j != island]
+    raise ValueError(f"Unknown topology '{topology}', expected one of {TOPOLOGIES}")
+
+
+class _SharedArrays:
+    """
+    Adaların paylaştığı diziler (popülasyonlar, fitness, göçmenler, yakınsama eğrileri).
+    Süreçler arası veri pickle edilmeden SharedMemory üzerinden okunur/yazılır.
+    """
+
+    def __init__(self, shapes, names=None):
+        self.shapes = shapes
+        self.blocks = {}
+        self.arrays = {}
+        for key, shape in shapes.items():
+            size = max(int(np.prod(shape)) * 8, 8)
+            if names is None:
+                block = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                block = shared_memory.SharedMemory(name=names[key])
+            self.blocks[key] = block
+            self.arrays[key] = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+
+    @property
+    def names(self):
+        return {key: block.name for key, block in self.blocks.items()}
+
+    def __getitem__(self, key):
+        return self.arrays[key]
+
+    def close(self, unlink=False):
+        self.arrays.clear()
+        for block in self.blocks.values():
+            block.close()
+            if unlink:
+                block.unlink()
+
+
+def _island_worker(island, settings, shapes, names, barrier):
+    """
+    Tek bir adanın BBO motorunu çalıştırır ve her migration_interval nesilde
+    en iyi kunduzlarını komşu adalarla değiştirir.
+    """
+    shared = _SharedArrays(shapes, names)
+    try:
+        n_islands = settings["n_islands"]
+        k = settings["n_migrants"]
+        max_iter = settings["max_iter"]
+        sources = migration_sources(island, n_islands, settings["topology"])
+
+        optimizer = BBO(settings["objective_func"], settings["bounds"], settings["pop_size"], max_iter,
+                        rng=np.random.default_rng(settings["seeds"][island]), **settings["bbo_kwargs"])
+        optimizer.initialize()
+
+        # Popülasyon, fitness ve düşük sadakatli tahminler doğrudan paylaşılan bellekte tutulur
+        population = shared["population"][island]
+        fitness = shared["fitness"][island]
+        fitness_low = shared["fitness_low"][island]
+        population[:] = optimizer.population
+        fitness[:] = optimizer.fitness
+        fitness_low[:] = optimizer.fitness_low
+        optimizer.population = population
+        optimizer.fitness = fitness
+        optimizer.fitness_low = fitness_low
+
+        curve = shared["curve"][island]
+        emigrants = shared["emigrants"]
+        status = shared["status"]
+        stopped_flags = shared["stopped"]
+
+        # step() True dönerse (durma kriteri / callback) ada nesil üretmeyi bırakır ama
+        # diğer adalar bariyerde beklemesin diye göç turlarına katılmaya devam eder.
+        # clock tüm adalarda aynı ilerler; t sadece bu adanın tamamladığı nesillerdir.
+        t = 0
+        clock = 0
+        stopped = False
+        while clock < max_iter:
+            epoch_end = min(clock + settings["migration_interval"], max_iter)
+            while t < epoch_end and not stopped:
+                stopped = optimizer.step(t)
+                curve[t] = optimizer.best_fitness
+                t += 1
+            clock = epoch_end
+
+            # 1. En iyi k kunduzu göç tamponuna yaz: [konum..., fitness, düşük sadakatli tahmin]
+            best = np.argsort(fitness)[:k]
+            emigrants[island, :, :-2] = population[best]
+            emigrants[island, :, -2] = fitness[best]
+            emigrants[island, :, -1] = fitness_low[best]
+            status[island] = optimizer.best_fitness
+            stopped_flags[island] = stopped
+            barrier.wait()
+
+            # 2. Komşulardan gelenlerin en iyi k tanesi en kötü k kunduzun yerine geçer (daha iyiyse).
+            # Kunduzla birlikte düşük sadakatli tahmini de taşınır (çok sadakatli elemede ebeveyn
+            # eşiği göçmene ait olur) ve göçmenler vekil modelin arşivine eklenir.
+            if sources:
+                incoming = emigrants[sources].reshape(-1, optimizer.dim + 2)
+                incoming = incoming[np.argsort(incoming[:, -2])[:k]]
+                worst = np.argsort(fitness)[::-1][:len(incoming)]
+                better = incoming[:, -2] < fitness[worst]
+                replaced = worst[better]
+                population[replaced] = incoming[better, :-2]
+                fitness[replaced] = incoming[better, -2]
+                fitness_low[replaced] = incoming[better, -1]
+                if optimizer.surrogate is not None and better.any():
+                    optimizer.surrogate.add(incoming[better, :-2], incoming[better, -2])
+
+                best_idx = np.argmin(fitness)
+                if fitness[best_idx] < optimizer.best_fitness:
+                    optimizer.best_fitness = fitness[best_idx]
+                    optimizer.best_solution = population[best_idx].copy()
+
+            # 3. Herhangi bir ada hedefe ulaştıysa ya da tüm adalar kendi kriterleriyle durduysa hepsi birlikte durur
+            target_reached = settings["target_fitness"] is not None and \
+                np.min(status) <= settings["target_fitness"]
+            all_stopped = bool(np.all(stopped_flags))
+            barrier.wait()
+            if target_reached or all_stopped:
+                break
+
+        shared["curve"][island, t:] = np.nan
+        shared["best"][island, :-1] = optimizer.best_solution
+        shared["best"][island, -1] = optimizer.best_fitness
+        shared["nfe"][island] = optimizer.nfe
+    except BaseException:
+        # Diğer adaların bariyerde sonsuza kadar beklememesi için
+        barrier.abort()
+        raise
+    finally:
+        shared.close()
+
+
+class IslandBBO:
+    """
+    Ada modeli (island model) paralel BBO.
+    Her ada ayrı bir süreçte kendi BBO popülasyonunu çalıştırır; belirli aralıklarla
+    adalar en iyi kunduzlarını ring veya tam bağlantılı topolojide değiştirir.
+    """
+
+    def __init__(self, objective_func, bounds, n_islands=4, pop_size=25, max_iter=500,
+                 migration_interval=10, n_migrants=2, topology="ring", seed=None,
+                 target_fitness=None, bbo_kwargs=None):
+        """
+        :param objective_func: Maliyet fonksiyonu (pickle edilebilir olmalı)
+        :param n_islands: Ada (süreç) sayısı
+        :param pop_size: Ada başına kunduz sayısı
+        :param max_iter: Ada başına maksimum iterasyon
+        :param migration_interval: Kaç nesilde bir göç yapılacağı
+        :param n_migrants: Her göçte bir adadan gönderilen en iyi kunduz sayısı
+        :param topology: "ring" veya "full"
+        :param seed: Ada tohumları bu tohumdan SeedSequence.spawn ile türetilir
+        :param target_fitness: Herhangi bir ada bu değere ulaşınca tüm adalar durur
+        :param bbo_kwargs: Her adanın BBO motoruna aktarılacak ek seçenekler
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown topology '{topology}', expected one of {TOPOLOGIES}")
+        self.func = objective_func
+        self.bounds = bounds
+        self.dim = len(bounds)
+        self.n_islands = n_islands
+        self.pop_size = pop_size
+        self.max_iter = max_iter
+        self.migration_interval = migration_interval
+        self.n_migrants = min(n_migrants, pop_size)
+        self.topology = topology
+        self.seed = seed
+        self.target_fitness = target_fitness
+        self.bbo_kwargs = bbo_kwargs or {}
+
+        self.best_solution = None
+        self.best_fitness = float('inf')
+        self.convergence_curve = []
+        self.island_curves = None
+        self.populations = None
+        self.fitness = None
+        self.fitness_low = None
+        self.nfe = 0
+
+    def optimize(self):
+        shapes = {
+            "population": (self.n_islands, self.pop_size, self.dim),
+            "fitness": (self.n_islands, self.pop_size),
+            "fitness_low": (self.n_islands, self.pop_size),
+            "emigrants": (self.n_islands, self.n_migrants, self.dim + 2),
+            "status": (self.n_islands,),
+            "stopped": (self.n_islands,),
+            "curve": (self.n_islands, self.max_iter),
+            "best": (self.n_islands, self.dim + 1),
+            "nfe": (self.n_islands,),
+        }
+        shared = _SharedArrays(shapes)
+        shared["status"][:] = np.inf
+
+        settings = {
+            "objective_func": self.func,
+            "bounds": self.bounds,
+            "pop_size": self.pop_size,
+            "max_iter": self.max_iter,
+            "n_islands": self.n_islands,
+            "n_migrants": self.n_migrants,
+            "migration_interval": self.migration_interval,
+            "topology": self.topology,
+            "target_fitness": self.target_fitness,
+            "seeds": np.random.SeedSequence(self.seed).spawn(self.n_islands),
+            "bbo_kwargs": self.bbo_kwargs,
+        }
+
+        try:
+            ctx = mp.get_context()
+            barrier = ctx.Barrier(self.n_islands)
+            workers = [
+                ctx.Process(target=_island_worker, args=(i, settings, shapes, shared.names, barrier))
+                for i in range(self.n_islands)
+            ]
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join()
+            if any(w.exitcode != 0 for w in workers):
+                raise RuntimeError("An island worker process failed")
+
+            best = shared["best"]
+            winner = int(np.argmin(best[:, -1]))
+            self.best_solution = best[winner, :-1].copy()
+            self.best_fitness = float(best[winner, -1])
+            self.nfe = int(np.sum(shared["nfe"]))
+            self.island_curves = shared["curve"].copy()
+            self.populations = shared["population"].copy()
+            self.fitness = shared["fitness"].copy()
+            self.fitness_low = shared["fitness_low"].copy()
+
+            # Global yakınsama eğrisi: her nesilde adaların en iyisi
+            curves = self.island_curves[:, ~np.all(np.isnan(self.island_curves), axis=0)]
+            self.convergence_curve = list(np.nanmin(curves, axis=0))
+        finally:
+            shared.close(unlink=True)
+
+        return self.best_solution, self.best_fitness, self.convergence_curve
@@ -0,0 +1,117 @@
+"""
+Numba ile derlenen (JIT) isteğe bağlı çekirdekler.
+
+Numba kuruluysa maliyet fonksiyonundaki Newton çözümü ve BBO/GWO güncelleme adımları
+bu derlenmiş döngüleri kullanır; kurulu değilse (veya BBO_KERNELS=numpy ayarlanmışsa)
+çağıran modüller kendi saf NumPy yollarına döner. Derlenen kod diskte önbelleğe
+alınır (cache=True), böylece her açılışta yeniden derlenmez.
+Rastgele sayılar her zaman çağıran tarafta NumPy ile üretilir; iki yol aynı
+rastgele akışı kullanır ve sonuçlar yuvarlama hatası düzeyinde aynıdır.
+"""
+import os
+
+import numpy as np
+
+# BBO_KERNELS=numpy ise numba hiç içe aktarılmaz (~0.5 s açılış maliyeti)
+njit = None
+if os.environ.get("BBO_KERNELS", "").lower() != "numpy":
+    try:
+        from numba import njit
+    except ImportError:
+        pass
+
+USE_NUMBA = njit is not None
+
+
+def _jit(func):
+    # error_model="numpy": sıfıra bölme istisna yerine inf/nan üretir (NumPy yolu gibi);
+    # ceza kuralına takılan adaylar (ör. R_sh = 0) da çekirdekten geçer
+    return njit(cache=True, nogil=True, error_model="numpy")(func) if USE_NUMBA else None
+
+
+def _newton_current(X, V, k_B, q_e, T, tol, max_steps):
+    pop, m = X.shape[0], V.shape[0]
+    I_out = np.empty((pop, m))
+    success = np.zeros((pop, m), dtype=np.bool_)
+    exp_cap = np.exp(100.0) * 1e5
+
+    for p in range(pop):
+        I_ph, I_sd, R_s, R_sh, n = X[p, 0], X[p, 1], X[p, 2], X[p, 3], X[p, 4]
+        VT = (n * k_B * T) / q_e
+        for i in range(m):
+            v = V[i]
+            I_est = I_ph
+            if not np.isfinite(I_est):
+                I_out[p, i] = I_est
+                continue
+            for _ in range(max_steps):
+                exp_arg = (v + I_est * R_s) / VT
+                if exp_arg > 100:
+                    exp_val = exp_cap
+                else:
+                    exp_val = np.exp(exp_arg)
+
+                f_val = I_ph - I_sd * (exp_val - 1) - (v + I_est * R_s) / R_sh - I_est
+                df_val = -I_sd * (R_s / VT) * exp_val - (R_s / R_sh) - 1
+
+                if abs(df_val) < 1e-10:
+                    break
+
+                I_next = I_est - f_val / df_val
+                if not np.isfinite(I_next):
+                    break
+
+                if abs(I_next - I_est) < tol:
+                    I_est = I_next
+                    success[p, i] = True
+                    break
+
+                I_est = I_next
+            I_out[p, i] = I_est
+    return I_out, success
+
+
+def _bbo_exploitation(P, k, r7, r8, best):
+    n, dim = P.shape
+    out = np.empty_like(P)
+    for i in range(n):
+        for j in range(dim):
+            x = P[i, j]
+            out[i, j] = x + r7[i] * (P[k[i], j] - x) + r8[i] * (best[j] - x)
+    return out
+
+
+def _bbo_exploration(P, num_architects, k_arch, coef_arch, k_pros, coef_pros, perturbation):
+    n, dim = P.shape
+    out = np.empty_like(P)
+    for i in range(num_architects):
+        for j in range(dim):
+            x = P[i, j]
+            out[i, j] = x + coef_arch[i] * (P[k_arch[i], j] - x)
+    for i in range(num_architects, n):
+        p = i - num_architects
+        for j in range(dim):
+            x = P[i, j]
+            out[i, j] = x + coef_pros[p] * (P[k_pros[p], j] - x) + perturbation[p, j]
+    return out
+
+
+def _gwo_update(X, leaders, r, a):
+    n, dim = X.shape
+    out = np.empty_like(X)
+    for i in range(n):
+        for j in range(dim):
+            x = X[i, j]
+            acc = 0.0
+            for l in range(3):
+                A = 2 * a * r[l, 0, i, j] - a
+                C = 2 * r[l, 1, i, j]
+                acc += leaders[l, j] - A * abs(C * leaders[l, j] - x)
+            out[i, j] = acc / 3
+    return out
+
+
+newton_current_kernel = _jit(_newton_current)
+bbo_exploitation_kernel = _jit(_bbo_exploitation)
+bbo_exploration_kernel = _jit(_bbo_exploration)
+gwo_update_kernel = _jit(_gwo_update)
@@ -0,0 +1,197 @@
+import functools
+
+import numpy as np
+
+from .benchmark_functions import (V_exp, I_exp, T_cell, k_B, q_e, _lambertw_current, solar_pv_cost,
+                                  solar_pv_cost_batch, solar_pv_cost_lambertw)
+
+# Modüldeki R.T.C. France verisini (V_exp, I_exp, T_cell) kullanan maliyet fonksiyonları
+_DEFAULT_DATA_OBJECTIVES = (solar_pv_cost, solar_pv_cost_batch, solar_pv_cost_lambertw)
+
+# Sınır verilmediğinde kullanılan fiziksel alt sınırlar (I_ph, I_sd, R_s, R_sh, n);
+# solar_pv_cost'un ceza kurallarıyla uyumludur.
+PHYSICAL_LB = np.array([0.0, 1e-15, 0.0, 1e-5, 0.1])
+
+
+def residual_jacobian(x, V=V_exp, I=I_exp, T=T_cell):
+    """
+    Tek diyot modelinin artıkları r = I_model(V) - I ve analitik Jacobian'ı.
+    Model akımı Lambert W kapalı formuyla bulunur; türevler diyot denkleminin
+    f(I, x) = I_ph - I_sd (exp((V + I R_s) / a) - 1) - (V + I R_s) / R_sh - I = 0
+    kapalı (implicit) türevinden gelir: dI/dx = -(df/dx) / (df/dI).
+    :param x: [I_ph, I_sd, R_s, R_sh, n]
+    :return: (r, J) -> (len(V),) artık vektörü ve (len(V), 5) Jacobian
+    """
+    x = np.asarray(x, dtype=float)
+    V = np.asarray(V, dtype=float)
+    I_ph, I_sd, R_s, R_sh, n = x
+    a = (n * k_B * T) / q_e
+
+    I_calc = _lambertw_current(x[None, :], V, T)[0][0]
+
+    with np.errstate(all='ignore'):
+        U = V + I_calc * R_s
+        e = np.exp(U / a)
+
+        df_dI = -I_sd * e * R_s / a - R_s / R_sh - 1
+        df_dx = np.column_stack((
+            np.ones_like(V),               # I_ph
+            -(e - 1),                      # I_sd
+            -I_sd * e * I_calc / a - I_calc / R_sh,  # R_s
+            U / R_sh**2,                   # R_sh
+            I_sd * e * U / (a * n),        # n
+        ))
+        J = -df_dx / df_dI[:, None]
+
+    return I_calc - I, J
+
+
+def levenberg_marquardt(x0, V=V_exp, I=I_exp, T=T_cell, bounds=None, max_nfe=100, tol=1e-10,
+                        damping=1e-3):
+    """
+    Tek diyot modeli için sınırlı (projeksiyonlu) Levenberg–Marquardt yerel arama.
+    Parametreler arama aralığına göre ölçeklenir (I_sd ile R_sh arasında ~8 mertebe fark var)
+    ve sönümleme Marquardt'ın diag(J^T J) ölçeklemesiyle uygulanır.
+    :param x0: Başlangıç noktası [I_ph, I_sd, R_s, R_sh, n]
+    :param bounds: [(min, max), ...] sınırları; None ise sadece fiziksel alt sınırlar
+    :param max_nfe: Model değerlendirme (artık + Jacobian) bütçesi
+    :param tol: Göreli maliyet iyileşmesi bu değerin altına düşünce durur
+    :param damping: Başlangıç sönümleme katsayısı (lambda)
+    :return: (x, rmse, nfe)
+    """
+    if bounds is None:
+        lb, ub = PHYSICAL_LB, np.full(5, np.inf)
+        scale = np.maximum(np.abs(np.asarray(x0, dtype=float)), PHYSICAL_LB + 1e-12)
+    else:
+        lb, ub = np.array(bounds, dtype=float).T
+        scale = ub - lb
+
+    x = np.clip(np.asarray(x0, dtype=float), lb, ub)
+    r, J = residual_jacobian(x, V, I, T)
+    nfe = 1
+    cost = r @ r
+    if not np.isfinite(cost):
+        return x, np.inf, nfe
+
+    lam = damping
+    while nfe < max_nfe:
+        Js = J * scale
+        A = Js.T @ Js
+        g = Js.T @ r
+        D = np.maximum(np.diag(A), 1e-12)
+
+        # Sınıra dayanmış ve gradyanı dışarı iten parametreler bu adımda sabit tutulur
+        # (aksi halde kırpılan adımlar zikzak yapar)
+        free = ~(((x <= lb) & (g > 0)) | ((x >= ub) & (g < 0)))
+        if not free.any():
+            break
+
+        step = np.zeros_like(x)
+        try:
+            step[free] = np.linalg.solve(A[np.ix_(free, free)] + lam * np.diag(D[free]), -g[free])
+        except np.linalg.LinAlgError:
+            break
+
+        x_new = np.clip(x + step * scale, lb, ub)
+        r_new, J_new = residual_jacobian(x_new, V, I, T)
+        nfe += 1
+        cost_new = r_new @ r_new
+
+        if np.isfinite(cost_new) and cost_new < cost:
+            converged = (cost - cost_new) <= tol * cost
+            x, r, J, cost = x_new, r_new, J_new, cost_new
+            lam = max(lam / 3.0, 1e-12)
+            if converged:
+                break
+        else:
+            # Reddedilen adım: güven bölgesini daralt
+            lam *= 4.0
+            if lam > 1e12:
+                break
+
+    return x, np.sqrt(cost / len(r)), nfe
+
+
+def _model_data(objective_func):
+    """
+    Maliyet fonksiyonunun uydurduğu ölçüm verisi (V, I, T).
+    - Kendi eğrisini taşıyan nesneler (SingleDiodeCost): .V, .I, .T
+    - functools.partial: V / I / T anahtar kelime argümanları (verilmeyenler sarılan fonksiyondan)
+    - Sarmalayıcılar (ör. CachedObjective): .func zinciri izlenir
+    - solar_pv_cost / solar_pv_cost_batch / solar_pv_cost_lambertw: modüldeki R.T.C. France verisi
+    Veri belirlenemezse ValueError verir (yanlış eğriyi sessizce optimize etmemek için).
+    """
+    data = {}
+    func = objective_func
+    while func is not None:
+        if hasattr(func, "V") and hasattr(func, "I"):
+            for name in ("V", "I", "T"):
+                data.setdefault(name, getattr(func, name, T_cell if name == "T" else None))
+            break
+        if isinstance(func, functools.partial):
+            for name in ("V", "I", "T"):
+                if func.keywords.get(name) is not None:
+                    data.setdefault(name, func.keywords[name])
+        elif func in _DEFAULT_DATA_OBJECTIVES:
+            data.setdefault("V", V_exp)
+            data.setdefault("I", I_exp)
+            data.setdefault("T", T_cell)
+            break
+        func = getattr(func, "func", None)
+
+    if "V" not in data or "I" not in data:
+        raise ValueError("Cannot determine the measured I-V data of the objective; "
+                         "pass data=(V, I, T) to refine_population / MemeticRefiner")
+    return data["V"], data["I"], data.get("T", T_cell)
+
+
+def refine_population(optimizer, top_k=1, max_nfe=50, data=None):
+    """
+    BBO popülasyonundaki en iyi top_k kunduzu Levenberg–Marquardt ile parlatır (memetik adım).
+    İyileşen çözüm optimizatörün kendi maliyet fonksiyonuyla yeniden değerlendirilir ve
+    sadece gerçekten daha iyiyse popülasyona yazılır; böylece raporlanan en iyi fitness her
+    zaman amaç fonksiyonunun değeridir. Harcanan model değerlendirmeleri optimizer.nfe'ye eklenir.
+    :param optimizer: population, fitness, best_solution, best_fitness alanları olan optimizatör (BBO)
+    :param data: (V, I, T) ölçüm verisi; None ise maliyet fonksiyonundan çıkarılır (bkz. _model_data)
+    :return: Harcanan toplam değerlendirme sayısı
+    """
+    V, I, T = _model_data(optimizer.func) if data is None else data
+    bounds = list(zip(optimizer.lb, optimizer.ub))
+    spent = 0
+
+    for i in np.argsort(optimizer.fitness)[:top_k]:
+        x, _, nfe = levenberg_marquardt(optimizer.population[i], V, I, T, bounds, max_nfe)
+        optimizer.nfe += nfe
+        spent += nfe
+
+        fitness = optimizer._evaluate(x[None, :])[0]
+        spent += 1
+        if fitness < optimizer.fitness[i]:
+            optimizer.population[i] = x
+            optimizer.fitness[i] = fitness
+            # Çok sadakatli ön elemede ebeveyn eşiği güncel konumun ucuz tahmini olmalı
+            if getattr(optimizer, "multifidelity", False):
+                optimizer.fitness_low[i] = optimizer._evaluate_low(x[None, :])[0]
+            if fitness < optimizer.best_fitness:
+                optimizer.best_fitness = fitness
+                optimizer.best_solution = x.copy()
+
+    return spent
+
+
+class MemeticRefiner:
+    """
+    Optimizasyon sırasında her `every` nesilde bir refine_population çağıran callback.
+    callbacks=[MemeticRefiner(...)] ile BBO'ya verilir.
+    """
+
+    def __init__(self, every=25, top_k=1, max_nfe=50, data=None):
+        self.every = every
+        self.top_k = top_k
+        self.max_nfe = max_nfe
+        self.data = data
+
+    def __call__(self, optimizer, info):
+        # info["iteration"] 1 tabanlıdır
+        if info["iteration"] % self.every == 0:
+            refine_population(optimizer, self.top_k, self.max_nfe, self.data)
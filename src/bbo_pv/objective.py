@@ -0,0 +1,220 @@
+import functools
+import hashlib
+import types
+from collections import OrderedDict
+
+import numpy as np
+
+
+def batch_objective(func):
+    """
+    Bir maliyet fonksiyonunu "batch" (toplu) fonksiyon olarak işaretler.
+    İşaretli fonksiyonlar tek satır yerine (pop, dim) matris alır ve (pop,) fitness vektörü döndürür.
+    """
+    func.vectorized = True
+    return func
+
+
+def is_vectorized(func):
+    """
+    Fonksiyonun batch protokolünü destekleyip desteklemediğini kontrol eder.
+    functools.partial ile sarılmış fonksiyonlar da desteklenir. Zincirde vectorized niteliğini
+    taşıyan ilk nesne belirleyicidir (ör. CachedObjective(batch_fn, vectorized=False) satır bazlıdır).
+    """
+    while func is not None:
+        if hasattr(func, 'vectorized'):
+            return bool(func.vectorized)
+        func = getattr(func, 'func', None)
+    return False
+
+
+def is_multifidelity(func):
+    """
+    Fonksiyonun çok sadakatli (multi-fidelity) protokolü destekleyip desteklemediğini kontrol eder:
+    func(X) tam sadakatli değeri, func.low(X) ise ucuz bir tahmini verir.
+    low her zaman batch çalışır ((pop, dim) -> (pop,)).
+    """
+    return callable(getattr(func, 'low', None))
+
+
+def _describe(value):
+    """
+    objective_key için bir argüman/alan değerinin JSON'a yazılabilir, kararlı tanımı.
+    Diziler içerik özetiyle (sha1) temsil edilir; böylece farklı ölçüm eğrileri ayrışır.
+    """
+    if isinstance(value, np.ndarray):
+        data = np.ascontiguousarray(value)
+        return {"array": hashlib.sha1(data.tobytes()).hexdigest()[:16],
+                "shape": list(data.shape), "dtype": str(data.dtype)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, dict):
+        return {str(k): _describe(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_describe(v) for v in value]
+    if callable(value):
+        return objective_key(value)
+    return repr(value)
+
+
+def objective_key(func):
+    """
+    Bir maliyet fonksiyonunun kimliği (sonuç deposu ve checkpoint anahtarları için).
+    - Fonksiyonda objective_key niteliği varsa o kullanılır (açık anahtar)
+    - functools.partial: sarılan fonksiyon + args + keywords
+    - Düz fonksiyon / metod: modül ve tam ad (metodlarda nesnenin anahtarı da eklenir)
+    - Çağrılabilir nesne (ör. SingleDiodeCost): sınıf adı + "_" ile başlamayan alanları
+      (solver, ölçüm dizilerinin özeti...)
+    Aynı isimli ama farklı ayarlı amaç fonksiyonları böylece aynı anahtarı paylaşmaz.
+    """
+    explicit = getattr(func, "objective_key", None)
+    if explicit is not None and not callable(explicit):
+        return explicit
+    if isinstance(func, functools.partial):
+        return {"partial": objective_key(func.func), "args": _describe(list(func.args)),
+                "keywords": _describe(func.keywords)}
+    if isinstance(func, types.MethodType):
+        return {"method": func.__func__.__qualname__, "self": objective_key(func.__self__)}
+    if isinstance(func, (types.FunctionType, types.BuiltinFunctionType, type)):
+        return f"{func.__module__}.{func.__qualname__}"
+    cls = type(func)
+    state = {name: value for name, value in vars(func).items() if not name.startswith("_")}
+    return {"class": f"{cls.__module__}.{cls.__qualname__}", "state": _describe(state)}
+
+
+def evaluate_population(func, X, vectorized=False):
+    """
+    Bir popülasyonun tamamını değerlendirir.
+    :param func: Maliyet fonksiyonu
+    :param X: (pop, dim) aday matrisi
+    :param vectorized: True ise X tek çağrıda fonksiyona verilir, değilse satır satır hesaplanır
+    :return: (pop,) fitness vektörü
+    """
+    if vectorized:
+        fitness = np.asarray(func(X), dtype=float).reshape(-1)
+        if fitness.shape[0] != X.shape[0]:
+            raise ValueError(
+                f"Batch objective returned {fitness.shape[0]} values for {X.shape[0]} candidates"
+            )
+        return fitness
+    return np.array([func(x) for x in X], dtype=float)
+
+
+class CachedObjective:
+    """
+    Maliyet fonksiyonu etrafında sınırlı boyutlu (LRU) bir değerlendirme önbelleği.
+    BBO'da yerinde kalan mimarlar ve sınıra kırpılan (clamp) aynı vektörler tekrar hesaplanmaz.
+    Hem satır bazlı hem batch fonksiyonlarla çalışır; sarılan fonksiyonun protokolünü korur:
+    vectorized açıkça tutulur, ucuz tahmin (low) varsa olduğu gibi iletilir (önbelleğe alınmaz).
+    """
+
+    def __init__(self, func, maxsize=100000, quantum=None, vectorized=None):
+        """
+        :param func: Sarılacak maliyet fonksiyonu
+        :param maxsize: Önbellekte tutulacak en fazla kayıt (aşılınca en eski kullanılan silinir)
+        :param quantum: None ise anahtar vektörün tam byte'larıdır; sayı/vektör verilirse
+                        x / quantum yuvarlanarak anahtar üretilir (yakın adaylar aynı kabul edilir)
+        :param vectorized: Sarılan fonksiyon batch mi? None ise otomatik algılanır
+        """
+        self.func = func
+        self.maxsize = maxsize
+        self.quantum = None if quantum is None else np.asarray(quantum, dtype=float)
+        self.vectorized = is_vectorized(func) if vectorized is None else bool(vectorized)
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+
+    def _key(self, x):
+        x = np.asarray(x, dtype=float)
+        if self.quantum is not None:
+            return np.round(x / self.quantum).astype(np.int64).tobytes()
+        return np.ascontiguousarray(x).tobytes()
+
+    def _store(self, key, value):
+        self._cache[key] = value
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def _lookup(self, key):
+        value = self._cache.get(key)
+        if value is not None:
+            self._cache.move_to_end(key)
+        return value
+
+    def __call__(self, X):
+        if not self.vectorized:
+            key = self._key(X)
+            value = self._lookup(key)
+            if value is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+            value = float(self.func(X))
+            self._store(key, value)
+            return value
+
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        fitness = np.empty(X.shape[0])
+        keys = [self._key(x) for x in X]
+
+        # Önbellekte olmayanlar (aynı nesil içindeki kopyalar tek sefer hesaplanır)
+        pending = OrderedDict()
+        for i, key in enumerate(keys):
+            value = self._lookup(key)
+            if value is not None:
+                self.hits += 1
+                fitness[i] = value
+            elif key in pending:
+                self.hits += 1
+                pending[key].append(i)
+            else:
+                self.misses += 1
+                pending[key] = [i]
+
+        if pending:
+            rows = [idx[0] for idx in pending.values()]
+            values = evaluate_population(self.func, X[rows], vectorized=True)
+            for (key, idx), value in zip(pending.items(), values):
+                fitness[idx] = value
+                self._store(key, float(value))
+        return fitness
+
+    @property
+    def low(self):
+        # Sarılan fonksiyonda low yoksa AttributeError -> is_multifidelity False döner
+        return self.func.low
+
+    @property
+    def objective_key(self):
+        """
+        Sonuç deposu / checkpoint anahtarı. Tam anahtarlı önbellek sonucu değiştirmediği için
+        sarılan fonksiyonunkiyle aynıdır (hit/miss sayaçları anahtara girmez); quantum verilmişse
+        yakın adaylar birleştiği için anahtara eklenir.
+        """
+        if self.quantum is None:
+            return objective_key(self.func)
+        return {"cached": objective_key(self.func), "quantum": _describe(self.quantum)}
+
+    @property
+    def hit_rate(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def cache_info(self):
+        """
+        Önbellek istatistikleri (hit/miss sayaçları ve doluluk).
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "size": len(self._cache),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,280 @@
+import json
+import os
+import time
+
+import numpy as np
+from .objective import evaluate_population, is_vectorized, is_multifidelity
+from .termination import StoppingCriteria, MAX_ITER, population_diversity
+from .callbacks import ProgressPrinter
+from .initializers import make_initializer
+
+
+class BaseOptimizer:
+    """
+    BBO, PSO ve GWO için ortak altyapı (sınırlar, popülasyon boyutu, fitness değerlendirme).
+    Alt sınıflar initialize(), step(t) ve _result() metodlarını tanımlar.
+    """
+
+    # Checkpoint'e yazılacak algoritmaya özel durum alanları (alt sınıflar tanımlar)
+    _state_fields = ()
+
+    def __init__(self, objective_func, bounds, pop_size=30, max_iter=500, vectorized=None, seed=None, rng=None,
+                 stopping=None, callbacks=None, verbose=False, checkpoint_path=None,
+                 checkpoint_every=None, init=None):
+        """
+        :param objective_func: Optimize edilecek maliyet fonksiyonu (Cost Function)
+        :param bounds: Değişkenlerin alt ve üst sınırları (lb, ub) -> [(min, max), (min, max)...]
+        :param pop_size: Popülasyon sayısı
+        :param max_iter: Maksimum iterasyon sayısı
+        :param vectorized: True ise her neslin adayları tek bir (pop, dim) dizi olarak fonksiyona verilir.
+                           None ise fonksiyonun @batch_objective ile işaretli olup olmadığına bakılır.
+        :param seed: np.random.Generator için tohum (int veya np.random.SeedSequence)
+        :param rng: Hazır bir np.random.Generator (verilirse seed yok sayılır)
+        :param stopping: Ek durma kriterleri (termination.StoppingCriteria); max_iter her zaman geçerlidir
+        :param callbacks: Her nesil sonunda callback(optimizer, info) şeklinde çağrılan fonksiyonlar.
+                          info: iteration, phase, best_fitness, nfe, nfe_low, eval_time, op_time,
+                          acceptance_rate, diversity. Callback True döndürürse optimizasyon durur.
+        :param verbose: True ise her 50 nesilde bir ilerleme yazdırılır
+        :param checkpoint_path: Optimizatörün tam durumunun yazılacağı .npz dosyası
+        :param checkpoint_every: Kaç nesilde bir checkpoint alınacağı (None -> sadece durunca)
+        :param init: Başlangıç popülasyonu stratejisi: "uniform" (varsayılan), "halton", "sobol", "lhs",
+                     "obl" veya initializers.Initializer (opposition / log_scale seçenekleriyle)
+        """
+        self.func = objective_func
+        self.bounds = np.array(bounds)
+        self.dim = len(bounds)
+        self.pop_size = pop_size
+        self.max_iter = max_iter
+        self.vectorized = is_vectorized(objective_func) if vectorized is None else bool(vectorized)
+        
+        # Her optimizatörün kendi rastgele sayı üreteci olur (global np.random durumu kullanılmaz).
+        # Böylece koşular tekrarlanabilir ve paralel çalıştırılabilir.
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+
+        # Sınırları ayır (Lower Bound ve Upper Bound vektörleri)
+        self.lb = self.bounds[:, 0]
+        self.ub = self.bounds[:, 1]
+        self.initializer = make_initializer(init)
+        
+        # Durma kriterleri ve sayaçlar
+        self.stopping = stopping if stopping is not None else StoppingCriteria()
+        self.nfe = 0              # Harcanan (tam sadakatli) fonksiyon değerlendirme sayısı
+        self.nfe_low = 0          # Düşük sadakatli ön değerlendirme sayısı (çok sadakatli amaç fonksiyonlarında)
+        self.iterations = 0       # Tamamlanan nesil sayısı
+        self.stop_reason = None   # Neden durduğu (termination modülündeki sabitler)
+        
+        # Nesil sonu gözlemcileri (callback / observer)
+        self.callbacks = list(callbacks) if callbacks is not None else []
+        if verbose:
+            self.callbacks.append(ProgressPrinter(every=50))
+        self._gen_start = 0.0
+        self._gen_eval_time = 0.0
+        
+        # Checkpoint ayarları
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+
+    def optimize(self, resume=False):
+        """
+        Algoritmanın ana döngüsünü çalıştırır.
+        :param resume: True ise ve checkpoint dosyası varsa kaldığı nesilden devam eder.
+                       Devam eden koşu, hiç kesilmemiş bir koşuyla birebir aynı sonucu verir.
+        :return: (best_solution, best_fitness, convergence_curve)
+        """
+        if resume and self.checkpoint_path is not None and os.path.exists(self.checkpoint_path):
+            self.load_checkpoint(self.checkpoint_path)
+            if self.stop_reason is not None:
+                # Koşu zaten tamamlanmış
+                return self._result()
+            self._gen_start = time.perf_counter()
+            self._gen_eval_time = 0.0
+        else:
+            self.initialize()
+        
+        for t in range(self.iterations, self.max_iter):
+            if self.step(t):
+                break
+        
+        return self._result()
+
+    def initialize(self):
+        """
+        Sayaçları sıfırlar (alt sınıflar başlangıç popülasyonunu değerlendirmek için genişletir).
+        """
+        self._start()
+
+    def step(self, t):
+        """
+        t. nesli (0 tabanlı) çalıştırır. Durulması gerekiyorsa True döner.
+        """
+        raise NotImplementedError
+
+    def _result(self):
+        raise NotImplementedError
+
+    def save_checkpoint(self, path):
+        """
+        Optimizatörün tam durumunu (popülasyon, en iyiler, yakınsama eğrisi, sayaçlar,
+        RNG ve durma kriteri durumu) sıkıştırılmış .npz dosyasına yazar.
+        Yazma atomiktir: yarıda kesilirse eski checkpoint bozulmaz.
+        """
+        state = {f"state_{name}": np.asarray(getattr(self, name)) for name in self._state_fields}
+        state.update({
+            "convergence_curve": np.asarray(self.convergence_curve, dtype=float),
+            "pop_size": np.asarray(self.pop_size),
+            "max_iter": np.asarray(self.max_iter),
+            "dim": np.asarray(self.dim),
+            "nfe": np.asarray(self.nfe),
+            "nfe_low": np.asarray(self.nfe_low),
+            "iterations": np.asarray(self.iterations),
+            "stop_reason": np.asarray(self.stop_reason or ""),
+            "rng_state": np.asarray(json.dumps(self.rng.bit_generator.state)),
+            "stopping_state": np.asarray(json.dumps(self.stopping.get_state())),
+        })
+        state.update(self._extra_state())
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, **state)
+        os.replace(tmp_path, path)
+
+    def load_checkpoint(self, path):
+        """
+        save_checkpoint ile yazılmış durumu geri yükler.
+        Checkpoint farklı bir ayarla (pop_size, max_iter, dim) yazılmışsa ValueError verir.
+        """
+        with np.load(path) as data:
+            for name in ("pop_size", "max_iter", "dim"):
+                if name in data.files and int(data[name]) != getattr(self, name):
+                    raise ValueError(f"Checkpoint {path} was written with {name}={int(data[name])}, "
+                                     f"optimizer has {name}={getattr(self, name)}")
+            for name in self._state_fields:
+                value = data[f"state_{name}"]
+                setattr(self, name, value.item() if value.ndim == 0 else value.copy())
+            self.convergence_curve = list(data["convergence_curve"])
+            self.nfe = int(data["nfe"])
+            self.nfe_low = int(data["nfe_low"]) if "nfe_low" in data.files else 0
+            self.iterations = int(data["iterations"])
+            self.stop_reason = str(data["stop_reason"]) or None
+            self.rng.bit_generator.state = json.loads(str(data["rng_state"]))
+            self.stopping.reset(self.lb, self.ub)
+            self.stopping.set_state(json.loads(str(data["stopping_state"])))
+            self._restore_extra_state(data)
+
+    def _extra_state(self):
+        """
+        Alt sınıfların checkpoint'e ekleyeceği ek diziler (ör. vekil model arşivi).
+        """
+        return {}
+
+    def _restore_extra_state(self, data):
+        """
+        _extra_state ile yazılan dizileri geri yükler.
+        """
+
+    def _start(self):
+        """
+        optimize() başında sayaçları ve durma kriterlerini sıfırlar.
+        """
+        self.nfe = 0
+        self.nfe_low = 0
+        self.iterations = 0
+        self.stop_reason = None
+        self.stopping.reset(self.lb, self.ub)
+        self._gen_start = time.perf_counter()
+        self._gen_eval_time = 0.0
+
+    def _end_generation(self, t, best_fitness, population, phase=None, acceptance_rate=None):
+        """
+        t. nesil tamamlandıktan sonra çağrılır: callback'leri bilgilendirir ve
+        durma kriterlerini kontrol eder. Durulması gerekiyorsa True döner.
+        :param phase: Neslin geçtiği faz (BBO için "exploitation" / "exploration")
+        :param acceptance_rate: Seçimde kabul edilen çocukların oranı (varsa)
+        """
+        self.iterations = t + 1
+        
+        stop_requested = False
+        if self.callbacks:
+            elapsed = time.perf_counter() - self._gen_start
+            info = {
+                "iteration": t + 1,
+                "phase": phase,
+                "best_fitness": best_fitness,
+                "nfe": self.nfe,
+                "nfe_low": self.nfe_low,
+                "eval_time": self._gen_eval_time,
+                "op_time": max(0.0, elapsed - self._gen_eval_time),
+                "acceptance_rate": acceptance_rate,
+                "diversity": population_diversity(population, self.lb, self.ub),
+            }
+            for callback in self.callbacks:
+                stop_requested |= bool(callback(self, info))
+            # Callback'ler en iyi çözümü iyileştirmiş olabilir (ör. MemeticRefiner);
+            # durma kriterleri (hedef fitness) güncel değere bakar
+            best_fitness = min(best_fitness, self._result()[1])
+        
+        reason = "callback" if stop_requested else \
+            self.stopping.check(best_fitness, population, self.nfe, next_nfe=self.pop_size)
+        if reason is None and self.iterations >= self.max_iter:
+            reason = MAX_ITER
+        self.stop_reason = reason
+        
+        if self.checkpoint_path is not None and (
+                reason is not None or
+                (self.checkpoint_every and self.iterations % self.checkpoint_every == 0)):
+            self.save_checkpoint(self.checkpoint_path)
+        
+        # Bir sonraki neslin zamanlayıcıları (callback süresi nesle dahil edilmez)
+        self._gen_start = time.perf_counter()
+        self._gen_eval_time = 0.0
+        return reason is not None
+
+    def _initial_population(self):
+        """
+        Seçilen başlatma stratejisiyle (pop_size, dim) başlangıç popülasyonu.
+        """
+        return self.initializer.sample(self.pop_size, self.lb, self.ub, self.rng)
+
+    def _select_opposition(self, population):
+        """
+        Karşıtlık tabanlı öğrenme (OBL): popülasyon ve karşıtı birlikte değerlendirilir,
+        en iyi pop_size birey tutulur.
+        :return: (population, fitness)
+        """
+        candidates = np.vstack((population, self.initializer.opposite(population, self.lb, self.ub)))
+        fitness = self._evaluate(candidates)
+        keep = np.argsort(fitness, kind="stable")[:self.pop_size]
+        return candidates[keep], fitness[keep]
+
+    def _evaluate(self, X):
+        """
+        Aday matrisinin fitness değerlerini hesaplar (batch veya satır satır).
+        """
+        start = time.perf_counter()
+        fitness = evaluate_population(self.func, X, self.vectorized)
+        self._gen_eval_time += time.perf_counter() - start
+        self.nfe += len(X)
+        return fitness
+
+    @property
+    def multifidelity(self):
+        """
+        Amaç fonksiyonu ucuz bir tahmin (func.low) sunuyorsa True.
+        """
+        return is_multifidelity(self.func)
+
+    @property
+    def nfe_high(self):
+        """
+        Tam sadakatli değerlendirme sayısı (nfe ile aynı; max_nfe bütçesi bunu sayar).
+        """
+        return self.nfe
+
+    def _evaluate_low(self, X):
+        """
+        Adayların düşük sadakatli tahminleri (nfe_low sayacına eklenir).
+        """
+        start = time.perf_counter()
+        fitness = np.asarray(self.func.low(X), dtype=float).reshape(-1)
+        self._gen_eval_time += time.perf_counter() - start
+        self.nfe_low += len(X)
+        return fitness
@@ -0,0 +1,297 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from .bbo import BBO
+from .pso import PSO
+from .gwo import GWO
+from .objective import batch_objective
+from . import kernels
+from .benchmark_functions import solar_pv_cost, solar_pv_cost_batch, solar_pv_cost_lambertw
+from .config import DEFAULT_BOUNDS
+from .initializers import Initializer
+from .termination import StoppingCriteria, TARGET
+
+# --- AYARLAR ---
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json")
+TOLERANCE = 2.0          # Hız metrikleri baseline'dan bu oranda daha kötüyse hata sayılır
+QUALITY_TOLERANCE = 1.1  # Kalite metrikleri (sabit tohumlu NFE) gürültüsüzdür; dar bir tolerans yeterli
+REPEATS = 5              # Her ölçüm bu kadar tekrarlanır, en iyisi alınır (gürültüyü azaltır)
+
+COST_POP_SIZES = [100, 1000]
+OPT_POP_SIZES = [30, 100, 1000]
+OPT_DIMS = [5, 50]
+OPT_GENERATIONS = 50
+
+# "run" alt komutunun soğuk başlangıç bütçesi (yeni bir Python süreci, küçük bir koşu dahil)
+COLD_START_BUDGET = 2.0
+COLD_START_REPEATS = 3
+HEAVY_MODULES = ("pandas", "matplotlib")
+
+# Başlatma stratejileri: solar PV hedefine kadar harcanan NFE (medyan, tohumlar sabit)
+INIT_TARGET = 0.015
+INIT_RUNS = 20
+INIT_POP_SIZE = 30
+INIT_MAX_ITER = 200
+INIT_STRATEGIES = {
+    "uniform": None,
+    "halton": "halton",
+    "sobol": "sobol",
+    "lhs": "lhs",
+    "obl": "obl",
+    "sobol_log": Initializer("sobol", log_scale="auto"),
+    "sobol_obl_log": Initializer("sobol", opposition=True, log_scale="auto"),
+}
+
+bounds = DEFAULT_BOUNDS
+
+algorithms = {
+    "BBO": BBO,
+    "PSO": PSO,
+    "GWO": GWO
+}
+
+
+@batch_objective
+def trivial_objective(X):
+    # Optimizatör yükünü (overhead) ölçmek için neredeyse bedava bir fonksiyon
+    return np.sum(X * X, axis=1)
+
+
+def best_time(fn, repeats=REPEATS):
+    """
+    fn()'i repeats kez çalıştırır ve en kısa süreyi (saniye) döndürür.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def metric(value, unit, higher_is_better, kind="speed"):
+    """
+    :param kind: "speed" (süre / hız, TOLERANCE ile karşılaştırılır) veya
+                 "quality" (çözüm kalitesi, QUALITY_TOLERANCE ile karşılaştırılır)
+    """
+    return {"value": value, "unit": unit, "higher_is_better": higher_is_better, "kind": kind}
+
+
+def bench_cost_functions():
+    """
+    Maliyet fonksiyonunun saniyedeki değerlendirme sayısı (evals/sec).
+    """
+    results = {}
+    rng = np.random.default_rng(0)
+    lb, ub = np.array(bounds).T
+
+    X = rng.uniform(lb, ub, (200, len(bounds)))
+    elapsed = best_time(lambda: [solar_pv_cost(x) for x in X])
+    results["cost/scalar/newton/evals_per_sec"] = metric(len(X) / elapsed, "evals/s", True)
+
+    for pop in COST_POP_SIZES:
+        X = rng.uniform(lb, ub, (pop, len(bounds)))
+        for name, func in (("newton", solar_pv_cost_batch), ("lambertw", solar_pv_cost_lambertw)):
+            elapsed = best_time(lambda: func(X))
+            results[f"cost/batch/{name}/pop{pop}/evals_per_sec"] = metric(pop / elapsed, "evals/s", True)
+    return results
+
+
+def bench_optimizers():
+    """
+    Bedava bir amaç fonksiyonu ile her optimizatörün nesil başına yükü (saniye/nesil).
+    """
+    results = {}
+    for name, AlgoClass in algorithms.items():
+        for dim in OPT_DIMS:
+            for pop in OPT_POP_SIZES:
+                def run():
+                    optimizer = AlgoClass(trivial_objective, [(-5.0, 5.0)] * dim, pop, OPT_GENERATIONS, seed=0)
+                    optimizer.optimize()
+                elapsed = best_time(run)
+                key = f"optimizer/{name}/pop{pop}/dim{dim}/sec_per_generation"
+                results[key] = metric(elapsed / OPT_GENERATIONS, "s/gen", False)
+    return results
+
+
+def bench_cold_start():
+    """
+    Yeni bir süreçte "run" alt komutunun toplam süresi (içe aktarmalar + küçük bir koşu)
+    ve bu sırada yüklenen ağır modüller.
+    """
+    code = ("import sys; from bbo_pv.cli import main; "
+            "main(['run', '--pop-size', '10', '--max-iter', '2', '--quiet', '--no-refine']); "
+            f"print('HEAVY=' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    env = dict(os.environ)
+    src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (src_dir, env.get("PYTHONPATH"))))
+
+    heavy = []
+    def run():
+        out = subprocess.run([sys.executable, "-c", code], env=env, check=True, capture_output=True, text=True)
+        heavy[:] = [m for m in out.stdout.strip().splitlines()[-1][len("HEAVY="):].split(",") if m]
+
+    elapsed = best_time(run, COLD_START_REPEATS)
+    return {"cli/run/cold_start_sec": metric(elapsed, "s", False)}, heavy
+
+
+def bench_initializers():
+    """
+    Her başlatma stratejisi için hedef fitness'a ulaşana kadar harcanan NFE (INIT_RUNS koşunun medyanı).
+    Hedefe ulaşamayan koşular bütçe (pop_size * (max_iter + 1)) ile sayılır.
+    :return: (metrikler, {algoritma: {strateji: başarı oranı}})
+    """
+    results = {}
+    success = {}
+    budget = INIT_POP_SIZE * (INIT_MAX_ITER + 1)
+    for name, AlgoClass in algorithms.items():
+        success[name] = {}
+        for label, init in INIT_STRATEGIES.items():
+            nfe = []
+            for seed in range(INIT_RUNS):
+                optimizer = AlgoClass(solar_pv_cost_batch, bounds, INIT_POP_SIZE, INIT_MAX_ITER, seed=seed, init=init,
+                                      stopping=StoppingCriteria(target_fitness=INIT_TARGET))
+                optimizer.optimize()
+                nfe.append(optimizer.nfe if optimizer.stop_reason == TARGET else budget)
+            nfe = np.array(nfe)
+            results[f"init/{name}/{label}/nfe_to_target"] = metric(float(np.median(nfe)), "evals", False, "quality")
+            success[name][label] = float(np.mean(nfe < budget))
+    return results, success
+
+
+def print_initializers(current):
+    """
+    Başlatma stratejilerini uniform'a göre oranlarıyla yazdırır.
+    """
+    print(f"\nBaşlatma stratejileri: RMSE < {INIT_TARGET} için NFE (medyan, {INIT_RUNS} koşu)")
+    success = current["meta"]["init_success_rate"]
+    for name in algorithms:
+        uniform = current["results"][f"init/{name}/uniform/nfe_to_target"]["value"]
+        for label in INIT_STRATEGIES:
+            value = current["results"][f"init/{name}/{label}/nfe_to_target"]["value"]
+            print(f"  {name} {label:<14s} {value:8.0f} NFE  ({value / uniform:5.2f}x uniform, "
+                  f"başarı {success[name][label]:.0%})")
+
+
+def run_benchmarks():
+    results = {}
+    results.update(bench_cost_functions())
+    results.update(bench_optimizers())
+    init_results, init_success = bench_initializers()
+    results.update(init_results)
+    cold_start, heavy = bench_cold_start()
+    results.update(cold_start)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "kernels": "numba" if kernels.USE_NUMBA else "numpy",
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "cold_start_heavy_modules": heavy,
+            "init_success_rate": init_success,
+        },
+        "results": results,
+    }
+
+
+def backend_baseline(baseline, backend):
+    """
+    Baseline dosyası her kernel arka ucu ("numba" / "numpy") için ayrı ölçümler tutar:
+    {"backends": {arka uç: run_benchmarks çıktısı}}. Bu arka ucun ölçümleri yoksa None.
+    """
+    return baseline.get("backends", {}).get(backend)
+
+
+def compare(current, baseline, tolerance=TOLERANCE, quality_tolerance=QUALITY_TOLERANCE):
+    """
+    Mevcut ölçümleri aynı kernel arka ucuyla alınmış baseline ile karşılaştırır.
+    Hız metrikleri tolerance, kalite metrikleri quality_tolerance ile sınırlanır.
+    :return: Eşiği aşan (kötüleşen) metriklerin listesi -> [(isim, baseline, mevcut, oran, eşik)]
+    """
+    regressions = []
+    for key, base in baseline["results"].items():
+        if key not in current["results"]:
+            continue
+        value = current["results"][key]["value"]
+        # Oran > 1 her zaman "daha kötü" anlamına gelecek şekilde normalize edilir
+        if base["higher_is_better"]:
+            ratio = base["value"] / value if value > 0 else float("inf")
+        else:
+            ratio = value / base["value"] if base["value"] > 0 else float("inf")
+        limit = quality_tolerance if base.get("kind") == "quality" else tolerance
+        if ratio > limit:
+            regressions.append((key, base["value"], value, ratio, limit))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Performance benchmarks for the cost function and optimizers")
+    parser.add_argument("--output", default="perf_results.json", help="JSON file for the current measurements")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="Stored baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="Allowed slowdown factor before a speed metric counts as a regression")
+    parser.add_argument("--quality-tolerance", type=float, default=QUALITY_TOLERANCE,
+                        help="Allowed factor for quality metrics (NFE to target)")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with this run")
+    parser.add_argument("--cold-start-budget", type=float, default=COLD_START_BUDGET,
+                        help="Maximum seconds for a fresh 'run' subcommand")
+    args = parser.parse_args(argv)
+
+    current = run_benchmarks()
+    with open(args.output, "w") as f:
+        json.dump(current, f, indent=2)
+
+    for key, m in current["results"].items():
+        print(f"{key:60s} {m['value']:12.4g} {m['unit']}")
+    print_initializers(current)
+    print(f"\n✅ Ölçümler '{args.output}' dosyasına kaydedildi.")
+
+    # Soğuk başlangıç bütçesi baseline'dan bağımsız, mutlak bir sınırdır
+    cold_start = current["results"]["cli/run/cold_start_sec"]["value"]
+    heavy = current["meta"]["cold_start_heavy_modules"]
+    if cold_start > args.cold_start_budget or heavy:
+        print(f"\n❌ 'run' soğuk başlangıcı bütçeyi aşıyor: {cold_start:.2f}s "
+              f"(bütçe {args.cold_start_budget:.2f}s), yüklenen ağır modüller: {heavy or '-'}")
+        return 1
+
+    # Numba ve NumPy yollarının süreleri ayrı tutulur (biri diğerinin baseline'ı olamaz)
+    backend = current["meta"]["kernels"]
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        baseline.setdefault("backends", {})[backend] = current
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Baseline güncellendi ({backend}): {args.baseline}")
+        return 0
+
+    reference = backend_baseline(baseline, backend)
+    if reference is None:
+        print(f"'{backend}' arka ucu için baseline bulunamadı ({args.baseline}); karşılaştırma atlandı.")
+        return 0
+
+    regressions = compare(current, reference, args.tolerance, args.quality_tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} metrik '{backend}' baseline'ından daha kötü:")
+        for key, base, value, ratio, limit in regressions:
+            print(f"  {key}: baseline={base:.4g} current={value:.4g} ({ratio:.2f}x, eşik {limit}x)")
+        return 1
+
+    print(f"\n✅ Tüm metrikler '{backend}' baseline toleransı içinde "
+          f"(hız {args.tolerance}x, kalite {args.quality_tolerance}x).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+import sys
+
+import numpy as np
+
+from .bbo import BBO
+from .benchmark_functions import OBJECTIVES, diode_current, V_exp, I_exp
+from .objective import CachedObjective
+from .run_scheduler import run_campaign
+from .results_store import ResultsStore
+
+
+def main(config):
+    """
+    "plot" alt komutu: BBO'nun bulduğu parametrelerle I-V eğrisini ölçümlerle birlikte çizer.
+    "stats" kampanyasının BBO 0. koşusu kullanılır; depoda varsa optimizatör yeniden çalıştırılmaz.
+    """
+    # matplotlib sadece grafik komutlarında yüklenir
+    import matplotlib
+    if not config["show"]:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    solver = config["solver"]  # Akım çözücüsü: "newton" (iteratif) veya "lambertw" (kapalı form)
+    output = config["output"] or "Solar_PV_Result_Consistent.png"
+
+    print("🔄 Tabloyla uyumlu grafik üretiliyor...")
+    objective = OBJECTIVES[solver]
+    if config["cache"]:
+        objective = CachedObjective(objective)
+    campaign = run_campaign({"BBO": BBO}, objective, config["bounds"], config["pop_size"],
+                            config["max_iter"], 1, seed=config["seed"], max_workers=1,
+                            store=ResultsStore(config["results_dir"]))
+    best_sol = campaign["BBO"][0].best_solution
+
+    # --- TAHMİN EĞRİSİNİ HESAPLA ---
+    # Tüm gerilim noktaları tek vektörel çağrıda çözülür
+    I_pred = diode_current(best_sol, V_exp, solver=solver)
+
+    # RMSE'yi tekrar hesapla (Kontrol amaçlı)
+    final_rmse = np.sqrt(np.mean((np.array(I_pred) - I_exp)**2))
+
+    # --- ÇİZİM ---
+    plt.figure(figsize=(10, 6))
+    plt.scatter(V_exp, I_exp, color='red', label='Experimental Data', zorder=5)
+    plt.plot(V_exp, I_pred, color='blue', linewidth=2, label=f'BBO Prediction (RMSE={final_rmse:.4f})')
+
+    plt.title('I-V Characteristic Curve (BBO Optimized)', fontsize=14)
+    plt.xlabel('Voltage (V)', fontsize=12)
+    plt.ylabel('Current (A)', fontsize=12)
+    plt.legend(fontsize=11)
+    plt.grid(True, linestyle='--', alpha=0.6)
+
+    plt.savefig(output, dpi=300)
+    if config["show"]:
+        plt.show()
+
+    print(f"Bu grafikteki RMSE değeri ({final_rmse:.4f}")
+    return 0
+
+
+if __name__ == "__main__":
+    from .cli import main as cli_main
+    sys.exit(cli_main(["plot"] + sys.argv[1:]))
@@ -0,0 +1,87 @@
+import numpy as np
+from .optimizer_base import BaseOptimizer
+
+class PSO(BaseOptimizer):
+    # Checkpoint'e yazılan durum
+    _state_fields = ("X", "V", "P_best", "P_best_fit", "fitness", "g_best", "g_best_fit")
+    
+    def __init__(self, objective_func, bounds, pop_size=30, max_iter=500, **kwargs):
+        super().__init__(objective_func, bounds, pop_size, max_iter, **kwargs)
+        
+        # Parametreler (Standart PSO ayarları)
+        self.w = 0.7  # Atalet ağırlığı (Inertia weight)
+        self.c1 = 1.5 # Bilişsel katsayı
+        self.c2 = 1.5 # Sosyal katsayı
+        
+        # Parçacıkları ve Hızları Başlat
+        self.X = self._initial_population()
+        self.V = np.zeros_like(self.X)
+        
+        # En iyi konumlar (Personal Best)
+        self.P_best = self.X.copy()
+        self.fitness = np.full(self.pop_size, float('inf'))
+        self.P_best_fit = np.full(self.pop_size, float('inf'))
+        
+        # Global En İyi (Global Best)
+        self.g_best = None
+        self.g_best_fit = float('inf')
+        self.convergence_curve = []
+        self._seeded = False  # Sürü initialize() içinde değerlendirildiyse ilk nesil tekrar değerlendirmez
+
+    def initialize(self):
+        super().initialize()
+        # OBL: sürü, kendisi ve karşıtı arasından en iyi parçacıklarla başlar.
+        # Seçimde hesaplanan fitness'lar kişisel/global en iyileri doğrudan başlatır.
+        self._seeded = self.initializer.opposition
+        if self._seeded:
+            self.X, self.fitness = self._select_opposition(self.X)
+            self.P_best = self.X.copy()
+            self.P_best_fit = self.fitness.copy()
+            self.g_best_fit = self.fitness[0]
+            self.g_best = self.X[0].copy()
+
+    def step(self, t):
+        """
+        t. iterasyonu (0 tabanlı) çalıştırır. Durulması gerekiyorsa True döner.
+        """
+        if self._seeded:
+            # İlk nesil: sürü ve en iyiler initialize() içinde zaten değerlendirildi
+            self._seeded = False
+            improved = np.ones(self.pop_size, dtype=bool)
+        else:
+            # Sınır kontrolü
+            self.X = np.clip(self.X, self.lb, self.ub)
+            
+            # Fitness hesapla (tüm sürü tek seferde)
+            self.fitness = self._evaluate(self.X)
+            
+            # Personal Best Güncelleme
+            improved = self.fitness < self.P_best_fit
+            self.P_best_fit[improved] = self.fitness[improved]
+            self.P_best[improved] = self.X[improved]
+            
+            # Global Best Güncelleme
+            best_idx = np.argmin(self.fitness)
+            if self.fitness[best_idx] < self.g_best_fit:
+                self.g_best_fit = self.fitness[best_idx]
+                self.g_best = self.X[best_idx].copy()
+        
+        # Hız ve Pozisyon Güncelleme
+        r1 = self.rng.random((self.pop_size, self.dim))
+        r2 = self.rng.random((self.pop_size, self.dim))
+        
+        # PSO Hız Denklemi
+        self.V = self.w * self.V + \
+                 self.c1 * r1 * (self.P_best - self.X) + \
+                 self.c2 * r2 * (self.g_best - self.X)
+        
+        # Pozisyon Güncelleme
+        self.X = self.X + self.V
+        
+        self.convergence_curve.append(self.g_best_fit)
+        
+        # Callback'ler ve durma kriterleri
+        return self._end_generation(t, self.g_best_fit, self.X, acceptance_rate=improved.mean())
+
+    def _result(self):
+        return self.g_best, self.g_best_fit, self.convergence_curve
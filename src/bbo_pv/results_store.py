@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+def config_hash(config):
+    """
+    Ayar sözlüğünden kısa ve kararlı bir özet (hash) üretir.
+    Aynı ayarlar (anahtar sırası fark etmeksizin) her zaman aynı hash'i verir.
+    """
+    text = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def seed_key(seed):
+    """
+    Tohumu dosya adı olarak kullanılabilecek bir anahtara çevirir.
+    SeedSequence için entropy ve spawn_key birlikte kullanılır.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return "-".join(str(v) for v in (seed.entropy,) + tuple(seed.spawn_key))
+    return str(seed)
+
+
+def log_downsample(curve, max_points=200):
+    """
+    Uzun bir yakınsama eğrisini logaritmik aralıklı noktalarla seyreltir
+    (log ölçekli x ekseninde eğrinin şekli korunur, son nokta her zaman dahildir).
+    :return: (iterasyon numaraları (1 tabanlı), değerler)
+    """
+    curve = np.asarray(curve)
+    n = len(curve)
+    if n <= max_points:
+        return np.arange(1, n + 1), curve
+    idx = np.unique(np.round(np.logspace(0, np.log10(n), max_points)).astype(int)) - 1
+    return idx + 1, curve[idx]
+
+
+class ResultsStore:
+    """
+    (algoritma, ayar hash'i, tohum) anahtarlı kalıcı koşu sonuçları deposu.
+    Her koşu bittiğinde en iyi vektörü, fitness'ı ve yakınsama eğrisi ayrı bir .npz
+    dosyasına yazılır; küçük bir index.jsonl dosyası tüm koşuları listeler.
+    Grafik ve istatistik betikleri optimizatörleri yeniden çalıştırmadan buradan okur.
+    """
+
+    def __init__(self, root="results"):
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        self._index = None
+
+    def _run_path(self, algorithm, cfg_hash, seed):
+        return os.path.join(self.root, algorithm, cfg_hash, f"seed_{seed_key(seed)}.npz")
+
+    def _load_index(self):
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.index_path):
+                with open(self.index_path) as f:
+                    for line in f:
+                        if line.strip():
+                            record = json.loads(line)
+                            self._index[(record["algorithm"], record["config_hash"], record["seed"])] = record
+        return self._index
+
+    def has(self, algorithm, config, seed):
+        cfg_hash = config if isinstance(config, str) else config_hash(config)
+        return (algorithm, cfg_hash, seed_key(seed)) in self._load_index()
+
+    def append(self, algorithm, config, seed, best_solution, best_fitness, convergence_curve,
+               nfe=None, stop_reason=None):
+        """
+        Tamamlanan bir koşuyu depoya ekler.
+        """
+        cfg_hash = config_hash(config)
+        path = self._run_path(algorithm, cfg_hash, seed)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez_compressed(f, best_solution=np.asarray(best_solution, dtype=float),
+                                best_fitness=np.asarray(best_fitness, dtype=float),
+                                convergence_curve=np.asarray(convergence_curve, dtype=float))
+        os.replace(tmp_path, path)
+
+        record = {
+            "algorithm": algorithm,
+            "config_hash": cfg_hash,
+            "seed": seed_key(seed),
+            "best_fitness": float(best_fitness),
+            "nfe": None if nfe is None else int(nfe),
+            "stop_reason": stop_reason,
+            "config": config,
+            "path": os.path.relpath(path, self.root),
+        }
+        with open(self.index_path, "a") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+        self._load_index()[(algorithm, cfg_hash, record["seed"])] = record
+        return record
+
+    def runs(self, algorithm=None, config=None):
+        """
+        Filtreye uyan koşu kayıtları (sadece index okunur, diziler yüklenmez).
+        """
+        cfg_hash = None if config is None else (config if isinstance(config, str) else config_hash(config))
+        return [r for r in self._load_index().values()
+                if (algorithm is None or r["algorithm"] == algorithm)
+                and (cfg_hash is None or r["config_hash"] == cfg_hash)]
+
+    def load_run(self, record):
+        """
+        Bir koşunun dizilerini yükler: {"best_solution", "best_fitness", "convergence_curve",
+        "nfe", "stop_reason"}.
+        """
+        with np.load(os.path.join(self.root, record["path"])) as data:
+            run = {key: data[key] for key in data.files}
+        run["nfe"] = record.get("nfe")
+        run["stop_reason"] = record.get("stop_reason")
+        return run
+
+    def record(self, algorithm, config, seed):
+        """
+        Koşunun index kaydı (diziler yüklenmez) veya None.
+        """
+        cfg_hash = config if isinstance(config, str) else config_hash(config)
+        return self._load_index().get((algorithm, cfg_hash, seed_key(seed)))
+
+    def get(self, algorithm, config, seed):
+        record = self.record(algorithm, config, seed)
+        return None if record is None else self.load_run(record)
+
+    def fitness_values(self, algorithm, config):
+        return np.array([r["best_fitness"] for r in self.runs(algorithm, config)])
+
+    def iter_curves(self, algorithm, config, max_points=200):
+        """
+        Koşuların yakınsama eğrilerini tek tek (lazy) ve log-aralıklı seyreltilmiş olarak verir.
+        :return: (kayıt, iterasyonlar, değerler) üreteci
+        """
+        for record in self.runs(algorithm, config):
+            with np.load(os.path.join(self.root, record["path"])) as data:
+                iterations, values = log_downsample(data["convergence_curve"], max_points)
+            yield record, iterations, values
@@ -0,0 +1,176 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .objective import objective_key
+from .results_store import config_hash, seed_key
+
+
+class RunResult:
+    """
+    Tek bir (algoritma, koşu) işinin sonucu.
+    """
+
+    def __init__(self, algorithm, run, best_solution, best_fitness, convergence_curve,
+                 nfe=None, stop_reason=None):
+        self.algorithm = algorithm
+        self.run = run
+        self.best_solution = best_solution
+        self.best_fitness = best_fitness
+        self.convergence_curve = convergence_curve
+        self.nfe = nfe
+        self.stop_reason = stop_reason
+
+
+class StoredRunResult(RunResult):
+    """
+    Sonuç deposundan gelen koşu. Skaler alanlar index'ten okunur; best_solution ve
+    convergence_curve ancak erişildiğinde .npz dosyasından yüklenir (istatistik tablosu
+    için diziler hiç okunmaz).
+    """
+
+    def __init__(self, algorithm, run, store, record):
+        self.algorithm = algorithm
+        self.run = run
+        self.best_fitness = float(record["best_fitness"])
+        self.nfe = record.get("nfe")
+        self.stop_reason = record.get("stop_reason")
+        self._store = store
+        self._record = record
+        self._arrays = None
+
+    def _load(self):
+        if self._arrays is None:
+            self._arrays = self._store.load_run(self._record)
+        return self._arrays
+
+    @property
+    def best_solution(self):
+        return self._load()["best_solution"]
+
+    @property
+    def convergence_curve(self):
+        return self._load()["convergence_curve"]
+
+
+def _run_job(job):
+    """
+    Worker sürecinde tek bir koşuyu çalıştırır.
+    Her koşu kendi SeedSequence'ından türetilen np.random.Generator'ı kullanır.
+    """
+    name, AlgoClass, run, seed_seq, objective_func, bounds, pop_size, max_iter, checkpoint = job
+    
+    # Checkpoint klasörü verilmişse koşu kaldığı yerden devam eder;
+    # tamamlanmış koşuların checkpoint'i sonucu doğrudan verir (yeniden hesaplanmaz).
+    # Dosya adı ayar hash'ini ve tohumu içerir: farklı ayarlı bir kampanya eski koşuları kullanmaz.
+    checkpoint_dir, checkpoint_every = checkpoint
+    checkpoint_path = None
+    if checkpoint_dir is not None:
+        cfg_hash = config_hash(campaign_config(objective_func, bounds, pop_size, max_iter))
+        checkpoint_path = os.path.join(checkpoint_dir, f"{name}_run{run:03d}_{cfg_hash}_seed_{seed_key(seed_seq)}.npz")
+    
+    optimizer = AlgoClass(objective_func, bounds, pop_size, max_iter, rng=np.random.default_rng(seed_seq),
+                          checkpoint_path=checkpoint_path, checkpoint_every=checkpoint_every)
+    best_sol, best_fit, curve = optimizer.optimize(resume=checkpoint_path is not None)
+    return RunResult(name, run, best_sol, best_fit, np.asarray(curve),
+                     optimizer.nfe, optimizer.stop_reason)
+
+
+def make_jobs(algorithms, objective_func, bounds, pop_size, max_iter, num_runs, seed=None,
+              checkpoint_dir=None, checkpoint_every=None):
+    """
+    (algoritma, koşu) işlerini ve her birinin tohum akışını oluşturur.
+    r. koşunun tohumu SeedSequence(seed).spawn(...)[r]'dir: worker sayısından, algoritma
+    listesinden ve num_runs'tan bağımsızdır. Böylece tüm algoritmalar aynı tohum akışlarını
+    kullanır ve tek koşuluk bir kampanya (compare/plot) istatistik kampanyasının 0. koşusunu
+    depodan yeniden kullanabilir.
+    """
+    children = np.random.SeedSequence(seed).spawn(num_runs)
+    jobs = []
+    for name, AlgoClass in algorithms.items():
+        for run in range(num_runs):
+            seed_seq = children[run]
+            jobs.append((name, AlgoClass, run, seed_seq, objective_func, bounds, pop_size, max_iter,
+                         (checkpoint_dir, checkpoint_every)))
+    return jobs
+
+
+def run_campaign(algorithms, objective_func, bounds, pop_size, max_iter, num_runs,
+                 seed=None, max_workers=None, progress=None, checkpoint_dir=None, checkpoint_every=25,
+                 store=None):
+    """
+    Tüm (algoritma, koşu) işlerini bir ProcessPoolExecutor üzerinde dağıtır.
+    :param algorithms: {"BBO": BBO, ...} sözlüğü
+    :param objective_func: Maliyet fonksiyonu (pickle edilebilir olmalı, yani modül seviyesinde tanımlı)
+    :param seed: Kampanya tohumu (aynı tohum -> aynı sonuçlar)
+    :param max_workers: Süreç sayısı (None -> tüm çekirdekler, 1 -> aynı süreçte sırayla)
+    :param progress: İsteğe bağlı callback(done, total, result)
+    :param checkpoint_dir: Verilirse her koşu bu klasöre checkpoint alır; kesilen bir kampanya
+                           aynı çağrıyla devam ettirilir ve biten koşular yeniden hesaplanmaz.
+                           Dosyalar ayar hash'i ve tohumla adlandırılır; farklı ayarlar aynı klasörü paylaşabilir.
+    :param checkpoint_every: Koşu içi checkpoint aralığı (nesil)
+    :param store: Verilirse (results_store.ResultsStore) biten koşular depoya eklenir,
+                  depoda zaten olan koşular yeniden çalıştırılmaz.
+    :return: {algoritma adı: [RunResult, ...]} (koşu sırasına göre)
+    """
+    if checkpoint_dir is not None:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+    jobs = make_jobs(algorithms, objective_func, bounds, pop_size, max_iter, num_runs, seed,
+                     checkpoint_dir, checkpoint_every)
+    results = {name: [None] * num_runs for name in algorithms}
+    total = len(jobs)
+    done = 0
+
+    config = campaign_config(objective_func, bounds, pop_size, max_iter)
+    seeds = {(job[0], job[2]): job[3] for job in jobs}
+
+    def finish(res, from_store=False):
+        nonlocal done
+        results[res.algorithm][res.run] = res
+        if store is not None and not from_store:
+            store.append(res.algorithm, config, seeds[(res.algorithm, res.run)], res.best_solution,
+                         res.best_fitness, res.convergence_curve, res.nfe, res.stop_reason)
+        done += 1
+        if progress is not None:
+            progress(done, total, res)
+
+    # Depoda sonucu olan koşular yeniden çalıştırılmaz
+    if store is not None:
+        pending = []
+        for job in jobs:
+            name, run, seed_seq = job[0], job[2], job[3]
+            record = store.record(name, config, seed_seq)
+            if record is None:
+                pending.append(job)
+            else:
+                finish(StoredRunResult(name, run, store, record), from_store=True)
+        jobs = pending
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers == 1 or not jobs:
+        for job in jobs:
+            finish(_run_job(job))
+        return results
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(_run_job, job) for job in jobs]
+        for future in as_completed(futures):
+            finish(future.result())
+    return results
+
+
+def campaign_config(objective_func, bounds, pop_size, max_iter):
+    """
+    Sonuç deposunda koşuları gruplamak (ve checkpoint dosyalarını adlandırmak) için kullanılan
+    ayar sözlüğü. Amaç fonksiyonu objective.objective_key ile tanımlanır: partial argümanları ve
+    maliyet nesnelerinin verisi (solver, ölçüm eğrisi) de anahtara girer.
+    """
+    return {
+        "objective": objective_key(objective_func),
+        "bounds": [list(map(float, b)) for b in bounds],
+        "pop_size": pop_size,
+        "max_iter": max_iter,
+    }
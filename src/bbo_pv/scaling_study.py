@@ -0,0 +1,110 @@
+import argparse
+import json
+import time
+import tracemalloc
+
+import numpy as np
+
+from .bbo import BBO
+from .pso import PSO
+from .gwo import GWO
+from .benchmark_suite import get_function
+from .callbacks import GenerationRecorder
+
+# --- AYARLAR ---
+DIMS = [10, 100, 1000]
+POP_SIZES = [30, 300, 5000]
+GENERATIONS = 10      # Süre ölçümü için nesil sayısı
+MEMORY_GENERATIONS = 2  # tracemalloc yavaşlattığı için bellek ayrı ve kısa bir koşuda ölçülür
+
+algorithms = {
+    "BBO": BBO,
+    "PSO": PSO,
+    "GWO": GWO
+}
+
+
+def _run_generations(AlgoClass, func, bounds, pop_size, generations, seed, callbacks=None):
+    optimizer = AlgoClass(func, bounds, pop_size, generations, seed=seed, callbacks=callbacks)
+    optimizer.initialize()
+    start = time.perf_counter()
+    for t in range(generations):
+        if optimizer.step(t):
+            break
+    elapsed = time.perf_counter() - start
+    return optimizer, elapsed / max(1, optimizer.iterations)
+
+
+def measure(AlgoClass, func, bounds, pop_size, generations=GENERATIONS, seed=0):
+    """
+    Tek bir (optimizatör, boyut, popülasyon) hücresini ölçer.
+    :return: {"sec_per_gen", "eval_fraction", "peak_mb", "best_fitness"}
+             eval_fraction: nesil süresinin amaç fonksiyonunda geçen kısmı (geri kalanı optimizatör yükü)
+    """
+    # Isınma: JIT derlemesi (numba) ve ilk bellek ayırmaları ölçüme karışmasın
+    _run_generations(AlgoClass, func, bounds, min(pop_size, 10), 4, seed)
+
+    recorder = GenerationRecorder()
+    optimizer, sec_per_gen = _run_generations(AlgoClass, func, bounds, pop_size, generations, seed, [recorder])
+    eval_time = np.sum(recorder.eval_time)
+    total_time = eval_time + np.sum(recorder.op_time)
+
+    tracemalloc.start()
+    _run_generations(AlgoClass, func, bounds, pop_size, MEMORY_GENERATIONS, seed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "sec_per_gen": sec_per_gen,
+        "eval_fraction": float(eval_time / total_time) if total_time > 0 else None,
+        "peak_mb": peak / 2**20,
+        "best_fitness": float(optimizer._result()[1]),
+    }
+
+
+def run_study(function="shifted_rotated_rastrigin", dims=DIMS, pop_sizes=POP_SIZES, generations=GENERATIONS,
+              names=None, seed=0, progress=None):
+    """
+    Boyut x popülasyon ızgarasında her optimizatörün nesil süresini ve bellek tepe değerini ölçer.
+    :return: [{"algorithm", "dim", "pop_size", "sec_per_gen", "eval_fraction", "peak_mb", "best_fitness"}, ...]
+    """
+    rows = []
+    for dim in dims:
+        func, bounds = get_function(function, dim, seed)
+        for pop_size in pop_sizes:
+            for name in names or algorithms:
+                row = {"algorithm": name, "dim": dim, "pop_size": pop_size,
+                       **measure(algorithms[name], func, bounds, pop_size, generations, seed)}
+                rows.append(row)
+                if progress is not None:
+                    progress(row)
+    return rows
+
+
+def print_row(row):
+    print(f"{row['algorithm']:<4} dim={row['dim']:<5} pop={row['pop_size']:<5} "
+          f"{row['sec_per_gen'] * 1e3:10.3f} ms/nesil  "
+          f"değerlendirme payı={row['eval_fraction']:.0%}  tepe bellek={row['peak_mb']:8.1f} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BBO/PSO/GWO ölçeklenme çalışması")
+    parser.add_argument("--function", default="shifted_rotated_rastrigin",
+                        help="benchmark_suite fonksiyonu (ör. sphere, shifted_ackley, shifted_rotated_griewank)")
+    parser.add_argument("--dims", type=int, nargs="+", default=DIMS)
+    parser.add_argument("--pops", type=int, nargs="+", default=POP_SIZES)
+    parser.add_argument("--generations", type=int, default=GENERATIONS)
+    parser.add_argument("--algorithms", nargs="+", choices=list(algorithms), default=None)
+    parser.add_argument("--output", default=None, help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+
+    rows = run_study(args.function, args.dims, args.pops, args.generations, args.algorithms, progress=print_row)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"function": args.function, "generations": args.generations, "results": rows}, f, indent=2)
+        print(f"Sonuçlar '{args.output}' dosyasına yazıldı.")
+
+
+if __name__ == "__main__":
+    main()
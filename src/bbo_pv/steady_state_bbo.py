@@ -0,0 +1,232 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+from .bbo import BBO
+
+
+def _call_objective(func, x, vectorized):
+    """
+    Tek bir adayı değerlendirir (worker thread/süreçte çalışır).
+    :return: (fitness, değerlendirme süresi [s])
+    """
+    start = time.perf_counter()
+    if vectorized:
+        fitness = float(np.asarray(func(x[None, :]), dtype=float).reshape(-1)[0])
+    else:
+        fitness = float(func(x))
+    return fitness, time.perf_counter() - start
+
+
+async def _call_coroutine(func, x):
+    """
+    async def amaç fonksiyonu için _call_objective karşılığı.
+    """
+    start = time.perf_counter()
+    fitness = float(await func(x))
+    return fitness, time.perf_counter() - start
+
+
+class SteadyStateBBO(BBO):
+    """
+    Asenkron, kararlı-durum (steady-state) BBO.
+    Nesil bariyeri yoktur: bir worker boşaldığı anda mevcut popülasyondan yeni bir
+    aday üretilir ve sonuçlar geldikçe (greedy selection ile) popülasyona katılır.
+    Yavaş veya süresi değişken amaç fonksiyonlarında tüm worker'lar meşgul kalır.
+    Sonuçların geliş sırası değişebildiği için koşular tohumla birebir tekrarlanamaz;
+    bu yüzden checkpoint / resume desteklenmez. Callback'lere verilen eval_time, nesildeki
+    değerlendirme sürelerinin toplamıdır (paralel worker'larda duvar saatini aşabilir).
+    """
+
+    def __init__(self, objective_func, bounds, pop_size=30, max_iter=500, executor=None,
+                 n_workers=None, **kwargs):
+        """
+        :param max_iter: Nesil eşdeğeri bütçe -> toplam max_iter * pop_size aday değerlendirilir
+        :param executor: concurrent.futures Executor (ThreadPool veya ProcessPool).
+                         None ise n_workers thread'lik bir havuz açılır.
+        :param n_workers: Aynı anda değerlendirmede olan en fazla aday sayısı
+        """
+        if kwargs.get("checkpoint_path") is not None:
+            raise ValueError("Checkpointing is not supported by SteadyStateBBO")
+        super().__init__(objective_func, bounds, pop_size, max_iter, **kwargs)
+        if self.initializer.opposition:
+            raise ValueError("Opposition-based initialization is not supported by SteadyStateBBO")
+        if self.surrogate is not None:
+            raise ValueError("Surrogate screening is not supported by SteadyStateBBO")
+        if self.multifidelity:
+            raise ValueError("Multi-fidelity screening is not supported by SteadyStateBBO")
+        self.executor = executor
+        self.n_workers = n_workers or getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+        self.accepted = 0
+
+    # ------------------------------------------------------------------
+    # Aday üretimi ve sonuç katma (senkron ve asyncio yollarında ortak)
+    # ------------------------------------------------------------------
+    def _make_child(self, i, progress):
+        """
+        i. kunduzdan Eq. 4, 5 ve 6'nın tek birey için karşılığıyla bir aday üretir.
+        :param progress: Harcanan bütçe oranı (0..1), Dam-Phase Factor bunun üzerinden hesaplanır
+        """
+        n = self.pop_size
+        x = self.population[i]
+        D = np.sin(np.pi * progress / 2)
+
+        if self.rng.random() <= D:
+            # EXPLOITATION (Eq. 6): rastgele bir komşu ve lider kunduza doğru
+            k = self.rng.integers(0, n - 1)
+            k += k >= i
+            r7, r8 = self.rng.random(2)
+            child = x + r7 * (self.population[k] - x) + r8 * (self.best_solution - x)
+        else:
+            # EXPLORATION: kunduzun sıralamadaki yerine göre Mimar (Eq. 4) veya Arayıcı (Eq. 5)
+            num_architects = min(n, max(1, int(self.architect_ratio * n)))
+            rank = int(np.sum(self.fitness < self.fitness[i]))
+            architects = np.argpartition(self.fitness, num_architects - 1)[:num_architects]
+            k = architects[self.rng.integers(0, num_architects)]
+            if rank < num_architects:
+                r2, r3 = self.rng.random(2)
+                child = x + r3 * (self.population[k] - x) if r2 < 0.5 else x.copy()
+            else:
+                r4, r5 = self.rng.random(2)
+                r6 = self.rng.standard_normal()
+                perturbation = r6 * np.cos(np.pi * progress / 2) * (self.ub - self.lb) * self.perturbation_scale
+                learning_term = r5 * (self.population[k] - x) if r4 < 0.5 else 0
+                child = x + learning_term + perturbation
+
+        return np.clip(child, self.lb, self.ub)
+
+    def _fold(self, i, child, result):
+        """
+        Tamamlanan bir değerlendirmeyi popülasyona katar.
+        Her pop_size sonuçta bir "nesil" sayılır: kayıt, callback ve durma kontrolü yapılır.
+        Durulduktan sonra gelen (uçuştaki) sonuçlar sadece NFE'ye sayılır; popülasyon, eğri,
+        callback'ler ve stop_reason değişmez.
+        :param result: (fitness, değerlendirme süresi) -> _call_objective çıktısı
+        :return: Durulması gerekiyorsa True
+        """
+        fitness, eval_time = result
+        self.nfe += 1
+        if self.stop_reason is not None:
+            return True
+        self._gen_eval_time += eval_time
+        if fitness < self.fitness[i]:
+            self.fitness[i] = fitness
+            self.population[i] = child
+            self.accepted += 1
+            if fitness < self.best_fitness:
+                self.best_fitness = fitness
+                self.best_solution = child.copy()
+
+        completed = self.nfe - self.pop_size
+        if completed % self.pop_size != 0:
+            return False
+        self.convergence_curve.append(self.best_fitness)
+        rate = self.accepted / self.pop_size
+        self.accepted = 0
+        return self._end_generation(completed // self.pop_size - 1, self.best_fitness, self.population,
+                                    acceptance_rate=rate)
+
+    def _initialize_population(self, results):
+        fitness, eval_times = zip(*results)
+        self.fitness = np.asarray(fitness, dtype=float)
+        self._gen_eval_time += sum(eval_times)
+        self.nfe = self.pop_size
+        best_idx = np.argmin(self.fitness)
+        self.best_fitness = self.fitness[best_idx]
+        self.best_solution = self.population[best_idx].copy()
+        self.accepted = 0
+
+    def _budget(self):
+        """
+        Gönderilecek toplam aday sayısı. max_nfe varsa uçuştaki değerlendirmeler
+        bütçeyi aşmasın diye gönderim baştan sınırlanır.
+        """
+        budget = self.max_iter * self.pop_size
+        if self.stopping.max_nfe is not None:
+            budget = min(budget, max(0, self.stopping.max_nfe - self.pop_size))
+        return budget
+
+    # ------------------------------------------------------------------
+    # Executor (thread / process pool) yolu
+    # ------------------------------------------------------------------
+    def optimize(self, resume=False):
+        """
+        Kararlı-durum döngüsünü bir concurrent.futures executor üzerinde çalıştırır.
+        :param resume: Desteklenmez (sadece BaseOptimizer ile uyumlu imza için); True ise ValueError
+        """
+        if resume:
+            raise ValueError("SteadyStateBBO cannot resume: runs are not reproducible from a checkpoint")
+        executor = self.executor or ThreadPoolExecutor(max_workers=self.n_workers)
+        try:
+            self._start()
+            initial = [executor.submit(_call_objective, self.func, x, self.vectorized) for x in self.population]
+            self._initialize_population([f.result() for f in initial])
+
+            budget = self._budget()
+            submitted = 0
+            stop = False
+            pending = {}
+            while True:
+                # Boş worker kaldıkça yeni aday gönder
+                while not stop and submitted < budget and len(pending) < self.n_workers:
+                    i = submitted % self.pop_size
+                    child = self._make_child(i, (submitted + 1) / budget)
+                    future = executor.submit(_call_objective, self.func, child, self.vectorized)
+                    pending[future] = (i, child)
+                    submitted += 1
+
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, child = pending.pop(future)
+                    stop |= self._fold(i, child, future.result())
+        finally:
+            if self.executor is None:
+                executor.shutdown()
+
+        return self._result()
+
+    # ------------------------------------------------------------------
+    # asyncio yolu
+    # ------------------------------------------------------------------
+    async def optimize_async(self):
+        """
+        Aynı kararlı-durum döngüsü, asyncio ile.
+        Amaç fonksiyonu bir coroutine fonksiyonuysa (async def) doğrudan beklenir,
+        değilse executor (veya varsayılan executor) üzerinde çalıştırılır.
+        """
+        loop = asyncio.get_running_loop()
+
+        def launch(x):
+            if asyncio.iscoroutinefunction(self.func):
+                return asyncio.ensure_future(_call_coroutine(self.func, x))
+            return loop.run_in_executor(self.executor, _call_objective, self.func, x, self.vectorized)
+
+        self._start()
+        self._initialize_population(await asyncio.gather(*(launch(x) for x in self.population)))
+
+        budget = self._budget()
+        submitted = 0
+        stop = False
+        pending = {}
+        while True:
+            while not stop and submitted < budget and len(pending) < self.n_workers:
+                i = submitted % self.pop_size
+                child = self._make_child(i, (submitted + 1) / budget)
+                pending[launch(child)] = (i, child)
+                submitted += 1
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                i, child = pending.pop(task)
+                stop |= self._fold(i, child, task.result())
+
+        return self._result()
@@ -0,0 +1,159 @@
+import numpy as np
+
+
+class KNNSurrogate:
+    """
+    Değerlendirilmiş noktalar arşivi üzerinde k-en yakın komşu (ters mesafe ağırlıklı)
+    regresyonu. BBO greedy selection'da ebeveyninden kesinlikle kötü olacağı tahmin
+    edilen çocukların değerlendirmesini atlamak için kullanılır.
+    """
+
+    def __init__(self, k=5, capacity=2000, refit_every=5, margin=1.0, min_archive=50, audit_rate=0.1):
+        """
+        :param k: Tahminde kullanılan komşu sayısı
+        :param capacity: Arşivin tutacağı en fazla nokta (dolunca en eskiler silinir)
+        :param refit_every: Model kaç nesilde bir güncel arşivle yeniden kurulur
+        :param margin: Atlama eşiği: tahmin - margin * belirsizlik > ebeveyn fitness'ı
+        :param min_archive: Arşiv bu boyuta ulaşmadan hiçbir çocuk atlanmaz
+        :param audit_rate: Atlanan çocukların bu oranı yine de değerlendirilip
+                           atlama kararlarının doğruluğu ölçülür
+        """
+        self.k = k
+        self.capacity = capacity
+        self.refit_every = refit_every
+        self.margin = margin
+        self.min_archive = min_archive
+        self.audit_rate = audit_rate
+
+        self.lb = None
+        self.span = None
+        self._X = None
+        self._y = None
+        self._size = 0
+        self._next = 0
+        self._model_X = None
+        self._model_y = None
+        self._generation = 0
+
+        # Raporlanan istatistikler
+        self.evaluations_saved = 0
+        self.audited = 0
+        self.audit_correct = 0
+
+    def reset(self, lb, ub):
+        """
+        Arşivi ve sayaçları sıfırlar; girdiler [lb, ub] aralığına göre normalize edilir.
+        """
+        self.lb = np.asarray(lb, dtype=float)
+        self.span = np.where(ub > lb, np.asarray(ub, dtype=float) - self.lb, 1.0)
+        self._X = np.empty((self.capacity, len(self.lb)))
+        self._y = np.empty(self.capacity)
+        self._size = 0
+        self._next = 0
+        self._model_X = None
+        self._model_y = None
+        self._generation = 0
+        self.evaluations_saved = 0
+        self.audited = 0
+        self.audit_correct = 0
+
+    def get_state(self):
+        """
+        Checkpoint için iç durum (arşiv, güncel model ve sayaçlar) -> dizi sözlüğü.
+        """
+        return {
+            "lb": self.lb,
+            "span": self.span,
+            "X": self._X[:self._size],
+            "y": self._y[:self._size],
+            "next": np.asarray(self._next),
+            "model_X": self._model_X if self._model_X is not None else np.empty((0, len(self.lb))),
+            "model_y": self._model_y if self._model_y is not None else np.empty(0),
+            "has_model": np.asarray(self._model_X is not None),
+            "counters": np.asarray([self._generation, self.evaluations_saved, self.audited, self.audit_correct]),
+        }
+
+    def set_state(self, state):
+        self.reset(state["lb"], state["lb"] + state["span"])
+        self.span = np.asarray(state["span"], dtype=float)
+        self._size = len(state["y"])
+        self._X[:self._size] = state["X"]
+        self._y[:self._size] = state["y"]
+        self._next = int(state["next"])
+        if bool(state["has_model"]):
+            self._model_X = np.asarray(state["model_X"]).copy()
+            self._model_y = np.asarray(state["model_y"]).copy()
+        self._generation, self.evaluations_saved, self.audited, self.audit_correct = map(int, state["counters"])
+
+    def add(self, X, y):
+        """
+        Değerlendirilmiş noktaları arşive ekler (halka tampon).
+        """
+        finite = np.isfinite(y)
+        X = (X[finite] - self.lb) / self.span
+        y = y[finite]
+        for start in range(0, len(y), self.capacity):
+            chunk_X, chunk_y = X[start:start + self.capacity], y[start:start + self.capacity]
+            idx = (self._next + np.arange(len(chunk_y))) % self.capacity
+            self._X[idx] = chunk_X
+            self._y[idx] = chunk_y
+            self._next = (self._next + len(chunk_y)) % self.capacity
+            self._size = min(self._size + len(chunk_y), self.capacity)
+
+    def end_generation(self):
+        """
+        Her nesil sonunda çağrılır; refit_every nesilde bir modeli arşivle günceller.
+        """
+        if self._model_X is None or self._generation % self.refit_every == 0:
+            self._model_X = self._X[:self._size].copy()
+            self._model_y = self._y[:self._size].copy()
+        self._generation += 1
+
+    @property
+    def ready(self):
+        return self._model_X is not None and len(self._model_y) >= max(self.min_archive, self.k)
+
+    def predict(self, X):
+        """
+        :return: (tahmin, belirsizlik) -> komşuların ağırlıklı ortalaması ve standart sapması
+        """
+        Z = (X - self.lb) / self.span
+        d2 = np.sum((Z[:, None, :] - self._model_X[None, :, :]) ** 2, axis=2)
+        nn = np.argpartition(d2, self.k - 1, axis=1)[:, :self.k]
+        d = np.sqrt(np.take_along_axis(d2, nn, axis=1))
+        y = self._model_y[nn]
+        w = 1.0 / (d + 1e-12)
+        w /= w.sum(axis=1, keepdims=True)
+        mean = np.sum(w * y, axis=1)
+        std = np.sqrt(np.sum(w * (y - mean[:, None]) ** 2, axis=1))
+        return mean, std
+
+    def screen(self, children, parent_fitness, rng):
+        """
+        Değerlendirilecek çocukları seçer.
+        :return: (evaluate, audit) maskeleri -> audit: atlanmış olup doğruluk ölçümü için
+                 yine de değerlendirilen çocuklar
+        """
+        n = len(children)
+        if not self.ready:
+            return np.ones(n, dtype=bool), np.zeros(n, dtype=bool)
+        mean, std = self.predict(children)
+        skip = mean - self.margin * std > parent_fitness
+        audit = skip & (rng.random(n) < self.audit_rate)
+        self.evaluations_saved += int(np.sum(skip & ~audit))
+        return ~skip | audit, audit
+
+    def record_audit(self, child_fitness, parent_fitness):
+        """
+        Denetlenen (audit) atlama kararları: çocuk gerçekten ebeveynden kötü müydü?
+        """
+        self.audited += len(child_fitness)
+        self.audit_correct += int(np.sum(child_fitness >= parent_fitness))
+
+    def stats(self):
+        return {
+            "evaluations_saved": self.evaluations_saved,
+            "audited": self.audited,
+            "skip_accuracy": self.audit_correct / self.audited if self.audited else None,
+            "archive_size": self._size,
+        }
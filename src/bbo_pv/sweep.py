@@ -0,0 +1,191 @@
+import argparse
+import itertools
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import partial
+
+import numpy as np
+
+from .bbo import BBO
+from .benchmark_functions import solar_pv_cost_batch
+from .run_scheduler import make_jobs, _run_job
+from .termination import StoppingCriteria
+from .config import DEFAULT_BOUNDS
+
+# Optimizatör kurucusuna konum argümanı olarak giden ayarlar; geri kalanlar anahtar kelime argümanıdır
+RUN_PARAMS = ("pop_size", "max_iter")
+
+DEFAULT_SPACE = {
+    "pop_size": [20, 30, 50, 100],
+    "max_iter": [100, 200, 400],
+    "architect_ratio": [0.1, 0.25, 0.4],
+    "perturbation_scale": [0.05, 0.1, 0.2],
+}
+
+
+def grid_configs(space):
+    """
+    Arama uzayındaki tüm kombinasyonlar (ızgara araması).
+    :param space: {parametre: [değerler]} sözlüğü
+    """
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[k] for k in names))]
+
+
+def random_configs(space, n, seed=None):
+    """
+    Arama uzayından n rastgele ayar (rastgele arama).
+    Liste verilen parametreler listeden seçilir; (alt, üst) demeti verilenler aralıktan
+    düzgün dağılımla çekilir (iki sınır da tam sayıysa tam sayı).
+    """
+    rng = np.random.default_rng(seed)
+    configs = []
+    for _ in range(n):
+        config = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                if isinstance(low, int) and isinstance(high, int):
+                    config[name] = int(rng.integers(low, high + 1))
+                else:
+                    config[name] = float(rng.uniform(low, high))
+            else:
+                config[name] = values[rng.integers(0, len(values))]
+        configs.append(config)
+    return configs
+
+
+def config_label(config):
+    return ",".join(f"{k}={v}" for k, v in config.items())
+
+
+def median_fitness(results):
+    """
+    Varsayılan skor: koşuların en iyi fitness değerlerinin medyanı (küçük daha iyi).
+    """
+    return float(np.median([res.best_fitness for res in results]))
+
+
+def _algorithm_for(algorithm, config, max_nfe):
+    kwargs = {k: v for k, v in config.items() if k not in RUN_PARAMS}
+    if max_nfe is not None:
+        kwargs["stopping"] = StoppingCriteria(max_nfe=max_nfe)
+    return partial(algorithm, **kwargs)
+
+
+def successive_halving(configs, objective_func, bounds, algorithm=BBO, min_runs=3, max_runs=27, eta=3,
+                       max_nfe=None, seed=None, max_workers=None, score=median_fitness, defaults=None,
+                       progress=None):
+    """
+    Ayarları yarıştırarak (successive halving) eler.
+    Her turda hayatta kalan ayarlar daha fazla bağımsız koşuyla çalıştırılır ve
+    skoru en iyi 1/eta kısmı bir sonraki tura geçer; açıkça kötü ayarlar
+    tam bütçeyi harcamadan elenir. Önceki turların koşuları tekrar kullanılır.
+    Tüm ayarlar aynı tohum akışlarını kullanır (ortak rastgele sayılar), bu yüzden
+    kıyaslamalar gürültüden daha az etkilenir.
+    :param configs: Ayar sözlükleri listesi (grid_configs / random_configs)
+    :param algorithm: Optimizatör sınıfı (ayarın pop_size/max_iter dışındaki anahtarları kurucuya gider)
+    :param min_runs: İlk turdaki koşu sayısı
+    :param max_runs: Son turdaki koşu sayısı
+    :param eta: Eleme oranı (her turda koşular eta katına çıkar, ayarlar 1/eta'ya iner)
+    :param max_nfe: Verilirse tüm ayarlara aynı NFE bütçesi verilir (adil kıyas; hızlı
+                    yakınsayan ayarlar öne çıkar). None ise her ayar pop_size * max_iter harcar.
+    :param score: results listesinden skor üreten fonksiyon (küçük daha iyi)
+    :param defaults: Ayarda olmayan pop_size / max_iter için varsayılanlar
+    :param progress: İsteğe bağlı callback(rung, runs, survivors)
+    :return: Skora göre sıralı [{"config", "score", "runs", "rung", "results"}, ...]
+             (elenen ayarlar da, elendikleri turun skoruyla listenin sonunda)
+    """
+    defaults = {"pop_size": 30, "max_iter": 500, **(defaults or {})}
+    configs = [{**{k: defaults[k] for k in RUN_PARAMS if k not in c}, **c} for c in configs]
+    # Aynı ayar birden fazla verilmişse (ör. random_configs tekrarları) bir kez yarıştırılır
+    unique = {}
+    for c in configs:
+        unique.setdefault(config_label(c), c)
+    entries = [{"index": i, "config": c, "results": [], "score": None, "rung": 0}
+               for i, c in enumerate(unique.values())]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    survivors = entries
+    eliminated = []
+    runs = min_runs
+    rung = 0
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        while True:
+            runs = min(runs, max_runs)
+            if progress is not None:
+                progress(rung, runs, len(survivors))
+
+            # Sadece henüz yapılmamış koşular çalıştırılır;
+            # işler etiketle değil ayarın entries içindeki sırasıyla adlandırılır
+            jobs = []
+            for entry in survivors:
+                config = entry["config"]
+                algo = _algorithm_for(algorithm, config, max_nfe)
+                all_jobs = make_jobs({entry["index"]: algo}, objective_func, bounds, config["pop_size"],
+                                     config["max_iter"], runs, seed)
+                jobs.extend(all_jobs[len(entry["results"]):])
+
+            if executor is None:
+                finished = map(_run_job, jobs)
+            else:
+                finished = (f.result() for f in as_completed([executor.submit(_run_job, job) for job in jobs]))
+            for res in finished:
+                entries[res.algorithm]["results"].append(res)
+
+            for entry in survivors:
+                entry["results"].sort(key=lambda res: res.run)
+                entry["score"] = score(entry["results"])
+                entry["rung"] = rung
+            survivors = sorted(survivors, key=lambda entry: entry["score"])
+
+            if runs >= max_runs or len(survivors) == 1:
+                break
+            keep = max(1, math.ceil(len(survivors) / eta))
+            eliminated = survivors[keep:] + eliminated
+            survivors = survivors[:keep]
+            runs *= eta
+            rung += 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return [{"config": e["config"], "score": e["score"], "runs": len(e["results"]), "rung": e["rung"],
+             "results": e["results"]} for e in survivors + eliminated]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BBO hiperparametre taraması (successive halving)")
+    parser.add_argument("--search", choices=("grid", "random"), default="grid")
+    parser.add_argument("--samples", type=int, default=20, help="Rastgele aramada ayar sayısı")
+    parser.add_argument("--min-runs", type=int, default=3)
+    parser.add_argument("--max-runs", type=int, default=27)
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument("--max-nfe", type=int, default=10000, help="Ayar başına koşu NFE bütçesi (0 -> sınırsız)")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    bounds = DEFAULT_BOUNDS
+    if args.search == "grid":
+        configs = grid_configs(DEFAULT_SPACE)
+    else:
+        configs = random_configs(DEFAULT_SPACE, args.samples, args.seed)
+
+    def print_progress(rung, runs, survivors):
+        print(f"Tur {rung}: {survivors} ayar x {runs} koşu")
+
+    ranking = successive_halving(configs, solar_pv_cost_batch, bounds, min_runs=args.min_runs,
+                                 max_runs=args.max_runs, eta=args.eta, max_nfe=args.max_nfe or None,
+                                 seed=args.seed, max_workers=args.workers, progress=print_progress)
+
+    print("\n--- EN İYİ AYARLAR ---")
+    for entry in ranking[:10]:
+        print(f"{entry['score']:.6e}  ({entry['runs']} koşu)  {config_label(entry['config'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import numpy as np
+
+# Durma nedenleri
+MAX_ITER = "max_iter"
+MAX_NFE = "max_nfe"
+TARGET = "target_fitness"
+STALL = "stall"
+DIVERSITY = "diversity"
+
+
+def population_diversity(population, lb, ub):
+    """
+    Popülasyon çeşitliliği: her boyuttaki standart sapmanın arama aralığına oranının ortalaması.
+    0'a yakın değerler popülasyonun tek bir noktaya çöktüğünü gösterir.
+    """
+    span = np.where(ub > lb, ub - lb, 1.0)
+    return float(np.mean(np.std(population, axis=0) / span))
+
+
+class StoppingCriteria:
+    """
+    BBO, PSO ve GWO için ortak durma kriterleri.
+    Her nesil sonunda check() çağrılır; bir kriter sağlanırsa durma nedeni döner.
+    """
+
+    def __init__(self, max_nfe=None, target_fitness=None, stall_generations=None,
+                 stall_tol=0.0, diversity_tol=None):
+        """
+        :param max_nfe: Maksimum fonksiyon değerlendirme (NFE) bütçesi.
+                        Bir sonraki nesil bütçeyi aşacaksa o nesil başlatılmaz.
+        :param target_fitness: Bu değere ulaşılınca (<=) dur (ör. RMSE < 0.001)
+        :param stall_generations: En iyi fitness bu kadar nesil boyunca iyileşmezse dur
+        :param stall_tol: İyileşme sayılması için gereken minimum azalma
+        :param diversity_tol: Popülasyon çeşitliliği bu değerin altına düşerse dur
+        """
+        self.max_nfe = max_nfe
+        self.target_fitness = target_fitness
+        self.stall_generations = stall_generations
+        self.stall_tol = stall_tol
+        self.diversity_tol = diversity_tol
+        self.reset()
+
+    def reset(self, lb=None, ub=None):
+        self.lb = lb
+        self.ub = ub
+        self._last_best = float('inf')
+        self._stall_count = 0
+
+    def get_state(self):
+        """
+        Checkpoint için iç durum (durağanlık sayacı).
+        """
+        return {"last_best": self._last_best, "stall_count": self._stall_count}
+
+    def set_state(self, state):
+        self._last_best = float(state["last_best"])
+        self._stall_count = int(state["stall_count"])
+
+    def check(self, best_fitness, population, nfe, next_nfe=0):
+        """
+        :param best_fitness: Şu ana kadarki en iyi fitness
+        :param population: Mevcut popülasyon (çeşitlilik kontrolü için)
+        :param nfe: Şu ana kadar harcanan değerlendirme sayısı
+        :param next_nfe: Bir sonraki neslin harcayacağı değerlendirme sayısı
+        :return: Durma nedeni (str) veya None
+        """
+        if self.target_fitness is not None and best_fitness <= self.target_fitness:
+            return TARGET
+
+        if self.max_nfe is not None and nfe + next_nfe > self.max_nfe:
+            return MAX_NFE
+
+        if self.stall_generations is not None:
+            if best_fitness < self._last_best - self.stall_tol:
+                self._last_best = best_fitness
+                self._stall_count = 0
+            else:
+                self._stall_count += 1
+                if self._stall_count >= self.stall_generations:
+                    return STALL
+
+        if self.diversity_tol is not None and self.lb is not None:
+            if population_diversity(population, self.lb, self.ub) < self.diversity_tol:
+                return DIVERSITY
+
+        return None
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from bbo_pv.benchmark_functions import diode_current, solar_pv_cost, solar_pv_cost_batch
+from bbo_pv.config import DEFAULT_BOUNDS
+
+# R.T.C. France için literatürdeki en iyi çözüm civarı
+REFERENCE = np.array([0.7608, 3.23e-7, 0.0364, 53.72, 1.4812])
+
+
+@pytest.fixture
+def candidates():
+    bounds = np.array(DEFAULT_BOUNDS)
+    X = np.random.default_rng(0).uniform(bounds[:, 0], bounds[:, 1], (200, 5))
+    # Ceza kurallarına takılan adaylar da kıyaslansın
+    X[0, 1] = -1e-7
+    X[1, 3] = 0.0
+    return X
+
+
+def test_scalar_and_batch_cost_match(candidates):
+    scalar = np.array([solar_pv_cost(x) for x in candidates])
+    np.testing.assert_allclose(solar_pv_cost_batch(candidates), scalar, rtol=1e-12)
+    assert scalar[0] == scalar[1] == 1e10
+
+
+def test_newton_matches_lambertw():
+    np.testing.assert_allclose(diode_current(REFERENCE, solver="newton"),
+                               diode_current(REFERENCE, solver="lambertw"), atol=1e-9)
+
+
+def test_newton_and_lambertw_costs_agree(candidates):
+    valid = candidates[2:]
+    np.testing.assert_allclose(solar_pv_cost_batch(valid, solver="lambertw"),
+                               solar_pv_cost_batch(valid, solver="newton"), rtol=1e-8)
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.callbacks import PHASE_CODES, GenerationRecorder, ProgressPrinter
+from bbo_pv.gwo import GWO
+from bbo_pv.pso import PSO
+
+BOUNDS = [(-5.0, 5.0)] * 3
+
+
+@pytest.mark.parametrize("AlgoClass", [BBO, PSO, GWO])
+def test_recorder_tracks_every_generation(AlgoClass):
+    recorder = GenerationRecorder()
+    optimizer = AlgoClass(sphere, BOUNDS, 10, 12, seed=0, callbacks=[recorder])
+    optimizer.optimize()
+
+    assert recorder.size == 12 and recorder.capacity == 12
+    np.testing.assert_array_equal(recorder.best_fitness, optimizer.convergence_curve)
+    assert recorder.nfe[-1] == optimizer.nfe
+    assert np.all(np.diff(recorder.nfe) > 0)
+    assert np.all(recorder.eval_time >= 0) and np.all(recorder.op_time >= 0)
+    assert np.all((recorder.diversity >= 0) & (recorder.diversity <= 1))
+
+    summary = recorder.summary()
+    assert summary["generations"] == 12 and summary["nfe"] == optimizer.nfe
+
+
+def test_bbo_reports_phase_and_acceptance():
+    recorder = GenerationRecorder()
+    BBO(sphere, BOUNDS, 10, 30, seed=1, callbacks=[recorder]).optimize()
+
+    assert set(recorder.phase) <= {PHASE_CODES["exploitation"], PHASE_CODES["exploration"]}
+    summary = recorder.summary()
+    assert summary["exploitation_generations"] + summary["exploration_generations"] == 30
+    assert np.all((recorder.acceptance_rate >= 0) & (recorder.acceptance_rate <= 1))
+
+
+def test_recorder_capacity_and_callback_stop():
+    recorder = GenerationRecorder(capacity=3)
+    optimizer = BBO(sphere, BOUNDS, 10, 10, seed=2,
+                    callbacks=[recorder, lambda opt, info: info["iteration"] == 5])
+    optimizer.optimize()
+
+    assert optimizer.stop_reason == "callback" and optimizer.iterations == 5
+    assert recorder.size == 3
+
+
+def test_printing_is_opt_in(capsys):
+    BBO(sphere, BOUNDS, 10, 100, seed=3).optimize()
+    assert capsys.readouterr().out == ""
+
+    BBO(sphere, BOUNDS, 10, 100, seed=3, callbacks=[ProgressPrinter(every=50)]).optimize()
+    assert capsys.readouterr().out.count("Iter:") == 2
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.gwo import GWO
+from bbo_pv.pso import PSO
+from bbo_pv.run_scheduler import run_campaign
+from bbo_pv.surrogate import KNNSurrogate
+
+BOUNDS = [(-5.0, 5.0)] * 4
+
+
+class _Interrupt(Exception):
+    pass
+
+
+def _interrupt_at(iteration):
+    # Koşuyu verilen nesilde yarıda keser (checkpoint'ler yazılmış kalır)
+    def callback(optimizer, info):
+        if info["iteration"] == iteration:
+            raise _Interrupt
+    return callback
+
+
+def _resumed_run(make_optimizer, path, stop_at=17):
+    optimizer = make_optimizer(checkpoint_path=path, checkpoint_every=5, callbacks=[_interrupt_at(stop_at)])
+    with pytest.raises(_Interrupt):
+        optimizer.optimize()
+    # Farklı tohum: tüm durum checkpoint'ten gelmeli
+    resumed = make_optimizer(checkpoint_path=path, seed=999)
+    return resumed, resumed.optimize(resume=True)
+
+
+@pytest.mark.parametrize("algorithm", [BBO, PSO, GWO])
+def test_resume_is_bit_identical(tmp_path, algorithm):
+    def make(**kwargs):
+        kwargs.setdefault("seed", 3)
+        return algorithm(sphere, BOUNDS, 20, 40, **kwargs)
+
+    reference = make()
+    expected = reference.optimize()
+    resumed, result = _resumed_run(make, tmp_path / "run.npz")
+
+    np.testing.assert_array_equal(result[0], expected[0])
+    assert result[1] == expected[1]
+    np.testing.assert_array_equal(result[2], expected[2])
+    assert resumed.nfe == reference.nfe
+
+
+def test_resume_with_surrogate_is_bit_identical(tmp_path):
+    def make(**kwargs):
+        kwargs.setdefault("seed", 3)
+        return BBO(sphere, BOUNDS, 20, 40, surrogate=KNNSurrogate(), **kwargs)
+
+    reference = make()
+    expected = reference.optimize()
+    resumed, result = _resumed_run(make, tmp_path / "bbo.npz")
+
+    np.testing.assert_array_equal(result[0], expected[0])
+    np.testing.assert_array_equal(result[2], expected[2])
+    assert resumed.nfe == reference.nfe
+    assert resumed.surrogate.stats() == reference.surrogate.stats()
+
+
+def test_checkpoint_config_mismatch_raises(tmp_path):
+    path = tmp_path / "bbo.npz"
+    BBO(sphere, BOUNDS, 10, 5, seed=1, checkpoint_path=path).optimize()
+
+    with pytest.raises(ValueError, match="max_iter"):
+        BBO(sphere, BOUNDS, 10, 8, seed=1, checkpoint_path=path).optimize(resume=True)
+    with pytest.raises(ValueError, match="pop_size"):
+        BBO(sphere, BOUNDS, 12, 5, seed=1, checkpoint_path=path).optimize(resume=True)
+
+
+def test_campaign_checkpoints_are_keyed_by_config(tmp_path):
+    short = run_campaign({"BBO": BBO}, sphere, BOUNDS, 10, 5, 2, seed=1, max_workers=1, checkpoint_dir=tmp_path)
+    longer = run_campaign({"BBO": BBO}, sphere, BOUNDS, 10, 12, 2, seed=1, max_workers=1, checkpoint_dir=tmp_path)
+
+    assert [len(res.convergence_curve) for res in short["BBO"]] == [5, 5]
+    assert [len(res.convergence_curve) for res in longer["BBO"]] == [12, 12]
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import bbo_pv
+from bbo_pv.cli import build_parser
+from bbo_pv.config import DEFAULTS, make_config
+
+
+def test_precedence_defaults_command_file_cli(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"pop_size": 12, "seed": 5}))
+
+    assert make_config()["pop_size"] == DEFAULTS["pop_size"]
+    assert make_config(command="run")["pop_size"] == 100
+    config = make_config(str(path), "run", pop_size=None, max_iter=7)
+    assert (config["pop_size"], config["max_iter"], config["seed"]) == (12, 7, 5)
+
+
+def test_run_keeps_main_script_defaults():
+    config = make_config(command="run")
+    assert (config["pop_size"], config["max_iter"], config["target_fitness"]) == (100, 1000, 1e-3)
+    assert config["bounds"][3] == (10.0, 100.0)
+    assert make_config(command="stats")["bounds"] == DEFAULTS["bounds"]
+
+
+def test_toml_file(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text('solver = "lambertw"\nbounds = [[0.7, 0.8], [1e-7, 1e-6], [0.01, 0.05], [40, 60], [1.4, 1.6]]\n')
+    config = make_config(str(path))
+    assert config["solver"] == "lambertw"
+    assert config["bounds"][3] == (40.0, 60.0)
+
+
+def test_bad_config_raises(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"pop_sise": 12}))
+    with pytest.raises(ValueError, match="pop_sise"):
+        make_config(str(path))
+    with pytest.raises(FileNotFoundError):
+        make_config(str(tmp_path / "missing.json"))
+
+
+def test_cli_parses_bounds_and_options():
+    args = vars(build_parser().parse_args(
+        ["run", "--bounds", "0.7,0.8", "1e-7,1e-6", "0.01,0.05", "10,100", "1.4,1.6", "--init", "sobol",
+         "--no-refine"]))
+    assert args["bounds"][3] == (10.0, 100.0)
+    assert args["init"] == "sobol" and args["refine"] is False
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["run", "--num-runs", "3"])
+
+
+def test_run_command_does_not_import_plotting_or_pandas(tmp_path):
+    code = ("import sys; from bbo_pv.cli import main; "
+            "main(['run', '--pop-size', '8', '--max-iter', '3', '--no-refine', '--quiet']); "
+            "print(sorted(m for m in ('pandas', 'matplotlib') if m in sys.modules))")
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(bbo_pv.__file__)))
+    out = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, check=True, capture_output=True,
+                         text=True)
+    assert out.stdout.strip().splitlines()[-1] == "[]"
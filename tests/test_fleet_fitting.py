@@ -0,0 +1,69 @@
+import csv
+
+import numpy as np
+
+from bbo_pv.benchmark_functions import diode_current
+from bbo_pv.fleet_fitting import iter_curves, run_fleet
+
+PARAMS = np.array([0.76, 3e-7, 0.036, 50.0, 1.48])
+SETTINGS = dict(pop_size=10, max_iter=5, seed=7, max_workers=2, chunk_size=2)
+
+
+def write_curves(path, n_curves=5):
+    V = np.linspace(-0.2, 0.55, 12)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["curve_id", "V", "I", "T"])
+        for k in range(n_curves):
+            x = PARAMS * (1 + 0.02 * k)
+            for v, i in zip(V, diode_current(x, V)):
+                writer.writerow([f"m{k}", v, i, 300.0 + k])
+
+
+def read_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def test_csv_and_npz_readers_agree(tmp_path):
+    csv_path = tmp_path / "curves.csv"
+    write_curves(csv_path, 3)
+    curves = list(iter_curves(str(csv_path)))
+
+    npz_path = tmp_path / "curves.npz"
+    arrays = {}
+    for curve_id, V, I, T in curves:
+        arrays.update({f"V_{curve_id}": V, f"I_{curve_id}": I, f"T_{curve_id}": T})
+    np.savez(npz_path, **arrays)
+
+    for (id_a, V_a, I_a, T_a), (id_b, V_b, I_b, T_b) in zip(curves, iter_curves(str(npz_path))):
+        assert id_a == id_b and T_a == T_b
+        np.testing.assert_array_equal(V_a, V_b)
+        np.testing.assert_array_equal(I_a, I_b)
+    assert [c[0] for c in curves] == ["m0", "m1", "m2"] and curves[2][3] == 302.0
+
+
+def test_resume_skips_finished_curves(tmp_path):
+    input_path = str(tmp_path / "curves.csv")
+    write_curves(input_path)
+
+    full_path = str(tmp_path / "full.csv")
+    assert run_fleet(input_path, full_path, **SETTINGS) == 5
+    full = {row["curve_id"]: row for row in read_rows(full_path)}
+
+    # Yarıda kesilmiş çalışma: sadece iki eğrinin sonucu yazılmış
+    partial_path = tmp_path / "partial.csv"
+    lines = open(full_path).read().splitlines(keepends=True)
+    partial_path.write_text("".join(lines[:3]))
+    done = {row["curve_id"] for row in read_rows(partial_path)}
+
+    fitted = []
+    assert run_fleet(input_path, str(partial_path), progress=lambda row: fitted.append(row["curve_id"]),
+                     **SETTINGS) == 3
+    assert not done & set(fitted)
+
+    rows = read_rows(partial_path)
+    assert sorted(row["curve_id"] for row in rows) == sorted(full)
+    # Eğri tohumu dosyadaki sırasından gelir: devam eden çalışma aynı sonuçları verir
+    for row in rows:
+        assert row == full[row["curve_id"]]
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.config import DEFAULT_BOUNDS
+from bbo_pv.initializers import METHODS, Initializer, make_initializer
+
+LB, UB = np.array(DEFAULT_BOUNDS, dtype=float).T
+
+
+@pytest.mark.parametrize("log_scale", [None, "auto"])
+@pytest.mark.parametrize("method", METHODS)
+def test_samples_are_in_bounds_and_deterministic(method, log_scale):
+    init = Initializer(method, log_scale=log_scale)
+    X = init.sample(64, LB, UB, np.random.default_rng(0))
+
+    assert X.shape == (64, 5)
+    assert np.all((X >= LB) & (X <= UB))
+    np.testing.assert_array_equal(X, init.sample(64, LB, UB, np.random.default_rng(0)))
+    assert not np.array_equal(X, init.sample(64, LB, UB, np.random.default_rng(1)))
+
+
+@pytest.mark.parametrize("method", ["sobol", "lhs"])
+def test_one_point_per_stratum(method):
+    n = 16
+    U = Initializer(method).sample(n, np.zeros(5), np.ones(5), np.random.default_rng(2))
+    for column in U.T:
+        np.testing.assert_array_equal(np.sort(np.floor(column * n)), np.arange(n))
+
+
+def test_log_scale_covers_decades():
+    init = Initializer("uniform", log_scale="auto")
+    mask = init._log_mask(LB, UB)
+    assert mask.tolist() == [False, True, False, False, False]
+
+    I_sd = init.sample(4000, LB, UB, np.random.default_rng(3))[:, 1]
+    # Log uzayında düzgün: medyan geometrik ortalamaya yakın (doğrusal örneklemede ~5.5e-7 olurdu)
+    assert np.median(I_sd) == pytest.approx(np.sqrt(LB[1] * UB[1]), rel=0.1)
+    with pytest.raises(ValueError):
+        Initializer("uniform", log_scale=[0]).sample(4, np.array([-1.0]), np.array([1.0]),
+                                                     np.random.default_rng(0))
+
+
+def test_opposite_points():
+    rng = np.random.default_rng(4)
+    plain, logged = Initializer(), Initializer(log_scale="auto")
+    X = plain.sample(20, LB, UB, rng)
+
+    np.testing.assert_allclose(plain.opposite(X, LB, UB), LB + UB - X)
+    np.testing.assert_allclose(logged.opposite(X, LB, UB)[:, 1], LB[1] * UB[1] / X[:, 1])
+    for init in (plain, logged):
+        O = init.opposite(X, LB, UB)
+        assert np.all((O >= LB) & (O <= UB))
+        np.testing.assert_allclose(init.opposite(O, LB, UB), X)
+
+
+def test_obl_keeps_the_better_half():
+    bounds = [(-5.0, 5.0)] * 3
+    optimizer = BBO(sphere, bounds, 10, 5, seed=5, init="obl")
+    optimizer.initialize()
+    assert optimizer.nfe == 20
+
+    rng = np.random.default_rng(5)
+    init = make_initializer("obl")
+    X = init.sample(10, optimizer.lb, optimizer.ub, rng)
+    candidates = np.vstack((X, init.opposite(X, optimizer.lb, optimizer.ub)))
+    np.testing.assert_allclose(np.sort(optimizer.fitness), np.sort(sphere(candidates))[:10])
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        make_initializer("grid")
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from bbo_pv.benchmark_functions import SingleDiodeMultiFidelity
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.config import DEFAULT_BOUNDS
+from bbo_pv.island_bbo import IslandBBO, migration_sources
+
+
+def test_migration_sources():
+    assert migration_sources(0, 4, "ring") == [3]
+    assert migration_sources(2, 4, "full") == [0, 1, 3]
+    assert migration_sources(0, 1, "full") == []
+    with pytest.raises(ValueError):
+        IslandBBO(sphere, [(-5, 5)] * 2, topology="star")
+
+
+def test_migrants_replace_worst_beavers():
+    # Tek göç turu son nesilde: her ada diğerinin en iyi kunduzlarını (daha iyiyse) almış olmalı
+    islands = IslandBBO(sphere, [(-5, 5)] * 3, n_islands=2, pop_size=8, max_iter=5,
+                        migration_interval=5, n_migrants=2, topology="full", seed=3)
+    islands.optimize()
+
+    for i in range(2):
+        np.testing.assert_array_equal(islands.fitness[i], sphere(islands.populations[i]))
+        other = np.argmin(islands.fitness[1 - i])
+        assert np.any(np.all(islands.populations[i] == islands.populations[1 - i][other], axis=1))
+    assert islands.best_fitness == islands.fitness.min()
+
+
+def test_migration_keeps_low_fidelity_estimates():
+    objective = SingleDiodeMultiFidelity()
+    islands = IslandBBO(objective, DEFAULT_BOUNDS, n_islands=2, pop_size=8, max_iter=6,
+                        migration_interval=3, n_migrants=3, topology="ring", seed=5)
+    islands.optimize()
+
+    # Göçmenlerin düşük sadakatli tahmini de taşınır: her kunduzun tahmini kendi konumuna aittir
+    for i in range(2):
+        np.testing.assert_allclose(islands.fitness_low[i], objective.low(islands.populations[i]))
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+from bbo_pv import kernels
+from bbo_pv.benchmark_functions import solar_pv_cost_batch
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.bbo import BBO
+from bbo_pv.config import DEFAULT_BOUNDS
+from bbo_pv.gwo import GWO
+
+pytestmark = pytest.mark.skipif(not kernels.USE_NUMBA, reason="numba is not installed")
+
+
+def test_cost_kernel_matches_numpy(monkeypatch):
+    bounds = np.array(DEFAULT_BOUNDS)
+    X = np.random.default_rng(0).uniform(bounds[:, 0], bounds[:, 1], (200, 5))
+    X[0, 3] = 0.0  # R_sh = 0: ceza kuralına takılan aday da çekirdekten geçer
+    compiled = solar_pv_cost_batch(X)
+    monkeypatch.setattr(kernels, "USE_NUMBA", False)
+    np.testing.assert_allclose(solar_pv_cost_batch(X), compiled, rtol=1e-12)
+
+
+@pytest.mark.parametrize("algorithm", [BBO, GWO])
+def test_operator_kernels_match_numpy(monkeypatch, algorithm):
+    bounds = [(-5.0, 5.0)] * 6
+    compiled = algorithm(sphere, bounds, 20, 30, seed=4).optimize()
+    monkeypatch.setattr(kernels, "USE_NUMBA", False)
+    plain = algorithm(sphere, bounds, 20, 30, seed=4).optimize()
+    np.testing.assert_allclose(plain[2], compiled[2], rtol=1e-9)
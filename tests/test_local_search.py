@@ -0,0 +1,74 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_functions import I_exp, SingleDiodeCost, V_exp, solar_pv_cost_batch
+from bbo_pv.config import COMMAND_DEFAULTS
+from bbo_pv.local_search import (MemeticRefiner, _model_data, levenberg_marquardt, refine_population,
+                                 residual_jacobian)
+from bbo_pv.termination import StoppingCriteria, TARGET
+
+REFERENCE = np.array([0.7608, 3.23e-7, 0.0364, 53.72, 1.4812])
+BOUNDS = COMMAND_DEFAULTS["run"]["bounds"]
+# run komutunun sınırlarında bilinen en iyi RMSE ~0.010454
+BEST_RMSE = 0.010455
+
+
+def test_jacobian_matches_finite_differences():
+    _, J = residual_jacobian(REFERENCE)
+    numeric = np.empty_like(J)
+    for j in range(5):
+        h = 1e-4 * REFERENCE[j]
+        up, down = REFERENCE.copy(), REFERENCE.copy()
+        up[j] += h
+        down[j] -= h
+        numeric[:, j] = (residual_jacobian(up)[0] - residual_jacobian(down)[0]) / (2 * h)
+    np.testing.assert_allclose(J, numeric, rtol=1e-4, atol=1e-8)
+
+
+def test_levenberg_marquardt_converges_within_bounds():
+    x0 = np.array([0.75, 5e-7, 0.03, 30.0, 1.55])
+    x, rmse, nfe = levenberg_marquardt(x0, bounds=BOUNDS, max_nfe=200)
+
+    lb, ub = np.array(BOUNDS).T
+    assert np.all((x >= lb) & (x <= ub))
+    assert rmse < BEST_RMSE and nfe <= 200
+    assert rmse == pytest.approx(solar_pv_cost_batch(x[None, :], solver="lambertw")[0], rel=1e-9)
+
+
+def test_model_data_follows_the_objective():
+    other = I_exp * 0.9
+    assert _model_data(solar_pv_cost_batch)[1] is I_exp
+    assert _model_data(partial(solar_pv_cost_batch, solver="lambertw", I=other))[1] is other
+    assert _model_data(SingleDiodeCost(V_exp, other))[1] is not I_exp
+    with pytest.raises(ValueError):
+        _model_data(lambda X: np.sum(X, axis=1))
+
+
+def test_refiner_cadence_and_target_stop():
+    calls = []
+
+    class Recorder(MemeticRefiner):
+        def __call__(self, optimizer, info):
+            calls.append((info["iteration"], optimizer.nfe))
+            super().__call__(optimizer, info)
+
+    # Hedef sadece LM ile ulaşılabilir: durma aynı nesilde olmalı
+    optimizer = BBO(solar_pv_cost_batch, BOUNDS, 20, 50, seed=1,
+                    stopping=StoppingCriteria(target_fitness=BEST_RMSE), callbacks=[Recorder(every=5, max_nfe=100)])
+    optimizer.optimize()
+
+    assert optimizer.stop_reason == TARGET
+    assert optimizer.iterations == 5
+    assert [it for it, _ in calls] == [1, 2, 3, 4, 5]
+
+
+def test_refine_population_only_writes_improvements():
+    optimizer = BBO(solar_pv_cost_batch, BOUNDS, 10, 3, seed=2)
+    optimizer.optimize()
+    before = optimizer.fitness.copy()
+    refine_population(optimizer, top_k=3)
+    assert np.all(optimizer.fitness <= before)
+    assert optimizer.best_fitness == optimizer.fitness.min()
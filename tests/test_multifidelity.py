@@ -0,0 +1,52 @@
+import numpy as np
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_functions import SingleDiodeMultiFidelity
+from bbo_pv.config import DEFAULT_BOUNDS
+from bbo_pv.termination import MAX_NFE, StoppingCriteria
+
+POP_SIZE, MAX_ITER = 20, 30
+
+
+def run_bbo(objective, **kwargs):
+    optimizer = BBO(objective, DEFAULT_BOUNDS, POP_SIZE, MAX_ITER, seed=0, **kwargs)
+    optimizer.optimize()
+    return optimizer
+
+
+def test_low_fidelity_uses_a_subset():
+    objective = SingleDiodeMultiFidelity(stride=3)
+    assert len(objective.V_low) < len(objective.V) and objective.V_low[-1] == objective.V[-1]
+
+    X = np.random.default_rng(0).uniform(*np.array(DEFAULT_BOUNDS).T, (50, 5))
+    high, low = objective(X), objective.low(X)
+    assert not np.array_equal(high, low)
+    assert np.corrcoef(high, low)[0, 1] > 0.9
+
+
+def test_screening_saves_full_evaluations():
+    optimizer = run_bbo(SingleDiodeMultiFidelity())
+    assert optimizer.multifidelity
+    assert optimizer.nfe_low == POP_SIZE * (MAX_ITER + 1)
+    assert POP_SIZE < optimizer.nfe < POP_SIZE * (MAX_ITER + 1)
+
+    # Eleme kapalıyken (sınırsız pay) tüm çocuklar tam sadakatle değerlendirilir
+    unscreened = run_bbo(SingleDiodeMultiFidelity(), fidelity_margin=np.inf)
+    assert unscreened.nfe == POP_SIZE * (MAX_ITER + 1)
+
+
+def test_reported_fitness_is_full_fidelity():
+    objective = SingleDiodeMultiFidelity()
+    optimizer = run_bbo(objective)
+
+    np.testing.assert_array_equal(optimizer.fitness, objective(optimizer.population))
+    np.testing.assert_array_equal(optimizer.fitness_low, objective.low(optimizer.population))
+    assert optimizer.best_fitness == objective(optimizer.best_solution[None, :])[0]
+    assert optimizer.best_fitness == optimizer.fitness.min() == optimizer.convergence_curve[-1]
+    assert np.all(np.diff(optimizer.convergence_curve) <= 0)
+
+
+def test_budget_counts_full_fidelity_only():
+    optimizer = run_bbo(SingleDiodeMultiFidelity(), stopping=StoppingCriteria(max_nfe=200))
+    assert optimizer.stop_reason == MAX_NFE
+    assert optimizer.nfe <= 200 < optimizer.nfe + optimizer.nfe_low
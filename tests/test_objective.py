@@ -0,0 +1,77 @@
+from functools import partial
+
+import numpy as np
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_functions import SingleDiodeMultiFidelity, solar_pv_cost_batch
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.objective import CachedObjective, is_multifidelity, is_vectorized, objective_key
+
+
+def counting(func, vectorized):
+    calls = []
+
+    def wrapped(X):
+        calls.append(np.atleast_2d(X).shape[0])
+        return func(X)
+
+    wrapped.vectorized = vectorized
+    return wrapped, calls
+
+
+def test_batch_cache_hits_and_misses():
+    func, calls = counting(lambda X: np.sum(X**2, axis=1), vectorized=True)
+    cached = CachedObjective(func)
+    X = np.array([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]])
+
+    np.testing.assert_array_equal(cached(X), [5.0, 25.0, 5.0])
+    assert calls == [2]  # Aynı nesil içindeki kopya tek sefer hesaplanır
+    assert (cached.hits, cached.misses) == (1, 2)
+
+    np.testing.assert_array_equal(cached(X[:2]), [5.0, 25.0])
+    assert calls == [2]
+    assert cached.cache_info()["hit_rate"] == 3 / 5
+
+
+def test_lru_eviction_and_quantum():
+    func, calls = counting(lambda x: float(np.sum(x)), vectorized=False)
+    cached = CachedObjective(func, maxsize=2)
+    for x in ([1.0], [2.0], [1.0], [3.0], [2.0]):
+        cached(np.array(x))
+    # [1] yeniden kullanıldığı için [3] eklenince en eski [2] silinir
+    assert (cached.hits, cached.misses, len(calls)) == (1, 4, 4)
+
+    coarse = CachedObjective(func, quantum=0.1)
+    assert coarse(np.array([1.0])) == coarse(np.array([1.01]))
+    assert coarse.hits == 1
+
+
+def test_protocol_is_forwarded():
+    assert is_vectorized(CachedObjective(solar_pv_cost_batch))
+    assert not is_vectorized(CachedObjective(solar_pv_cost_batch, vectorized=False))
+    assert not is_multifidelity(CachedObjective(solar_pv_cost_batch))
+
+    multi = SingleDiodeMultiFidelity()
+    cached = CachedObjective(multi)
+    assert is_multifidelity(cached)
+    X = np.array([[0.76, 3e-7, 0.036, 50.0, 1.48]])
+    np.testing.assert_array_equal(cached.low(X), multi.low(X))
+
+
+def test_objective_key_matches_wrapped_function():
+    objective = partial(solar_pv_cost_batch, solver="lambertw")
+    cached = CachedObjective(objective)
+    key = objective_key(cached)
+    cached(np.array([[0.76, 3e-7, 0.036, 50.0, 1.48]]))
+    assert objective_key(cached) == key == objective_key(objective)
+    assert objective_key(CachedObjective(objective, quantum=1e-9)) != key
+
+
+def test_cached_optimizer_matches_uncached():
+    plain = BBO(sphere, [(-5, 5)] * 3, 10, 20, seed=4)
+    cached = BBO(CachedObjective(sphere), [(-5, 5)] * 3, 10, 20, seed=4)
+    best_plain = plain.optimize()
+    best_cached = cached.optimize()
+    np.testing.assert_array_equal(best_plain[0], best_cached[0])
+    assert best_plain[1] == best_cached[1]
+    assert cached.func.hits > 0
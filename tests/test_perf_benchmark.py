@@ -0,0 +1,26 @@
+from bbo_pv.perf_benchmark import backend_baseline, compare, metric
+
+
+def run(**values):
+    return {"results": {key: metric(*value) for key, value in values.items()}}
+
+
+def test_speed_and_quality_tolerances():
+    baseline = run(speed=(100.0, "evals/s", True), gen=(1.0, "s/gen", False),
+                   nfe=(1000.0, "evals", False, "quality"))
+    # Hız metriklerinde 2x'e kadar gürültü kabul edilir, kalite metriklerinde %10
+    current = run(speed=(60.0, "evals/s", True), gen=(1.9, "s/gen", False),
+                  nfe=(1200.0, "evals", False, "quality"))
+    assert [r[0] for r in compare(current, baseline)] == ["nfe"]
+
+    current = run(speed=(40.0, "evals/s", True), gen=(1.0, "s/gen", False),
+                  nfe=(1050.0, "evals", False, "quality"))
+    assert [r[0] for r in compare(current, baseline)] == ["speed"]
+
+
+def test_baseline_is_keyed_by_backend():
+    numba = run(speed=(100.0, "evals/s", True))
+    baseline = {"backends": {"numba": numba}}
+    assert backend_baseline(baseline, "numba") is numba
+    assert backend_baseline(baseline, "numpy") is None
+    assert backend_baseline({}, "numba") is None
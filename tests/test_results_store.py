@@ -0,0 +1,62 @@
+from functools import partial
+
+import numpy as np
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_functions import I_exp, SingleDiodeCost, V_exp, solar_pv_cost_batch
+from bbo_pv.config import DEFAULT_BOUNDS
+from bbo_pv.objective import objective_key
+from bbo_pv.results_store import ResultsStore, config_hash
+from bbo_pv.run_scheduler import StoredRunResult, campaign_config, run_campaign
+
+
+def _campaign(objective, store, num_runs=2, algorithms=None):
+    return run_campaign(algorithms or {"BBO": BBO}, objective, DEFAULT_BOUNDS, 10, 5, num_runs, seed=1,
+                        max_workers=1, store=store)
+
+
+def test_objective_key_separates_partials_and_cost_objects():
+    newton = partial(solar_pv_cost_batch, solver="newton")
+    lambertw = partial(solar_pv_cost_batch, solver="lambertw")
+    other_curve = partial(solar_pv_cost_batch, solver="newton", I=I_exp * 0.9)
+
+    keys = [objective_key(f) for f in (newton, lambertw, other_curve)]
+    assert len({str(k) for k in keys}) == 3
+    assert objective_key(SingleDiodeCost(V_exp, I_exp)) != objective_key(SingleDiodeCost(V_exp, I_exp * 0.9))
+    assert objective_key(SingleDiodeCost(V_exp, I_exp)) == objective_key(SingleDiodeCost(V_exp, I_exp.copy()))
+
+    hashes = {config_hash(campaign_config(f, DEFAULT_BOUNDS, 10, 5)) for f in (newton, lambertw, other_curve)}
+    assert len(hashes) == 3
+
+
+def test_store_reuses_runs_without_loading_arrays(tmp_path):
+    store = ResultsStore(tmp_path)
+    first = _campaign(solar_pv_cost_batch, store)
+
+    reused = _campaign(solar_pv_cost_batch, ResultsStore(tmp_path))
+    for a, b in zip(first["BBO"], reused["BBO"]):
+        assert isinstance(b, StoredRunResult)
+        assert b.best_fitness == a.best_fitness
+        assert b._arrays is None  # istatistik için diziler yüklenmez
+        np.testing.assert_array_equal(b.convergence_curve, a.convergence_curve)
+
+
+def test_store_does_not_mix_objectives(tmp_path):
+    store = ResultsStore(tmp_path)
+    newton = _campaign(partial(solar_pv_cost_batch, solver="newton"), store)
+    shifted = _campaign(partial(solar_pv_cost_batch, solver="lambertw", I=I_exp * 0.9), store)
+
+    for a, b in zip(newton["BBO"], shifted["BBO"]):
+        assert not isinstance(b, StoredRunResult)
+        assert b.best_fitness != a.best_fitness
+    assert len(store.runs("BBO")) == 4
+
+
+def test_single_run_campaign_reuses_stats_runs(tmp_path):
+    # compare/plot tek koşuluk kampanyayla stats'ın 0. koşusunu okur
+    store = ResultsStore(tmp_path)
+    stats = _campaign(solar_pv_cost_batch, store, num_runs=3, algorithms={"BBO": BBO, "PSO": BBO})
+    single = _campaign(solar_pv_cost_batch, store, num_runs=1, algorithms={"PSO": BBO})
+
+    assert isinstance(single["PSO"][0], StoredRunResult)
+    assert single["PSO"][0].best_fitness == stats["PSO"][0].best_fitness
@@ -0,0 +1,21 @@
+import numpy as np
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.pso import PSO
+from bbo_pv.run_scheduler import run_campaign
+
+BOUNDS = [(-5.0, 5.0)] * 3
+
+
+def test_results_do_not_depend_on_worker_count():
+    algorithms = {"BBO": BBO, "PSO": PSO}
+    serial = run_campaign(algorithms, sphere, BOUNDS, 10, 15, 3, seed=7, max_workers=1)
+    parallel = run_campaign(algorithms, sphere, BOUNDS, 10, 15, 3, seed=7, max_workers=2)
+
+    for name in algorithms:
+        for a, b in zip(serial[name], parallel[name]):
+            assert a.run == b.run
+            assert a.best_fitness == b.best_fitness
+            np.testing.assert_array_equal(a.best_solution, b.best_solution)
+            np.testing.assert_array_equal(a.convergence_curve, b.convergence_curve)
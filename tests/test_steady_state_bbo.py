@@ -0,0 +1,73 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from bbo_pv.benchmark_functions import SingleDiodeMultiFidelity
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.config import DEFAULT_BOUNDS
+from bbo_pv.steady_state_bbo import SteadyStateBBO
+from bbo_pv.surrogate import KNNSurrogate
+
+BOUNDS = [(-5.0, 5.0)] * 3
+
+
+def _stop_at(iteration, seen):
+    def callback(optimizer, info):
+        seen.append(info["iteration"])
+        return info["iteration"] == iteration
+    return callback
+
+
+def test_stop_is_final_with_results_in_flight():
+    # n_workers > pop_size: durma anında bir nesilden fazla sonuç uçuşta
+    seen = []
+    optimizer = SteadyStateBBO(sphere, BOUNDS, 10, 20, seed=1, n_workers=30, callbacks=[_stop_at(3, seen)])
+    optimizer.optimize()
+
+    assert seen == [1, 2, 3]
+    assert optimizer.stop_reason == "callback"
+    assert optimizer.iterations == 3
+    assert len(optimizer.convergence_curve) == 3
+    assert optimizer.nfe >= 10 + 3 * 10
+
+
+def test_async_stop_is_final():
+    async def objective(x):
+        await asyncio.sleep(0)
+        return float(np.sum(x ** 2))
+
+    seen = []
+    optimizer = SteadyStateBBO(objective, BOUNDS, 10, 20, seed=1, n_workers=30, callbacks=[_stop_at(2, seen)])
+    asyncio.run(optimizer.optimize_async())
+
+    assert seen == [1, 2]
+    assert optimizer.stop_reason == "callback"
+    assert len(optimizer.convergence_curve) == 2
+
+
+def test_budget_and_eval_time():
+    times = []
+    optimizer = SteadyStateBBO(sphere, BOUNDS, 10, 5, seed=1, n_workers=2,
+                               callbacks=[lambda opt, info: times.append(info["eval_time"])])
+    optimizer.optimize()
+
+    assert optimizer.nfe == 10 + 5 * 10
+    assert len(times) == 5 and all(t > 0 for t in times)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"checkpoint_path": "run.npz"},
+    {"surrogate": KNNSurrogate()},
+    {"init": "obl"},
+])
+def test_unsupported_options_raise(kwargs):
+    with pytest.raises(ValueError):
+        SteadyStateBBO(sphere, BOUNDS, 10, 5, **kwargs)
+
+
+def test_multifidelity_and_resume_raise():
+    with pytest.raises(ValueError):
+        SteadyStateBBO(SingleDiodeMultiFidelity(), DEFAULT_BOUNDS, 10, 5)
+    with pytest.raises(ValueError):
+        SteadyStateBBO(sphere, BOUNDS, 10, 5).optimize(resume=True)
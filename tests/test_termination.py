@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from bbo_pv.bbo import BBO
+from bbo_pv.benchmark_suite import sphere
+from bbo_pv.gwo import GWO
+from bbo_pv.objective import batch_objective
+from bbo_pv.pso import PSO
+from bbo_pv.termination import (DIVERSITY, MAX_ITER, MAX_NFE, STALL, TARGET, StoppingCriteria,
+                                population_diversity)
+
+BOUNDS = [(-5.0, 5.0)] * 3
+ALGORITHMS = [BBO, PSO, GWO]
+
+
+@batch_objective
+def flat(X):
+    return np.ones(len(X))
+
+
+@pytest.mark.parametrize("AlgoClass", ALGORITHMS)
+def test_max_nfe_budget_is_never_exceeded(AlgoClass):
+    optimizer = AlgoClass(sphere, BOUNDS, 10, 100, seed=0, stopping=StoppingCriteria(max_nfe=95))
+    optimizer.optimize()
+    assert optimizer.stop_reason == MAX_NFE
+    assert optimizer.nfe <= 95
+    assert len(optimizer.convergence_curve) == optimizer.iterations
+
+
+@pytest.mark.parametrize("AlgoClass", ALGORITHMS)
+def test_target_fitness_stops_early(AlgoClass):
+    optimizer = AlgoClass(sphere, BOUNDS, 20, 500, seed=0, stopping=StoppingCriteria(target_fitness=1e-2))
+    _, best_fitness, _ = optimizer.optimize()
+    assert optimizer.stop_reason == TARGET
+    assert best_fitness <= 1e-2 and optimizer.iterations < 500
+
+
+@pytest.mark.parametrize("AlgoClass", ALGORITHMS)
+def test_stall_detection(AlgoClass):
+    # Sabit fonksiyonda ilk nesilden sonra hiç iyileşme olmaz
+    optimizer = AlgoClass(flat, BOUNDS, 10, 100, seed=2, stopping=StoppingCriteria(stall_generations=5))
+    optimizer.optimize()
+    assert optimizer.stop_reason == STALL
+    assert optimizer.iterations == 6
+
+
+def test_max_iter_is_the_default_reason():
+    optimizer = BBO(sphere, BOUNDS, 10, 7, seed=3)
+    optimizer.optimize()
+    assert (optimizer.stop_reason, optimizer.iterations, optimizer.nfe) == (MAX_ITER, 7, 80)
+
+
+def test_diversity_collapse():
+    lb, ub = np.full(3, -5.0), np.full(3, 5.0)
+    collapsed = np.zeros((10, 3))
+    spread = np.random.default_rng(0).uniform(lb, ub, (10, 3))
+    assert population_diversity(collapsed, lb, ub) == 0.0
+    assert population_diversity(spread, lb, ub) > 0.2
+
+    criteria = StoppingCriteria(diversity_tol=1e-3)
+    criteria.reset(lb, ub)
+    assert criteria.check(1.0, spread, nfe=10) is None
+    assert criteria.check(1.0, collapsed, nfe=10) == DIVERSITY